@@ -0,0 +1,25 @@
+"""add kid_absences (date, kid_id) index
+
+Revision ID: 768c55f4c218
+Revises: c35fd44263ce
+Create Date: 2026-10-16 13:05:52.804615
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '768c55f4c218'
+down_revision = 'c35fd44263ce'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Daycare/group absence range queries scan by date, then join kids
+    op.create_index('ix_kid_absences_date_kid_id', 'kid_absences', ['date', 'kid_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_kid_absences_date_kid_id', table_name='kid_absences')
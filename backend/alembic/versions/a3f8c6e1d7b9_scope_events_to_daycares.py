@@ -0,0 +1,41 @@
+"""scope events to daycares
+
+Revision ID: a3f8c6e1d7b9
+Revises: e7b3f1a9c2d4
+Create Date: 2026-10-16 23:41:17.582604
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a3f8c6e1d7b9'
+down_revision = 'e7b3f1a9c2d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('daycare_id', sa.UUID(as_uuid=False), nullable=True))
+    # Events predating tenancy were shared by everyone; hand them to the oldest daycare
+    op.execute(
+        'UPDATE events SET daycare_id = '
+        '(SELECT id FROM daycares ORDER BY created_at, id LIMIT 1) '
+        'WHERE daycare_id IS NULL'
+    )
+    # Without any daycare there is no tenant to own them
+    op.execute('DELETE FROM events WHERE daycare_id IS NULL')
+    op.alter_column('events', 'daycare_id', nullable=False)
+    op.create_foreign_key('fk_events_daycare_id', 'events', 'daycares', ['daycare_id'], ['id'], ondelete='CASCADE')
+
+    # Listings and calendar ranges only ever read one daycare's events
+    op.create_index('ix_events_daycare_id_date_id', 'events', ['daycare_id', 'date', 'id'], unique=False)
+    op.drop_index('ix_events_date_id', table_name='events')
+
+
+def downgrade() -> None:
+    op.create_index('ix_events_date_id', 'events', ['date', 'id'], unique=False)
+    op.drop_index('ix_events_daycare_id_date_id', table_name='events')
+    op.drop_constraint('fk_events_daycare_id', 'events', type_='foreignkey')
+    op.drop_column('events', 'daycare_id')
@@ -0,0 +1,26 @@
+"""add password_hash to educators and parents
+
+Revision ID: a7c41d2e6f90
+Revises: 5b0f3e8a9c21
+Create Date: 2026-10-16 15:48:26.104937
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7c41d2e6f90'
+down_revision = '5b0f3e8a9c21'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('educators', sa.Column('password_hash', sa.String(length=255), nullable=True))
+    op.add_column('parents', sa.Column('password_hash', sa.String(length=255), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('parents', 'password_hash')
+    op.drop_column('educators', 'password_hash')
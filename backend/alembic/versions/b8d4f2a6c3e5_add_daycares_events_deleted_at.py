@@ -0,0 +1,24 @@
+"""add daycares events_deleted_at
+
+Revision ID: b8d4f2a6c3e5
+Revises: d6e2b9f4a8c1
+Create Date: 2026-10-16 21:14:08.337190
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8d4f2a6c3e5'
+down_revision = 'd6e2b9f4a8c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('daycares', sa.Column('events_deleted_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('daycares', 'events_deleted_at')
@@ -0,0 +1,93 @@
+"""move kids.trusted_adults JSON into a trusted_adults table
+
+Revision ID: b8e2d4f7a1c3
+Revises: f3d9b6c1e284
+Create Date: 2026-10-16 17:05:41.290318
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b8e2d4f7a1c3'
+down_revision = 'f3d9b6c1e284'
+branch_labels = None
+depends_on = None
+
+
+kids = sa.table(
+    'kids',
+    sa.column('id', sa.Integer),
+    sa.column('trusted_adults', sa.JSON),
+)
+trusted_adults = sa.table(
+    'trusted_adults',
+    sa.column('kid_id', sa.Integer),
+    sa.column('position', sa.Integer),
+    sa.column('name', sa.String),
+    sa.column('email', sa.String),
+    sa.column('phone_num', sa.String),
+    sa.column('address', sa.Text),
+)
+
+
+def upgrade() -> None:
+    op.create_table(
+        'trusted_adults',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('kid_id', sa.Integer(), nullable=False),
+        sa.Column('position', sa.Integer(), nullable=False),
+        sa.Column('name', sa.String(length=100), nullable=False),
+        sa.Column('email', sa.String(length=100), nullable=True),
+        sa.Column('phone_num', sa.String(length=20), nullable=True),
+        sa.Column('address', sa.Text(), nullable=True),
+        sa.ForeignKeyConstraint(['kid_id'], ['kids.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_trusted_adults_kid_id_position', 'trusted_adults', ['kid_id', 'position'], unique=False)
+    op.create_index('ix_trusted_adults_phone_num', 'trusted_adults', ['phone_num'], unique=False)
+    op.create_index('ix_trusted_adults_email', 'trusted_adults', ['email'], unique=False)
+
+    # Backfill from the JSON column (older rows used "phone" for the number)
+    bind = op.get_bind()
+    rows = []
+    for kid_id, adults in bind.execute(
+        sa.select(kids.c.id, kids.c.trusted_adults).where(kids.c.trusted_adults.isnot(None))
+    ):
+        for position, adult in enumerate(adults or []):
+            if not adult.get('name'):
+                continue
+            rows.append({
+                'kid_id': kid_id,
+                'position': position,
+                'name': adult['name'][:100],
+                'email': adult.get('email'),
+                'phone_num': adult.get('phone_num') or adult.get('phone'),
+                'address': adult.get('address'),
+            })
+    if rows:
+        op.bulk_insert(trusted_adults, rows)
+
+    op.drop_column('kids', 'trusted_adults')
+
+
+def downgrade() -> None:
+    op.add_column('kids', sa.Column('trusted_adults', sa.JSON(), nullable=True))
+
+    bind = op.get_bind()
+    adults_by_kid = {}
+    for row in bind.execute(sa.select(trusted_adults).order_by(trusted_adults.c.kid_id, trusted_adults.c.position)):
+        adults_by_kid.setdefault(row.kid_id, []).append({
+            'name': row.name,
+            'email': row.email,
+            'phone_num': row.phone_num,
+            'address': row.address,
+        })
+    for kid_id, adults in adults_by_kid.items():
+        bind.execute(kids.update().where(kids.c.id == kid_id).values(trusted_adults=adults))
+
+    op.drop_index('ix_trusted_adults_email', table_name='trusted_adults')
+    op.drop_index('ix_trusted_adults_phone_num', table_name='trusted_adults')
+    op.drop_index('ix_trusted_adults_kid_id_position', table_name='trusted_adults')
+    op.drop_table('trusted_adults')
@@ -0,0 +1,33 @@
+"""add keyset pagination indexes
+
+Revision ID: c35fd44263ce
+Revises: e54e49f0481c
+Create Date: 2026-10-16 10:41:07.552981
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c35fd44263ce'
+down_revision = 'e54e49f0481c'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Composite (scope, sort_key, id) indexes backing cursor pagination
+    op.create_index('ix_kids_daycare_full_name_id', 'kids', ['daycare_id', 'full_name', 'id'])
+    op.create_index('ix_parents_daycare_full_name_id', 'parents', ['daycare_id', 'full_name', 'id'])
+    op.create_index('ix_educators_daycare_full_name_id', 'educators', ['daycare_id', 'full_name', 'id'])
+    op.create_index('ix_groups_daycare_name_id', 'groups', ['daycare_id', 'name', 'id'])
+    op.create_index('ix_events_date_id', 'events', ['date', 'id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_events_date_id', table_name='events')
+    op.drop_index('ix_groups_daycare_name_id', table_name='groups')
+    op.drop_index('ix_educators_daycare_full_name_id', table_name='educators')
+    op.drop_index('ix_parents_daycare_full_name_id', table_name='parents')
+    op.drop_index('ix_kids_daycare_full_name_id', table_name='kids')
@@ -0,0 +1,26 @@
+"""index event_images by (event_id, id)
+
+Revision ID: c4a9e7d2b513
+Revises: b8e2d4f7a1c3
+Create Date: 2026-10-16 18:12:09.847215
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = 'c4a9e7d2b513'
+down_revision = 'b8e2d4f7a1c3'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Serves both the IN select and ROW_NUMBER() per event, ordered by id
+    op.create_index('ix_event_images_event_id_id', 'event_images', ['event_id', 'id'], unique=False)
+    op.drop_index('ix_event_images_event_id', table_name='event_images')
+
+
+def downgrade() -> None:
+    op.create_index('ix_event_images_event_id', 'event_images', ['event_id'], unique=False)
+    op.drop_index('ix_event_images_event_id_id', table_name='event_images')
@@ -0,0 +1,24 @@
+"""add daycares calendar_token_hash
+
+Revision ID: c9e5a3b7d2f1
+Revises: b8d4f2a6c3e5
+Create Date: 2026-10-17 09:42:51.604218
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c9e5a3b7d2f1'
+down_revision = 'b8d4f2a6c3e5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('daycares', sa.Column('calendar_token_hash', sa.String(length=64), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('daycares', 'calendar_token_hash')
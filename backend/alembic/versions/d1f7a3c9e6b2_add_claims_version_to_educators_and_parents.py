@@ -0,0 +1,28 @@
+"""rename groups_version to claims_version and add parents.claims_version
+
+Revision ID: d1f7a3c9e6b2
+Revises: c9e5a3b7d2f1
+Create Date: 2026-10-17 10:26:37.118402
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd1f7a3c9e6b2'
+down_revision = 'c9e5a3b7d2f1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.alter_column('educators', 'groups_version', new_column_name='claims_version')
+    op.alter_column('refresh_tokens', 'groups_version', new_column_name='claims_version')
+    op.add_column('parents', sa.Column('claims_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('parents', 'claims_version')
+    op.alter_column('refresh_tokens', 'claims_version', new_column_name='groups_version')
+    op.alter_column('educators', 'claims_version', new_column_name='groups_version')
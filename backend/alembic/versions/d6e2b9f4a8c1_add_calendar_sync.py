@@ -0,0 +1,57 @@
+"""add external calendar sync state
+
+Revision ID: d6e2b9f4a8c1
+Revises: a3f8c6e1d7b9
+Create Date: 2026-10-17 00:36:52.104733
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd6e2b9f4a8c1'
+down_revision = 'a3f8c6e1d7b9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('external_id', sa.String(length=255), nullable=True))
+    op.add_column('events', sa.Column('external_etag', sa.String(length=255), nullable=True))
+    # Existing events are queued, so the first push publishes them
+    op.add_column('events', sa.Column('sync_pending', sa.Boolean(), server_default=sa.true(), nullable=False))
+    op.alter_column('events', 'sync_pending', server_default='0')
+    op.create_index('uq_events_daycare_id_external_id', 'events', ['daycare_id', 'external_id'], unique=True)
+    op.create_index('ix_events_daycare_id_sync_pending', 'events', ['daycare_id', 'sync_pending'], unique=False)
+
+    op.create_table(
+        'calendar_sync_states',
+        sa.Column('daycare_id', sa.UUID(as_uuid=False), nullable=False),
+        sa.Column('calendar_id', sa.String(length=255), nullable=False),
+        sa.Column('sync_token', sa.Text(), nullable=True),
+        sa.Column('last_synced_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['daycare_id'], ['daycares.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('daycare_id'),
+    )
+    op.create_table(
+        'calendar_tombstones',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('daycare_id', sa.UUID(as_uuid=False), nullable=False),
+        sa.Column('external_id', sa.String(length=255), nullable=False),
+        sa.Column('created_at', sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(['daycare_id'], ['daycares.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_calendar_tombstones_daycare_id', 'calendar_tombstones', ['daycare_id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_calendar_tombstones_daycare_id', table_name='calendar_tombstones')
+    op.drop_table('calendar_tombstones')
+    op.drop_table('calendar_sync_states')
+    op.drop_index('ix_events_daycare_id_sync_pending', table_name='events')
+    op.drop_index('uq_events_daycare_id_external_id', table_name='events')
+    op.drop_column('events', 'sync_pending')
+    op.drop_column('events', 'external_etag')
+    op.drop_column('events', 'external_id')
@@ -0,0 +1,42 @@
+"""add kid_attendance_ledger table
+
+Revision ID: e54e49f0481c
+Revises: c2d8ca2d669f
+Create Date: 2026-10-16 09:12:44.318207
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'e54e49f0481c'
+down_revision = 'c2d8ca2d669f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table('kid_attendance_ledger',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('kid_id', sa.Integer(), nullable=False),
+    sa.Column('daycare_id', sa.UUID(as_uuid=False), nullable=False),
+    sa.Column('date', sa.Date(), nullable=False),
+    # Reuse the existing attendance_status type from the kids table
+    sa.Column('status', postgresql.ENUM('sick', 'out', 'in-care', 'holiday', name='attendance_status', create_type=False), nullable=False),
+    sa.Column('source', sa.Enum('educator', 'absence', 'close_out', name='attendance_source'), nullable=False),
+    sa.Column('recorded_at', sa.DateTime(), nullable=False),
+    sa.ForeignKeyConstraint(['kid_id'], ['kids.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['daycare_id'], ['daycares.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_kid_attendance_ledger_daycare_date', 'kid_attendance_ledger', ['daycare_id', 'date'])
+    op.create_index('ix_kid_attendance_ledger_kid_date', 'kid_attendance_ledger', ['kid_id', 'date'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_kid_attendance_ledger_kid_date', table_name='kid_attendance_ledger')
+    op.drop_index('ix_kid_attendance_ledger_daycare_date', table_name='kid_attendance_ledger')
+    op.drop_table('kid_attendance_ledger')
+    sa.Enum(name='attendance_source').drop(op.get_bind(), checkfirst=True)
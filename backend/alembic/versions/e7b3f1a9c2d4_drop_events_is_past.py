@@ -0,0 +1,26 @@
+"""drop events.is_past, derived from date instead
+
+Revision ID: e7b3f1a9c2d4
+Revises: c4a9e7d2b513
+Create Date: 2026-10-16 19:02:41.305118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7b3f1a9c2d4'
+down_revision = 'c4a9e7d2b513'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Past/upcoming are range scans of ix_events_date_id against now
+    op.drop_column('events', 'is_past')
+
+
+def downgrade() -> None:
+    op.add_column('events', sa.Column('is_past', sa.Boolean(), nullable=True))
+    op.execute('UPDATE events SET is_past = date < CURRENT_TIMESTAMP')
@@ -0,0 +1,24 @@
+"""add kids.pickup_version
+
+Revision ID: f3d9b6c1e284
+Revises: a7c41d2e6f90
+Create Date: 2026-10-16 16:30:04.551820
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3d9b6c1e284'
+down_revision = 'a7c41d2e6f90'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('kids', sa.Column('pickup_version', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column('kids', 'pickup_version')
@@ -1,18 +1,33 @@
-from datetime import timedelta
-from typing import Any, Dict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.database import get_db
-from app.core.deps import get_current_user
+from app.core.deps import get_current_user, get_principal, oauth2_scheme
+from app.core.passwords import password_hasher, verify_and_update
+from app.core.permissions import Permission, Principal
 from app.core.security import create_access_token
 from app.models.educator import Educator
 from app.models.parent import Parent
-from app.schemas.auth import DevLoginRequest, TokenResponse
-from app.utils.daycare_resolver import resolve_daycare_id
+from app.schemas.auth import (
+    DevLoginRequest,
+    LoginRequest,
+    RefreshRequest,
+    TokenResponse,
+)
+from app.services.auth_service import (
+    complete_login,
+    find_login_account,
+    revocation_store,
+    revoke_refresh_token_family,
+    rotate_refresh_token,
+    token_id,
+)
 
 router = APIRouter(prefix="/auth", tags=["auth"])
 
@@ -116,39 +131,57 @@ def dev_login(payload: DevLoginRequest, db: Session = Depends(get_db)):
             status_code=400, detail="Provide exactly one of educator_id or parent_id"
         )
 
-    role = None
-    sub = None
-    daycare_id = None
-    groups = []
-
     if payload.educator_id:
-        edu = db.query(Educator).get(payload.educator_id)
-        if not edu:
+        account = db.query(Educator).get(payload.educator_id)
+        if not account:
             raise HTTPException(status_code=404, detail="Educator not found")
-        role = "educator" if edu.role == "educator" else "super_educator"
-        sub = str(edu.id)
-        daycare_id = resolve_daycare_id(db, str(edu.daycare_id))
-        groups = [g.name for g in edu.groups]
 
     if payload.parent_id:
-        par = db.query(Parent).get(payload.parent_id)
-        if not par:
-            raise HTTPException(status_code=404, detail="Parent not found")
-        role = "parent"
-        sub = str(par.id)
-        daycare_id = resolve_daycare_id(db, str(par.daycare_id))
         # parents don't have groups directly, but you can derive via their kids if you wish; leave empty for now or compute later
-        groups = []
-
-    token = create_access_token(
-        data={"sub": sub, "role": role, "daycare_id": daycare_id, "groups": groups}
-    )
+        account = db.query(Parent).get(payload.parent_id)
+        if not account:
+            raise HTTPException(status_code=404, detail="Parent not found")
 
     # Debug: Print secret key being used
     print(f"Dev-login using secret key: {settings.secret_key}")
     print(f"Dev-login environment: {settings.app_env}")
 
-    return {"access_token": token, "token_type": "bearer"}
+    return complete_login(db, account)
+
+
+@router.post("/login", response_model=TokenResponse)
+async def login(payload: LoginRequest, db: Session = Depends(get_db)):
+    """
+    Log in with email and password.
+
+    Hashing runs on the dedicated password pool, never on the thread pool that
+    serves sync endpoints; database work stays on the thread pool.
+    """
+    account = await run_in_threadpool(
+        find_login_account, db, payload.account_type, payload.email
+    )
+    verified, new_hash = await password_hasher.run(
+        verify_and_update,
+        payload.password,
+        account.password_hash if account else None,
+    )
+    if not verified:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Incorrect email or password",
+        )
+    return await run_in_threadpool(complete_login, db, account, new_hash)
+
+
+@router.post("/refresh", response_model=TokenResponse)
+def refresh(payload: RefreshRequest, db: Session = Depends(get_db)):
+    """Exchange a refresh token for a new access token and a rotated refresh token."""
+    access_token, refresh_token = rotate_refresh_token(db, payload.refresh_token)
+    return {
+        "access_token": access_token,
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+    }
 
 
 @router.get("/me")
@@ -165,21 +198,19 @@ def get_current_user_info(
 
 @router.get("/me/educator")
 def get_current_educator_info(
-    current_user: Dict[str, Any] = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
     db: Session = Depends(get_db),
 ):
     """Get current educator information including groups."""
-    role = current_user.get("role")
-    if role not in ["educator", "super_educator"]:
+    if not principal.can(Permission.VIEW_ROSTER):
         raise HTTPException(
             status_code=403, detail="This endpoint is only available for educators"
         )
 
-    educator_id = current_user.get("sub")  # JWT sub field contains the educator ID
-    if not educator_id:
+    if principal.id is None:
         raise HTTPException(status_code=400, detail="Educator ID not found in token")
 
-    educator = db.query(Educator).filter(Educator.id == educator_id).first()
+    educator = db.query(Educator).filter(Educator.id == principal.id).first()
     if not educator:
         raise HTTPException(status_code=404, detail="Educator not found")
 
@@ -187,9 +218,21 @@ def get_current_educator_info(
 
 
 @router.post("/logout")
-def logout(current_user: Dict[str, Any] = Depends(get_current_user)) -> Dict[str, str]:
+def logout(
+    body: Optional[RefreshRequest] = None,
+    token: str = Depends(oauth2_scheme),
+    current_user: Dict[str, Any] = Depends(get_current_user),
+    db: Session = Depends(get_db),
+) -> Dict[str, str]:
     """
-    Stateless logout endpoint.
-    Clears client-side session only.
+    Revoke the presented access token until it expires, and the refresh
+    token family if its refresh token is sent.
+    Other workers pick the revocation up within a few seconds.
     """
+    if body is not None:
+        revoke_refresh_token_family(db, body.refresh_token)
+    expires_at = datetime.fromtimestamp(current_user["exp"], tz=timezone.utc)
+    revocation_store.revoke(
+        db, token_id(current_user, token), expires_at.replace(tzinfo=None)
+    )
     return {"message": "Logged out successfully"}
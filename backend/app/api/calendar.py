@@ -0,0 +1,90 @@
+from datetime import datetime
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+
+from app.core.database import get_db
+from app.core.deps import get_tenant_scope, require_role
+from app.services.calendar_feed import (
+    feed_token_matches,
+    get_calendar_feed,
+    iter_feed,
+    rotate_feed_token,
+)
+from app.utils.daycare_resolver import resolve_daycare_id
+from app.utils.etag import etag_matches
+
+router = APIRouter()
+
+
+def _not_modified_since(request: Request, last_modified: datetime) -> bool:
+    """If-Modified-Since check, only consulted when no If-None-Match was sent."""
+    if "if-none-match" in request.headers:
+        return False
+    header = request.headers.get("if-modified-since")
+    if not header:
+        return False
+    try:
+        return last_modified <= parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+
+
+@router.get("/calendar/{daycare_id}.ics")
+def get_calendar(
+    daycare_id: str,
+    request: Request,
+    token: Optional[str] = Query(None, description="The daycare's feed secret"),
+    db: Session = Depends(get_db),
+):
+    """
+    Subscribable iCalendar feed of a daycare's events.
+
+    Calendar apps cannot send a bearer token, so the feed URL carries the
+    daycare's feed secret as `?token=`. The secret is checked on every poll,
+    and a wrong or missing one is a 404 like an unknown daycare. Polls are
+    answered from the cached feed, and with a 304 when the client's ETag or
+    Last-Modified is still current.
+    """
+    daycare_id = resolve_daycare_id(db, daycare_id)
+    feed = None
+    if feed_token_matches(db, daycare_id, token):
+        feed = get_calendar_feed(db, daycare_id)
+    if feed is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Daycare not found"
+        )
+
+    headers = {
+        "ETag": feed.etag,
+        "Last-Modified": format_datetime(feed.last_modified, usegmt=True),
+    }
+    if etag_matches(
+        request.headers.get("if-none-match"), feed.etag
+    ) or _not_modified_since(request, feed.last_modified):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return StreamingResponse(
+        iter_feed(feed), media_type="text/calendar; charset=utf-8", headers=headers
+    )
+
+
+@router.post("/calendar/token")
+def rotate_calendar_token(
+    request: Request,
+    daycare_id: str = Depends(get_tenant_scope),
+    current_user: dict = Depends(require_role("super_educator")),
+    db: Session = Depends(get_db),
+):
+    """
+    Issue a new feed secret for the caller's daycare.
+
+    The old feed URL stops working at once, so existing subscriptions must be
+    re-made with the returned one. The secret cannot be read back later.
+    """
+    token = rotate_feed_token(db, daycare_id)
+    url = request.url_for("get_calendar", daycare_id=daycare_id)
+    return {"token": token, "url": str(url.include_query_params(token=token))}
@@ -1,43 +1,33 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.database import get_db
-from app.models.educator import Educator
+from app.core.deps import get_optional_daycare_scope
 from app.schemas.educators import EducatorOut
-from app.utils.daycare_resolver import resolve_daycare_id
+from app.services.read_model import get_educator_rows
+from app.utils.pagination import PageParams, set_next_cursor
 
 router = APIRouter()
 
 
 @router.get("/educators", response_model=List[EducatorOut])
 def list_educators(
-    daycare_id: Optional[str] = Query(
-        None, description="Daycare scope (required in dev/staging if no JWT)"
-    ),
+    response: Response,
+    daycare_id: Optional[str] = Depends(get_optional_daycare_scope),
     group: Optional[str] = Query(None, description="Filter by group name"),
     search: Optional[str] = Query(None, description="Search by name"),
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
 ):
     # In prod, daycare_id should come from JWT; for now allow a query param in non-prod.
     if settings.environment == "production" and not daycare_id:
         raise HTTPException(status_code=400, detail="daycare_id is required")
 
-    # Resolve daycare_id for local development
-    if daycare_id:
-        daycare_id = resolve_daycare_id(db, daycare_id)
-
-    q = db.query(Educator)
-    if daycare_id:
-        q = q.filter(Educator.daycare_id == daycare_id)
-
-    if search:
-        q = q.filter(Educator.full_name.ilike(f"%{search}%"))
-
-    educators = q.all()
-
-    if group:
-        educators = [e for e in educators if any(g.name == group for g in e.groups)]
+    educators, next_cursor = get_educator_rows(
+        db, daycare_id, group, search, page.cursor, page.limit
+    )
+    set_next_cursor(response, next_cursor)
     return educators
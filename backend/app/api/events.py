@@ -1,12 +1,21 @@
 import os
-from typing import List
-
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import datetime, timezone
+from typing import List, Optional
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.core.deps import require_any_role
-from app.models.event import Event, EventImage
+from app.core.deps import get_tenant_scope, require_any_role
+from app.models.event import EventImage
 from app.models.schemas import (
     Event as EventSchema,
 )
@@ -23,6 +32,8 @@ from app.models.schemas import (
 )
 from app.services.event_service import EventService
 from app.services.s3_service import create_presigned_url
+from app.utils.etag import conditional_response
+from app.utils.pagination import PageParams, set_next_cursor
 
 router = APIRouter()
 
@@ -36,45 +47,187 @@ def get_educator_only_events(
 
 
 @router.post("/", response_model=EventSchema, status_code=status.HTTP_201_CREATED)
-def create_event(event: EventCreate, db: Session = Depends(get_db)):
+def create_event(
+    event: EventCreate,
+    daycare_id: str = Depends(get_tenant_scope),
+    db: Session = Depends(get_db),
+):
     """Create a new event"""
-    event_service = EventService(db)
+    event_service = EventService(db, daycare_id)
     return event_service.create_event(event)
 
 
+# Kept for older clients; OFFSET gets slower the deeper it pages, use cursor instead
+SKIP_QUERY = Query(0, ge=0, deprecated=True)
+
+# Event listings have always returned at most 100 events when no limit is sent
+DEFAULT_EVENTS_LIMIT = 100
+
+# Listings can ask for cover thumbnails only instead of every image
+IMAGES_LIMIT_QUERY = Query(
+    None, ge=0, description="Most images to return per event (0 for none)"
+)
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Aware datetimes converted to the naive UTC event dates are stored in"""
+    if value is None or value.tzinfo is None:
+        return value
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+class CalendarRange:
+    """Optional `from`/`to` window of an event listing, e.g. a week or month."""
+
+    def __init__(
+        self,
+        start: Optional[datetime] = Query(
+            None, alias="from", description="Events on or after this date"
+        ),
+        end: Optional[datetime] = Query(
+            None, alias="to", description="Events before this date (exclusive)"
+        ),
+    ):
+        self.start = _as_utc(start)
+        self.end = _as_utc(end)
+        if self.start and self.end and self.start >= self.end:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="'from' must be before 'to'",
+            )
+
+
+def _list_events(
+    event_service: EventService,
+    request: Request,
+    response: Response,
+    page: PageParams,
+    skip: int,
+    calendar: CalendarRange,
+    upcoming_only: bool = False,
+    past_only: bool = False,
+    images_limit: Optional[int] = None,
+):
+    """List events with keyset pagination, or OFFSET when a legacy skip is given"""
+
+    not_modified = conditional_response(
+        request,
+        response,
+        *event_service.get_events_fingerprint(
+            upcoming_only, past_only, calendar.start, calendar.end
+        ),
+    )
+    if not_modified:
+        return not_modified
+
+    limit = DEFAULT_EVENTS_LIMIT if page.limit is None else page.limit
+    if skip:
+        return event_service.get_events(
+            skip=skip,
+            limit=limit,
+            upcoming_only=upcoming_only,
+            past_only=past_only,
+            images_limit=images_limit,
+            start=calendar.start,
+            end=calendar.end,
+        )
+
+    events, next_cursor = event_service.get_events_page(
+        cursor=page.cursor,
+        limit=limit,
+        upcoming_only=upcoming_only,
+        past_only=past_only,
+        images_limit=images_limit,
+        start=calendar.start,
+        end=calendar.end,
+    )
+    set_next_cursor(response, next_cursor)
+    return events
+
+
 @router.get("/", response_model=List[EventWithImages])
 def get_events(
-    skip: int = 0,
-    limit: int = 100,
+    request: Request,
+    response: Response,
     upcoming_only: bool = False,
     past_only: bool = False,
+    skip: int = SKIP_QUERY,
+    images_limit: Optional[int] = IMAGES_LIMIT_QUERY,
+    page: PageParams = Depends(),
+    calendar: CalendarRange = Depends(),
+    daycare_id: str = Depends(get_tenant_scope),
     db: Session = Depends(get_db),
 ):
-    """Get all events with optional filtering"""
-    event_service = EventService(db)
-    return event_service.get_events(
-        skip=skip, limit=limit, upcoming_only=upcoming_only, past_only=past_only
+    """Get all events with optional filtering, e.g. ?from=2026-05-01&to=2026-06-01"""
+    return _list_events(
+        EventService(db, daycare_id),
+        request,
+        response,
+        page,
+        skip,
+        calendar,
+        upcoming_only,
+        past_only,
+        images_limit,
     )
 
 
 @router.get("/upcoming", response_model=List[EventWithImages])
-def get_upcoming_events(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    """Get upcoming events only"""
-    event_service = EventService(db)
-    return event_service.get_events(skip=skip, limit=limit, upcoming_only=True)
+def get_upcoming_events(
+    request: Request,
+    response: Response,
+    skip: int = SKIP_QUERY,
+    images_limit: Optional[int] = IMAGES_LIMIT_QUERY,
+    page: PageParams = Depends(),
+    calendar: CalendarRange = Depends(),
+    daycare_id: str = Depends(get_tenant_scope),
+    db: Session = Depends(get_db),
+):
+    """Get upcoming events only, those whose date is not yet past"""
+    return _list_events(
+        EventService(db, daycare_id),
+        request,
+        response,
+        page,
+        skip,
+        calendar,
+        upcoming_only=True,
+        images_limit=images_limit,
+    )
 
 
 @router.get("/past", response_model=List[EventWithImages])
-def get_past_events(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
+def get_past_events(
+    request: Request,
+    response: Response,
+    skip: int = SKIP_QUERY,
+    images_limit: Optional[int] = IMAGES_LIMIT_QUERY,
+    page: PageParams = Depends(),
+    calendar: CalendarRange = Depends(),
+    daycare_id: str = Depends(get_tenant_scope),
+    db: Session = Depends(get_db),
+):
     """Get past events only"""
-    event_service = EventService(db)
-    return event_service.get_events(skip=skip, limit=limit, past_only=True)
+    return _list_events(
+        EventService(db, daycare_id),
+        request,
+        response,
+        page,
+        skip,
+        calendar,
+        past_only=True,
+        images_limit=images_limit,
+    )
 
 
 @router.get("/{event_id}", response_model=EventWithImages)
-def get_event(event_id: int, db: Session = Depends(get_db)):
+def get_event(
+    event_id: int,
+    daycare_id: str = Depends(get_tenant_scope),
+    db: Session = Depends(get_db),
+):
     """Get a specific event by ID"""
-    event_service = EventService(db)
+    event_service = EventService(db, daycare_id)
     event = event_service.get_event(event_id)
     if not event:
         raise HTTPException(
@@ -84,9 +237,14 @@ def get_event(event_id: int, db: Session = Depends(get_db)):
 
 
 @router.put("/{event_id}", response_model=EventSchema)
-def update_event(event_id: int, event: EventUpdate, db: Session = Depends(get_db)):
+def update_event(
+    event_id: int,
+    event: EventUpdate,
+    daycare_id: str = Depends(get_tenant_scope),
+    db: Session = Depends(get_db),
+):
     """Update an event"""
-    event_service = EventService(db)
+    event_service = EventService(db, daycare_id)
     updated_event = event_service.update_event(event_id, event)
     if not updated_event:
         raise HTTPException(
@@ -96,9 +254,13 @@ def update_event(event_id: int, event: EventUpdate, db: Session = Depends(get_db
 
 
 @router.delete("/{event_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_event(event_id: int, db: Session = Depends(get_db)):
+def delete_event(
+    event_id: int,
+    daycare_id: str = Depends(get_tenant_scope),
+    db: Session = Depends(get_db),
+):
     """Delete an event"""
-    event_service = EventService(db)
+    event_service = EventService(db, daycare_id)
     if not event_service.delete_event(event_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
@@ -107,10 +269,13 @@ def delete_event(event_id: int, db: Session = Depends(get_db)):
 
 @router.post("/{event_id}/images/presigned-url", response_model=PresignedUrlResponse)
 def generate_presigned_upload_url(
-    event_id: int, request: PresignedUrlRequest, db: Session = Depends(get_db)
+    event_id: int,
+    request: PresignedUrlRequest,
+    daycare_id: str = Depends(get_tenant_scope),
+    db: Session = Depends(get_db),
 ):
     """Generate pre-signed URL for uploading image to event"""
-    event_service = EventService(db)
+    event_service = EventService(db, daycare_id)
     try:
         result = event_service.generate_presigned_upload_url(
             event_id=event_id,
@@ -133,10 +298,11 @@ def confirm_image_upload(
     event_id: int,
     s3_key: str,
     image_data: EventImageCreate,
+    daycare_id: str = Depends(get_tenant_scope),
     db: Session = Depends(get_db),
 ):
     """Confirm image upload and create database record"""
-    event_service = EventService(db)
+    event_service = EventService(db, daycare_id)
     try:
         return event_service.confirm_image_upload(event_id, s3_key, image_data)
     except ValueError as e:
@@ -144,9 +310,13 @@ def confirm_image_upload(
 
 
 @router.get("/{event_id}/images", response_model=List[EventImageSchema])
-def get_event_images(event_id: int, db: Session = Depends(get_db)):
+def get_event_images(
+    event_id: int,
+    daycare_id: str = Depends(get_tenant_scope),
+    db: Session = Depends(get_db),
+):
     """Get all images for an event"""
-    event_service = EventService(db)
+    event_service = EventService(db, daycare_id)
     if not event_service.get_event(event_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Event not found"
@@ -155,9 +325,13 @@ def get_event_images(event_id: int, db: Session = Depends(get_db)):
 
 
 @router.delete("/images/{image_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_event_image(image_id: int, db: Session = Depends(get_db)):
+def delete_event_image(
+    image_id: int,
+    daycare_id: str = Depends(get_tenant_scope),
+    db: Session = Depends(get_db),
+):
     """Delete an event image"""
-    event_service = EventService(db)
+    event_service = EventService(db, daycare_id)
     if not event_service.delete_event_image(image_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND, detail="Image not found"
@@ -165,13 +339,18 @@ def delete_event_image(image_id: int, db: Session = Depends(get_db)):
 
 
 @router.post("/{event_id}/images")
-def get_upload_url(event_id: int, filename: str, db: Session = Depends(get_db)):
+def get_upload_url(
+    event_id: int,
+    filename: str,
+    daycare_id: str = Depends(get_tenant_scope),
+    db: Session = Depends(get_db),
+):
     """Get presigned URL for uploading image to event"""
-    event = db.query(Event).filter(Event.id == event_id).first()
+    event = EventService(db, daycare_id).get_event(event_id)
     if not event:
         return {"error": "Event not found"}
 
-    key = f"daycares/demo/events/{event_id}/images/{filename}"
+    key = f"daycares/{daycare_id}/events/{event_id}/images/{filename}"
     image = EventImage(event_id=event_id, file_name=filename, s3_key=key)
     db.add(image)
     db.commit()
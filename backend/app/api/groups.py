@@ -1,24 +1,78 @@
 from typing import List
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Response
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
+from app.core.deps import get_daycare_scope, get_tenant_scope, require_permission
+from app.core.permissions import Permission, Principal
 from app.models.group import Group
-from app.schemas.groups import GroupOut
-from app.utils.daycare_resolver import resolve_daycare_id
+from app.models.kid import AttendanceStatus
+from app.schemas.groups import (
+    GroupAttendanceUpdateOut,
+    GroupAttendanceUpdateRequest,
+    GroupOut,
+)
+from app.services.kid_service import bulk_update_attendance
+from app.services.read_model import get_group_rows
+from app.utils.pagination import PageParams, set_next_cursor
 
 router = APIRouter()
 
 
 @router.get("/groups", response_model=List[GroupOut])
 def list_groups(
-    daycare_id: str = Query(..., description="Daycare scope"),
+    response: Response,
+    daycare_id: str = Depends(get_daycare_scope),
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
 ):
     """List groups for a specific daycare."""
-    # Resolve daycare_id for local development
-    daycare_id = resolve_daycare_id(db, daycare_id)
-
-    groups = db.query(Group).filter(Group.daycare_id == daycare_id).all()
+    groups, next_cursor = get_group_rows(db, daycare_id, page.cursor, page.limit)
+    set_next_cursor(response, next_cursor)
     return groups
+
+
+@router.patch("/groups/{group_id}/attendance", response_model=GroupAttendanceUpdateOut)
+def update_group_attendance(
+    group_id: int,
+    request: GroupAttendanceUpdateRequest,
+    principal: Principal = Depends(
+        require_permission(
+            Permission.TAKE_ATTENDANCE, "Only educators can take attendance"
+        )
+    ),
+    daycare_id: str = Depends(get_tenant_scope),
+    db: Session = Depends(get_db),
+):
+    """Set attendance for several kids of a group in one transaction."""
+    # Validate every status up front so the batch is applied all or nothing
+    updates = {}
+    for item in request.updates:
+        try:
+            updates[item.kid_id] = AttendanceStatus(item.attendance)
+        except ValueError:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid attendance status: {item.attendance}. Must be one of: {[status.value for status in AttendanceStatus]}",
+            )
+
+    # Groups of other daycares do not exist for this caller
+    group_daycare_id = db.scalar(select(Group.daycare_id).where(Group.id == group_id))
+    if group_daycare_id is None or str(group_daycare_id) != daycare_id:
+        raise HTTPException(status_code=404, detail="Group not found")
+
+    updated = bulk_update_attendance(db, group_id, updates)
+
+    return {
+        "group_id": group_id,
+        "results": [
+            {
+                "kid_id": kid_id,
+                "attendance": status.value,
+                "updated": updated[kid_id],
+            }
+            for kid_id, status in updates.items()
+        ],
+    }
@@ -1,8 +1,10 @@
 from fastapi import APIRouter
 
+from app.core.security import verified_token_cache
+
 router = APIRouter()
 
 
 @router.get("/health")
 def health_check():
-    return {"status": "ok"}
+    return {"status": "ok", "token_cache": verified_token_cache.stats()}
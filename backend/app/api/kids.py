@@ -1,50 +1,211 @@
-from datetime import date
-from typing import List, Optional
-
-from fastapi import APIRouter, Depends, HTTPException, Query
+import json
+from datetime import date, datetime, timezone
+from typing import Dict, List, Literal, Optional, Union
+
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
+from sqlalchemy import select
 from sqlalchemy.orm import Session
-
-from app.core.database import get_db
-from app.core.deps import get_current_user
-from app.models.kid import AbsenceReason, AttendanceStatus, Kid, KidAbsence
-from app.models.parent import Parent
-from app.schemas.kid import KidAbsenceCreate, KidAbsenceOut, KidOut, KidUpdate
+from starlette.concurrency import run_in_threadpool
+
+from app.core.database import get_db, loader_policy
+from app.core.deps import (
+    get_daycare_scope,
+    get_principal,
+    get_tenant_scope,
+    require_permission,
+)
+from app.core.permissions import Permission, Principal
+from app.models.kid import (
+    AbsenceReason,
+    AttendanceStatus,
+    Kid,
+    KidAbsence,
+)
+from app.schemas.kid import (
+    KidAbsenceCreate,
+    KidAbsenceOut,
+    KidAbsenceRangeCreate,
+    KidAbsenceRangeOut,
+    KidAttendanceEntryOut,
+    KidOut,
+    KidSummaryOut,
+    KidUpdate,
+    PickupPassCreate,
+    PickupPassKeyOut,
+    PickupPassOut,
+    PickupPassVerification,
+    PickupPassVerifyRequest,
+)
+from app.services.attendance_hub import AttendanceChange, attendance_hub
+from app.services.authorization_service import is_parent_of
 from app.services.kid_service import (
+    KID_OUT_LOADERS,
+    apply_effective_attendance,
     create_kid_absence,
-    get_effective_attendance,
+    create_kid_absence_range,
+    get_absences_in_range,
+    get_attendance_history,
     get_kid_absences,
+    get_kids_for_trusted_adult,
+    get_roster_fingerprint,
+    replace_trusted_adults,
+    set_attendance,
 )
-from app.utils.daycare_resolver import resolve_daycare_id
+from app.services.pickup_pass_service import (
+    InvalidPickupPass,
+    get_pickup_version,
+    issue_pickup_pass,
+    public_key,
+    revoke_pickup_passes,
+    verify_pickup_pass,
+)
+from app.services.read_model import get_kid_rows
+from app.utils.etag import conditional_response
+from app.utils.pagination import PageParams, paginate, set_next_cursor
 
 router = APIRouter()
 
+# Longest range /kids/attendance/history will return in one request
+MAX_ATTENDANCE_HISTORY_DAYS = 366
+
+# Seconds between SSE keep-alive comments on an idle attendance stream
+SSE_KEEPALIVE_SECONDS = 15
+
 
 class AttendanceUpdateRequest(BaseModel):
     attendance: str
 
 
-@router.get("/kids", response_model=List[KidOut])
+@router.get("/kids", response_model=Union[List[KidOut], List[KidSummaryOut]])
 def list_kids(
-    daycare_id: str = Query(...),
+    request: Request,
+    response: Response,
+    daycare_id: str = Depends(get_daycare_scope),
     group_id: Optional[str] = Query(None),
+    view: Literal["summary", "full"] = Query(
+        "full", description="summary: names and attendance only, no detail columns"
+    ),
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
 ):
-    # Resolve daycare_id for local/test development
-    daycare_id = resolve_daycare_id(db, daycare_id)
+    # Answer polling clients with a 304 from one aggregate query when unchanged
+    not_modified = conditional_response(
+        request, response, *get_roster_fingerprint(db, daycare_id, group_id)
+    )
+    if not_modified:
+        return not_modified
 
-    query = db.query(Kid).filter(Kid.daycare_id == daycare_id)
-    if group_id:
-        query = query.filter(Kid.group_id == group_id)
+    kids, next_cursor = get_kid_rows(
+        db, daycare_id, group_id, page.cursor, page.limit, summary=view == "summary"
+    )
+    set_next_cursor(response, next_cursor)
+    return kids
 
-    kids = query.all()
 
-    # Apply effective attendance logic
-    for kid in kids:
-        effective_attendance = get_effective_attendance(db, kid)
-        kid.attendance = AttendanceStatus(effective_attendance)
+@router.get("/kids/attendance/history", response_model=List[KidAttendanceEntryOut])
+def attendance_history(
+    daycare_id: str = Depends(get_daycare_scope),
+    from_date: date = Query(..., alias="from", description="First day (inclusive)"),
+    to_date: Optional[date] = Query(
+        None, alias="to", description="Last day (inclusive), defaults to from"
+    ),
+    group_id: Optional[int] = Query(None),
+    db: Session = Depends(get_db),
+):
+    """Get each kid's final attendance status per day from the attendance ledger."""
+    if to_date is None:
+        to_date = from_date
+    if to_date < from_date:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+    if (to_date - from_date).days >= MAX_ATTENDANCE_HISTORY_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Date range cannot exceed {MAX_ATTENDANCE_HISTORY_DAYS} days",
+        )
 
-    return kids
+    return get_attendance_history(db, daycare_id, from_date, to_date, group_id)
+
+
+async def _release_session(db: Session) -> None:
+    """Release the request's session before waiting on the hub."""
+    # Long-lived responses must not hold a pooled connection while idle
+    await run_in_threadpool(db.close)
+
+
+def _format_sse(change: AttendanceChange) -> str:
+    return f"id: {change.seq}\nevent: {change.kind}\ndata: {json.dumps(change.to_dict())}\n\n"
+
+
+@router.get("/kids/attendance/stream")
+async def attendance_stream(
+    request: Request,
+    daycare_id: str = Depends(get_daycare_scope),
+    group_id: Optional[int] = Query(None),
+    last_event_id: Optional[int] = Header(None),
+    db: Session = Depends(get_db),
+):
+    """Server-Sent Events stream of attendance and absence changes as they commit.
+
+    Reconnecting clients resume from the Last-Event-ID header. A `reset` event
+    means changes were missed and the roster should be re-fetched from /kids.
+    """
+    await _release_session(db)
+
+    async def events():
+        since = attendance_hub.last_seq if last_event_id is None else last_event_id
+        while not await request.is_disconnected():
+            batch = await attendance_hub.wait_for_changes(
+                since, daycare_id, group_id, timeout=SSE_KEEPALIVE_SECONDS
+            )
+            if batch.reset:
+                yield f"id: {batch.last_seq}\nevent: reset\ndata: {{}}\n\n"
+            elif batch.changes:
+                for change in batch.changes:
+                    yield _format_sse(change)
+            else:
+                yield ": keep-alive\n\n"
+            since = batch.last_seq
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/kids/attendance/changes")
+async def attendance_changes(
+    daycare_id: str = Depends(get_daycare_scope),
+    group_id: Optional[int] = Query(None),
+    since: Optional[int] = Query(
+        None, description="last_seq from the previous response; omit to start now"
+    ),
+    timeout: float = Query(25, ge=0, le=60),
+    db: Session = Depends(get_db),
+):
+    """Long-poll fallback for clients that cannot consume the SSE stream."""
+    await _release_session(db)
+    if since is None:
+        since = attendance_hub.last_seq
+
+    batch = await attendance_hub.wait_for_changes(
+        since, daycare_id, group_id, timeout=timeout
+    )
+    return {
+        "last_seq": batch.last_seq,
+        "reset": batch.reset,
+        "changes": [change.to_dict() for change in batch.changes],
+    }
 
 
 @router.patch("/kids/{kid_id}/attendance")
@@ -67,36 +228,157 @@ def update_attendance(
     if not kid:
         raise HTTPException(status_code=404, detail="Kid not found")
 
-    # Update attendance
-    kid.attendance = attendance_status
-
-    # If teacher is setting attendance, remove any existing absence for today
-    # This allows teacher override of parent-reported absences
-    today = date.today()
-    existing_absence = (
-        db.query(KidAbsence)
-        .filter(KidAbsence.kid_id == kid_id, KidAbsence.date == today)
-        .first()
-    )
-
-    if existing_absence:
-        db.delete(existing_absence)
+    # Teacher-set attendance overrides a parent-reported absence for today
+    today = set_attendance(db, kid, attendance_status)
 
     db.commit()
     db.refresh(kid)
 
+    attendance_hub.publish(
+        "attendance",
+        kid.daycare_id,
+        kid.group_id,
+        kid.id,
+        kid.attendance.value,
+        today,
+    )
+
     return {
         "message": "Attendance updated successfully",
         "attendance": kid.attendance.value,
     }
 
 
+@router.get("/kids/by-trusted-adult", response_model=List[KidOut])
+def list_kids_for_trusted_adult(
+    principal: Principal = Depends(
+        require_permission(
+            Permission.VIEW_ROSTER, "Only educators can look up trusted adults"
+        )
+    ),
+    daycare_id: str = Depends(get_daycare_scope),
+    phone_num: Optional[str] = Query(None),
+    email: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+):
+    """Kids in the daycare that the adult with this phone number or email may pick up."""
+    kids = get_kids_for_trusted_adult(db, daycare_id, phone_num, email)
+    return apply_effective_attendance(db, kids)
+
+
+@router.get("/kids/pickup-passes/key", response_model=PickupPassKeyOut)
+def get_pickup_pass_key():
+    """Public key for verifying pickup passes offline."""
+    return {"public_key": public_key()}
+
+
+@router.get("/kids/pickup-passes/versions", response_model=Dict[int, int])
+def list_pickup_versions(
+    principal: Principal = Depends(
+        require_permission(
+            Permission.VERIFY_PICKUP_PASSES, "Only educators can verify pickup passes"
+        )
+    ),
+    daycare_id: str = Depends(get_daycare_scope),
+    db: Session = Depends(get_db),
+):
+    """Each kid's current pickup_version, for checking revocation offline."""
+    rows = db.execute(
+        select(Kid.id, Kid.pickup_version).where(Kid.daycare_id == daycare_id)
+    ).all()
+    return {row.id: row.pickup_version for row in rows}
+
+
+@router.post("/kids/pickup-passes/verify", response_model=PickupPassVerification)
+def verify_pickup(
+    request: PickupPassVerifyRequest,
+    principal: Principal = Depends(
+        require_permission(
+            Permission.VERIFY_PICKUP_PASSES, "Only educators can verify pickup passes"
+        )
+    ),
+    daycare_id: str = Depends(get_tenant_scope),
+    db: Session = Depends(get_db),
+):
+    """
+    Verify a scanned pickup pass: one signature check and a cached version lookup.
+
+    Only passes for the verifier's own daycare are accepted.
+    """
+    try:
+        pickup_pass = verify_pickup_pass(request.token)
+    except InvalidPickupPass as e:
+        return {"valid": False, "reason": str(e)}
+
+    if pickup_pass.daycare_id != daycare_id:
+        return {"valid": False, "reason": "Pickup pass is for another daycare"}
+    if get_pickup_version(db, pickup_pass.kid_id) != pickup_pass.version:
+        return {"valid": False, "reason": "Pickup pass has been revoked"}
+
+    return {
+        "valid": True,
+        "kid_id": pickup_pass.kid_id,
+        "adult_name": pickup_pass.adult_name,
+        "expires_at": datetime.fromtimestamp(pickup_pass.expires_at, tz=timezone.utc),
+    }
+
+
+def _require_linked_parent(db: Session, principal: Principal, kid_id: int) -> None:
+    """403/404 unless the caller is a parent linked to the kid."""
+    if not principal.can(Permission.ISSUE_PICKUP_PASSES):
+        raise HTTPException(
+            status_code=403, detail="Only parents can manage pickup passes"
+        )
+    if principal.id is None:
+        raise HTTPException(status_code=401, detail="User ID not found in token")
+    if not is_parent_of(db, principal.id, kid_id):
+        if db.get(Kid, kid_id) is None:
+            raise HTTPException(status_code=404, detail="Kid not found")
+        raise HTTPException(
+            status_code=403,
+            detail="Parent not authorized to manage pickup passes for this kid",
+        )
+
+
+@router.post(
+    "/kids/{kid_id}/pickup-passes", response_model=PickupPassOut, status_code=201
+)
+def create_pickup_pass(
+    kid_id: int,
+    request: PickupPassCreate,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_principal),
+):
+    """Issue a signed, expiring pickup pass (QR payload) for one trusted adult."""
+    _require_linked_parent(db, principal, kid_id)
+    token, pickup_pass = issue_pickup_pass(db.get(Kid, kid_id), request.adult_name)
+    return {
+        "token": token,
+        "kid_id": pickup_pass.kid_id,
+        "adult_name": pickup_pass.adult_name,
+        "expires_at": datetime.fromtimestamp(pickup_pass.expires_at, tz=timezone.utc),
+    }
+
+
+@router.post("/kids/{kid_id}/pickup-passes/revoke", status_code=204)
+def revoke_pickup_pass(
+    kid_id: int,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_principal),
+):
+    """Revoke every pickup pass issued for a kid."""
+    _require_linked_parent(db, principal, kid_id)
+    revoke_pickup_passes(db, kid_id)
+    db.commit()
+    return Response(status_code=204)
+
+
 @router.patch("/kids/{kid_id}", response_model=KidOut)
 def update_kid(
     kid_id: int,
     kid_update: KidUpdate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
 ):
     """Update a kid's information with parent authorization for sensitive fields."""
     # Find the kid
@@ -104,15 +386,16 @@ def update_kid(
     if not kid:
         raise HTTPException(status_code=404, detail="Kid not found")
 
-    user_role = current_user.get("role")
-    user_id = current_user.get("sub")  # JWT sub field contains the user ID
-
-    # Check if user is a parent and if they're linked to this kid
-    is_linked_parent = False
-    if user_role == "parent" and user_id:
-        parent = db.query(Parent).filter(Parent.id == int(user_id)).first()
-        if parent and kid in parent.kids:
-            is_linked_parent = True
+    # Sensitive fields need the permission and a link to this kid. Checked
+    # before anything is written, so a rejected request changes nothing
+    can_edit_health = principal.can(Permission.EDIT_KID_HEALTH)
+    if can_edit_health and not (
+        principal.id is not None and is_parent_of(db, principal.id, kid.id)
+    ):
+        raise HTTPException(
+            status_code=403,
+            detail="Only parents linked to this kid can update allergies and need_to_know fields",
+        )
 
     # Update basic fields (allowed for all authenticated users)
     if kid_update.full_name is not None:
@@ -124,18 +407,19 @@ def update_kid(
     if kid_update.daycare_id is not None:
         kid.daycare_id = kid_update.daycare_id
     if kid_update.trusted_adults is not None:
-        kid.trusted_adults = kid_update.trusted_adults
+        removed = replace_trusted_adults(
+            db, kid, [adult.model_dump() for adult in kid_update.trusted_adults]
+        )
+        # Passes of adults who were removed must stop working
+        if removed:
+            revoke_pickup_passes(db, kid.id)
+    attendance_day = None
     if kid_update.attendance is not None:
-        kid.attendance = kid_update.attendance
+        # Same override, ledger entry and notification as the attendance endpoint
+        attendance_day = set_attendance(db, kid, kid_update.attendance)
 
     # Update sensitive fields only if user is a linked parent
-    if user_role == "parent":
-        if not is_linked_parent:
-            raise HTTPException(
-                status_code=403,
-                detail="Only parents linked to this kid can update allergies and need_to_know fields",
-            )
-        # Parent is linked, allow updates to sensitive fields
+    if can_edit_health:
         if kid_update.allergies is not None:
             kid.allergies = kid_update.allergies
         if kid_update.need_to_know is not None:
@@ -148,49 +432,122 @@ def update_kid(
     db.commit()
     db.refresh(kid)
 
+    if attendance_day is not None:
+        attendance_hub.publish(
+            "attendance",
+            kid.daycare_id,
+            kid.group_id,
+            kid.id,
+            kid.attendance.value,
+            attendance_day,
+        )
+
     return kid
 
 
+def _require_parent(principal: Principal, detail: str) -> int:
+    """Return the caller's parent ID, or 403/401 for other callers."""
+    if not principal.can(Permission.OWN_KID_ABSENCES):
+        raise HTTPException(status_code=403, detail=detail)
+    if principal.id is None:
+        raise HTTPException(status_code=401, detail="User ID not found in token")
+    return principal.id
+
+
 @router.post("/kids/{kid_id}/absences", response_model=KidAbsenceOut)
 def create_absence(
     kid_id: int,
     absence_data: KidAbsenceCreate,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
 ):
     """Create or update an absence for a kid. Only parents linked to the kid can create absences."""
-    user_role = current_user.get("role")
-    user_id = current_user.get("sub")
+    parent_id = _require_parent(principal, "Only parents can create absences")
 
-    if user_role != "parent":
-        raise HTTPException(status_code=403, detail="Only parents can create absences")
+    return create_kid_absence(db, kid_id, absence_data, parent_id)
 
-    if not user_id:
-        raise HTTPException(status_code=401, detail="User ID not found in token")
 
-    return create_kid_absence(db, kid_id, absence_data, int(user_id))
+@router.post("/kids/absences", response_model=KidAbsenceRangeOut)
+def create_absence_range(
+    absence_data: KidAbsenceRangeCreate,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_principal),
+):
+    """Report absences for a date range and one or more of the parent's kids.
+
+    Days that already have an absence are returned as conflicts, the rest are
+    created in one statement.
+    """
+    parent_id = _require_parent(principal, "Only parents can create absences")
+
+    created, conflicts = create_kid_absence_range(db, absence_data, parent_id)
+    return {
+        "created": created,
+        "conflicts": [{"kid_id": kid_id, "date": day} for kid_id, day in conflicts],
+    }
+
+
+@router.get("/kids/absences", response_model=List[KidAbsenceOut])
+def list_daycare_absences(
+    response: Response,
+    principal: Principal = Depends(
+        require_permission(
+            Permission.VIEW_DAYCARE_ABSENCES, "Only educators can view daycare absences"
+        )
+    ),
+    daycare_id: str = Depends(get_daycare_scope),
+    from_date: date = Query(..., alias="from", description="First day (inclusive)"),
+    to_date: date = Query(..., alias="to", description="Last day (inclusive)"),
+    group_id: Optional[int] = Query(None),
+    page: PageParams = Depends(),
+    db: Session = Depends(get_db),
+):
+    """Get absences across a daycare or group in a date range, for staffing."""
+    if to_date < from_date:
+        raise HTTPException(status_code=400, detail="'to' must not be before 'from'")
+
+    query = get_absences_in_range(db, daycare_id, from_date, to_date, group_id)
+
+    # (date, kid_id) is unique, so it doubles as the keyset
+    absences, next_cursor = paginate(
+        query, KidAbsence.date, KidAbsence.kid_id, page.cursor, page.limit
+    )
+    set_next_cursor(response, next_cursor)
+    return absences
 
 
 @router.get("/kids/{kid_id}/absences", response_model=List[KidAbsenceOut])
 def list_absences(
     kid_id: int,
     db: Session = Depends(get_db),
-    current_user: dict = Depends(get_current_user),
+    principal: Principal = Depends(get_principal),
 ):
     """Get all absences for a kid. Only parents linked to the kid can view absences."""
-    user_role = current_user.get("role")
-    user_id = current_user.get("sub")
-
-    if user_role != "parent":
-        raise HTTPException(status_code=403, detail="Only parents can view absences")
+    parent_id = _require_parent(principal, "Only parents can view absences")
 
-    if not user_id:
-        raise HTTPException(status_code=401, detail="User ID not found in token")
-
-    return get_kid_absences(db, kid_id, int(user_id))
+    return get_kid_absences(db, kid_id, parent_id)
 
 
 @router.get("/kids/absence-reasons")
 def get_absence_reasons():
     """Get all valid absence reasons from the enum."""
     return {"absence_reasons": [r.value for r in AbsenceReason]}
+
+
+# Declared last so the static /kids/... paths above are matched first
+@router.get("/kids/{kid_id}", response_model=KidOut)
+def get_kid(
+    kid_id: int,
+    daycare_id: str = Depends(get_daycare_scope),
+    db: Session = Depends(get_db),
+):
+    """Get a kid's full record, including the columns the roster summary omits."""
+    kid = (
+        db.query(Kid)
+        .options(*loader_policy(*KID_OUT_LOADERS))
+        .filter(Kid.id == kid_id, Kid.daycare_id == daycare_id)
+        .first()
+    )
+    if not kid:
+        raise HTTPException(status_code=404, detail="Kid not found")
+    return apply_effective_attendance(db, [kid])[0]
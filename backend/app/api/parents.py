@@ -1,45 +1,37 @@
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.deps import get_optional_daycare_scope
 from app.models.parent import Parent
 from app.schemas.kid import KidOut
 from app.schemas.parents import ParentOut
-from app.services.kid_service import get_kids_for_parent
-from app.utils.daycare_resolver import resolve_daycare_id
+from app.services.kid_service import apply_effective_attendance, get_kids_for_parent
+from app.services.read_model import get_parent_rows
+from app.utils.pagination import PageParams, set_next_cursor
 
 router = APIRouter()
 
 
 @router.get("/parents", response_model=List[ParentOut])
 def list_parents(
-    daycare_id: Optional[str] = Query(
-        None, description="Daycare scope (required in prod if no JWT)"
-    ),
+    response: Response,
+    daycare_id: Optional[str] = Depends(get_optional_daycare_scope),
     search: Optional[str] = Query(None, description="Search by name/email"),
+    page: PageParams = Depends(),
     db: Session = Depends(get_db),
 ):
     if settings.environment == "production" and not daycare_id:
         raise HTTPException(status_code=400, detail="daycare_id is required")
 
-    # Resolve daycare_id for local development
-    if daycare_id:
-        daycare_id = resolve_daycare_id(db, daycare_id)
-
-    q = db.query(Parent)
-    if daycare_id:
-        q = q.filter(Parent.daycare_id == daycare_id)
-
-    if search:
-        q = q.filter(
-            (Parent.full_name.ilike(f"%{search}%"))
-            | (Parent.email.ilike(f"%{search}%"))
-        )
-
-    return q.all()
+    parents, next_cursor = get_parent_rows(
+        db, daycare_id, search, page.cursor, page.limit
+    )
+    set_next_cursor(response, next_cursor)
+    return parents
 
 
 @router.get("/parents/{parent_id}/kids", response_model=List[KidOut])
@@ -55,4 +47,4 @@ def get_kids_for_parent_endpoint(
 
     # Get kids for this parent
     kids = get_kids_for_parent(db, parent_id)
-    return kids
+    return apply_effective_attendance(db, list(kids))
@@ -31,6 +31,8 @@ class Settings(BaseSettings):
     db_name: str = "kiddozz_demo"
     db_user: str = "username"
     db_password: str = "password"
+    # Raise instead of lazy-loading relationships an endpoint did not declare
+    db_raise_on_lazy_load: bool = False
 
     # AWS S3 Configuration
     aws_access_key_id: str = ""
@@ -44,7 +46,27 @@ class Settings(BaseSettings):
         "SECRET_KEY", "your-secret-key-here-change-in-production"
     )
     algorithm: str = "HS256"
-    access_token_expire_minutes: int = 30
+    access_token_expire_minutes: int = 15
+    refresh_token_expire_days: int = 30
+    # Password hashing (scrypt cost; changing it rehashes on next login)
+    password_scrypt_n: int = 2**14
+    password_scrypt_r: int = 8
+    password_scrypt_p: int = 1
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 32
+    password_hash_use_processes: bool = False
+    # Pickup passes: base64url Ed25519 seed (derived from SECRET_KEY if empty)
+    pickup_pass_signing_key: str = ""
+    pickup_pass_ttl_minutes: int = 12 * 60
+    # How often each process pulls other processes' token revocations
+    token_revocation_refresh_seconds: float = 5.0
+    # Let tokens with the dev placeholder daycare claim pick a daycare with
+    # ?daycare_id= on tenant-scoped endpoints (local development and tests)
+    allow_dev_daycare_scope: bool = False
+
+    # External calendar sync (Google Calendar v3 compatible API)
+    calendar_api_url: str = "https://www.googleapis.com/calendar/v3"
+    calendar_api_token: str = ""
 
     # CORS Configuration
     allowed_origins: Union[List[str], str] = [
@@ -1,7 +1,9 @@
 import os
+from typing import Tuple
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.orm import declarative_base, raiseload, sessionmaker
+from sqlalchemy.orm.interfaces import LoaderOption
 
 from app.core.config import settings
 
@@ -27,3 +29,17 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+def loader_policy(*options: LoaderOption) -> Tuple[LoaderOption, ...]:
+    """
+    Declare the relationship loading a query relies on.
+
+    Endpoints list the relationships their response model reads (usually as
+    selectinload options). When DB_RAISE_ON_LAZY_LOAD is enabled, every other
+    relationship on the loaded rows raises on access, so an undeclared lazy
+    load fails in tests instead of adding one query per row in production.
+    """
+    if settings.db_raise_on_lazy_load:
+        return (*options, raiseload("*"))
+    return options
@@ -1,24 +1,46 @@
-from typing import Any, Dict
+from functools import lru_cache
+from typing import Any, Dict, Optional
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Query, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy.orm import Session
 
-from app.core.security import decode_access_token
+from app.core.config import settings
+from app.core.database import get_db
+from app.core.permissions import Permission, Principal
+from app.core.security import verified_token_cache
+from app.services.auth_service import revocation_store, token_id
+from app.utils.daycare_resolver import (
+    DEV_DAYCARE_ID,
+    daycare_exists,
+    resolve_daycare_id,
+)
 
 # OAuth2 scheme for token extraction
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token")
+# Same scheme for endpoints that also serve anonymous (dev) clients
+optional_oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/token", auto_error=False)
 
 
-def get_current_user(token: str = Depends(oauth2_scheme)) -> Dict[str, Any]:
-    """Get the current user from the JWT token."""
+def get_current_user(
+    token: str = Depends(oauth2_scheme), db: Session = Depends(get_db)
+) -> Dict[str, Any]:
+    """Get the current user from the JWT token (verified once per token, then cached)."""
     try:
-        payload = decode_access_token(token)
+        payload = verified_token_cache.decode(token)
         user_id = payload.get("sub")  # Changed from "user_id" to "sub"
         if user_id is None:
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Invalid authentication credentials",
             )
+        # Memory lookup; the store only reads the DB every few seconds
+        revocation_store.refresh(db)
+        if revocation_store.is_revoked(token_id(payload, token)):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token has been revoked",
+            )
         return payload
     except HTTPException:
         raise
@@ -29,6 +51,122 @@ def get_current_user(token: str = Depends(oauth2_scheme)) -> Dict[str, Any]:
         )
 
 
+def get_principal(
+    current_user: Dict[str, Any] = Depends(get_current_user),
+) -> Principal:
+    """Get the typed caller for the request (claims are parsed once per request)."""
+    return Principal.from_claims(current_user)
+
+
+def get_optional_principal(
+    token: Optional[str] = Depends(optional_oauth2_scheme),
+    db: Session = Depends(get_db),
+) -> Optional[Principal]:
+    """Get the caller if a bearer token was sent; a bad token is still a 401."""
+    if not token:
+        return None
+    return Principal.from_claims(get_current_user(token, db))
+
+
+def get_optional_daycare_scope(
+    daycare_id: Optional[str] = Query(
+        None, description="Daycare scope (taken from the token when authenticated)"
+    ),
+    principal: Optional[Principal] = Depends(get_optional_principal),
+    db: Session = Depends(get_db),
+) -> Optional[str]:
+    """
+    Resolve the daycare a request is scoped to, or None if none was given.
+
+    A signed `daycare_id` claim is trusted as-is, so authenticated requests
+    never pay a lookup; a query parameter that contradicts it is rejected.
+    Otherwise the query parameter (or the dev placeholder claim) is resolved
+    and checked against the per-process daycare cache.
+    """
+    claimed = principal.daycare_id if principal else None
+    if claimed and claimed != DEV_DAYCARE_ID:
+        if daycare_id and daycare_id != claimed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="daycare_id does not match the authenticated daycare",
+            )
+        return claimed
+
+    requested = daycare_id or claimed
+    if not requested:
+        return None
+    resolved = resolve_daycare_id(db, requested)
+    if not daycare_exists(db, resolved):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Daycare not found"
+        )
+    return resolved
+
+
+def get_daycare_scope(
+    daycare_id: Optional[str] = Depends(get_optional_daycare_scope),
+) -> str:
+    """Resolve the request's daycare scope, which is required."""
+    if daycare_id is None:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="daycare_id is required",
+        )
+    return daycare_id
+
+
+def get_tenant_scope(
+    daycare_id: Optional[str] = Query(
+        None, description="Daycare scope, only honored for dev placeholder tokens"
+    ),
+    principal: Principal = Depends(get_principal),
+    db: Session = Depends(get_db),
+) -> str:
+    """
+    Resolve the daycare of an authenticated caller, for tenant-owned data.
+
+    The signed `daycare_id` claim is the scope; a query parameter that
+    contradicts it is rejected. A token carrying the dev placeholder claim
+    may name a daycare in the query parameter, but only while
+    `allow_dev_daycare_scope` is enabled.
+    """
+    claimed = principal.daycare_id
+    if claimed and claimed != DEV_DAYCARE_ID:
+        if daycare_id and daycare_id != claimed:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="daycare_id does not match the authenticated daycare",
+            )
+        return claimed
+
+    if not settings.allow_dev_daycare_scope:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Token is not scoped to a daycare",
+        )
+    resolved = resolve_daycare_id(db, daycare_id or DEV_DAYCARE_ID)
+    if not daycare_exists(db, resolved):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND, detail="Daycare not found"
+        )
+    return resolved
+
+
+@lru_cache(maxsize=None)
+def require_permission(permission: Permission, detail: str = "Not permitted"):
+    """Create (once per permission) a dependency that requires a permission."""
+
+    def _require_permission(
+        principal: Principal = Depends(get_principal),
+    ) -> Principal:
+        if not principal.can(permission):
+            raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=detail)
+        return principal
+
+    return _require_permission
+
+
+@lru_cache(maxsize=None)
 def require_role(role: str):
     """Create a dependency that requires a specific role."""
 
@@ -46,14 +184,15 @@ def require_role(role: str):
     return role_checker
 
 
+@lru_cache(maxsize=None)
 def require_any_role(*roles: str):
     """Create a dependency that requires any of the specified roles."""
+    allowed = frozenset(roles)
 
     def _require_any(
         current_user: Dict[str, Any] = Depends(get_current_user),
     ) -> Dict[str, Any]:
-        current = current_user.get("role")
-        if current not in roles:
+        if current_user.get("role") not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail=f"Requires one of roles: {roles}",
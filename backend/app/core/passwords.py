@@ -0,0 +1,147 @@
+# Password hashing (scrypt) on a dedicated, size-limited executor
+import asyncio
+import base64
+import hashlib
+import hmac
+import secrets
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional, Tuple, TypeVar
+
+from fastapi import HTTPException, status
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+SCHEME = "scrypt"
+SALT_BYTES = 16
+KEY_BYTES = 32
+
+
+def _current_params() -> Tuple[int, int, int]:
+    return (
+        settings.password_scrypt_n,
+        settings.password_scrypt_r,
+        settings.password_scrypt_p,
+    )
+
+
+def _b64(raw: bytes) -> str:
+    return base64.b64encode(raw).decode().rstrip("=")
+
+
+def _unb64(text: str) -> bytes:
+    return base64.b64decode(text + "=" * (-len(text) % 4))
+
+
+def _derive(password: str, salt: bytes, n: int, r: int, p: int) -> bytes:
+    return hashlib.scrypt(
+        password.encode(),
+        salt=salt,
+        n=n,
+        r=r,
+        p=p,
+        maxmem=max(2**25, 256 * r * (n + p)),
+        dklen=KEY_BYTES,
+    )
+
+
+def hash_password(password: str) -> str:
+    """Hash a password with the configured cost: scrypt$n$r$p$salt$key."""
+    n, r, p = _current_params()
+    salt = secrets.token_bytes(SALT_BYTES)
+    key = _derive(password, salt, n, r, p)
+    return f"{SCHEME}${n}${r}${p}${_b64(salt)}${_b64(key)}"
+
+
+def verify_password(password: str, password_hash: str) -> bool:
+    """Check a password against a stored hash (constant-time compare)."""
+    try:
+        scheme, n, r, p, salt, key = password_hash.split("$")
+        if scheme != SCHEME:
+            return False
+        derived = _derive(password, _unb64(salt), int(n), int(r), int(p))
+    except ValueError:
+        return False
+    return hmac.compare_digest(derived, _unb64(key))
+
+
+def needs_rehash(password_hash: str) -> bool:
+    """True if the hash was made with cost parameters other than the current ones."""
+    try:
+        scheme, n, r, p, _, _ = password_hash.split("$")
+        return scheme != SCHEME or (int(n), int(r), int(p)) != _current_params()
+    except ValueError:
+        return True
+
+
+def verify_and_update(
+    password: str, password_hash: Optional[str]
+) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password and, if the stored hash uses outdated parameters,
+    return a fresh hash to store. Accounts without a hash still pay for one
+    derivation so response time does not reveal which emails exist.
+    """
+    if not password_hash:
+        hash_password(password)
+        return False, None
+    if not verify_password(password, password_hash):
+        return False, None
+    return True, hash_password(password) if needs_rehash(password_hash) else None
+
+
+class PasswordHasher:
+    """
+    Runs hashing on its own small pool so login storms cannot occupy the
+    thread pool that serves sync endpoints. hashlib.scrypt releases the GIL,
+    so threads give real parallelism; a process pool can be chosen instead.
+    Callers beyond `max_pending` are turned away with a 503 rather than
+    queueing without bound.
+    """
+
+    def __init__(self, workers: int, max_pending: int, use_processes: bool = False):
+        self.workers = workers
+        self.use_processes = use_processes
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor: Optional[Executor] = None
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> Executor:
+        with self._lock:
+            if self._executor is None:
+                if self.use_processes:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers)
+                else:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.workers, thread_name_prefix="password-hash"
+                    )
+            return self._executor
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        if not self._slots.acquire(blocking=False):
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many concurrent logins, please retry",
+                headers={"Retry-After": "1"},
+            )
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), func, *args)
+        finally:
+            self._slots.release()
+
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False)
+                self._executor = None
+
+
+# Create global instance
+password_hasher = PasswordHasher(
+    settings.password_hash_workers,
+    settings.password_hash_max_pending,
+    use_processes=settings.password_hash_use_processes,
+)
@@ -0,0 +1,75 @@
+from dataclasses import dataclass
+from enum import IntFlag
+from typing import Any, Dict, FrozenSet, Optional
+
+
+class Permission(IntFlag):
+    """Capabilities granted by a role, checked with bitwise AND."""
+
+    NONE = 0
+    VIEW_ROSTER = 1 << 0
+    VIEW_DAYCARE_ABSENCES = 1 << 1
+    OWN_KID_ABSENCES = 1 << 2  # report and view, for the parent's own kids
+    EDIT_KID_HEALTH = 1 << 3  # allergies / need_to_know, for the parent's own kids
+    ISSUE_PICKUP_PASSES = 1 << 4  # for the parent's own kids
+    VERIFY_PICKUP_PASSES = 1 << 5
+    TAKE_ATTENDANCE = 1 << 6
+
+
+_EDUCATOR = (
+    Permission.VIEW_ROSTER
+    | Permission.VIEW_DAYCARE_ABSENCES
+    | Permission.VERIFY_PICKUP_PASSES
+    | Permission.TAKE_ATTENDANCE
+)
+
+ROLE_PERMISSIONS: Dict[str, Permission] = {
+    "parent": Permission.OWN_KID_ABSENCES
+    | Permission.EDIT_KID_HEALTH
+    | Permission.ISSUE_PICKUP_PASSES,
+    "educator": _EDUCATOR,
+    "super_educator": _EDUCATOR,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """
+    The authenticated caller, built once per request from verified JWT claims.
+
+    `id` is the numeric `sub` claim (None for non-numeric test subjects) and
+    `groups` holds the group names dev_login embeds in the token.
+    """
+
+    id: Optional[int]
+    role: str
+    daycare_id: Optional[str]
+    groups: FrozenSet[str]
+    permissions: Permission
+
+    @classmethod
+    def from_claims(cls, claims: Dict[str, Any]) -> "Principal":
+        role = claims.get("role") or ""
+        sub = claims.get("sub")
+        try:
+            user_id = int(sub)
+        except (TypeError, ValueError):
+            user_id = None
+        return cls(
+            id=user_id,
+            role=role,
+            daycare_id=claims.get("daycare_id"),
+            groups=frozenset(str(group) for group in claims.get("groups") or ()),
+            permissions=ROLE_PERMISSIONS.get(role, Permission.NONE),
+        )
+
+    def can(self, permission: Permission) -> bool:
+        """True if every bit of `permission` is granted."""
+        return self.permissions & permission == permission
+
+    def in_group(self, group: Any) -> bool:
+        return str(group) in self.groups
+
+    @property
+    def is_parent(self) -> bool:
+        return self.role == "parent"
@@ -1,5 +1,10 @@
+import hashlib
+import threading
+import time
+import uuid
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from fastapi import HTTPException, status
 from jose import JWTError, jwt
@@ -21,6 +26,8 @@ def create_access_token(
         )
 
     to_encode.update({"exp": expire})
+    # Unique token ID, so a single token can be revoked
+    to_encode.setdefault("jti", uuid.uuid4().hex)
 
     try:
         encoded_jwt = jwt.encode(
@@ -51,3 +58,65 @@ def decode_access_token(token: str) -> Dict[str, Any]:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Error decoding access token: {str(e)}",
         )
+
+
+class VerifiedTokenCache:
+    """
+    Bounded LRU of already-verified access tokens.
+
+    Keyed by a SHA-256 digest of the raw token so the cache never holds
+    bearer credentials. A hit skips HMAC verification and is honored only
+    until the token's own `exp`; tokens without an `exp` are never cached.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = (
+            OrderedDict()
+        )
+
+    def decode(self, token: str) -> Dict[str, Any]:
+        """Return the token's claims, verifying it only on a cache miss."""
+        key = hashlib.sha256(token.encode()).digest()
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > now:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return dict(entry[1])
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+
+        payload = decode_access_token(token)
+        exp = payload.get("exp")
+        if isinstance(exp, (int, float)) and exp > now:
+            with self._lock:
+                self._entries[key] = (float(exp), dict(payload))
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+        return payload
+
+    def stats(self) -> Dict[str, int]:
+        """Hit/miss counters and current size, for confirming the saving under load."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._entries),
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Create global instance
+verified_token_cache = VerifiedTokenCache()
@@ -2,7 +2,8 @@ import os
 
 from fastapi import FastAPI
 
-from app.api import auth, educators, events, groups, health, kids, parents
+from app.api import auth, calendar, educators, events, groups, health, kids, parents
+from app.core.passwords import password_hasher
 
 app = FastAPI(title="Kiddozz Backend API", version="1.0.0")
 
@@ -17,6 +18,7 @@ app.include_router(educators.router, prefix="/api/v1", tags=["educators"])
 app.include_router(parents.router, prefix="/api/v1", tags=["parents"])
 app.include_router(kids.router, prefix="/api/v1", tags=["kids"])
 app.include_router(groups.router, prefix="/api/v1", tags=["groups"])
+app.include_router(calendar.router, prefix="/api/v1", tags=["calendar"])
 
 
 @app.on_event("startup")
@@ -54,6 +56,12 @@ def startup_event():
     )
 
 
+@app.on_event("shutdown")
+def shutdown_event():
+    """Stop the password hashing pool."""
+    password_hasher.shutdown()
+
+
 @app.get("/")
 def read_root():
     return {"message": "Welcome to Kiddozz API", "version": "1.0.0", "docs": "/docs"}
@@ -1,13 +1,18 @@
 # Database models and schemas
 from .associations import educator_groups, parent_kids
+from .calendar_sync import CalendarSyncState, CalendarTombstone
 from .daycare import Daycare
 from .educator import Educator, EducatorRole
 from .event import Event, EventImage
 from .group import Group
-from .kid import Kid
+from .kid import Kid, TrustedAdult
 from .parent import Parent
+from .refresh_token import RefreshToken
+from .revoked_token import RevokedToken
 
 __all__ = [
+    "CalendarSyncState",
+    "CalendarTombstone",
     "Daycare",
     "Educator",
     "EducatorRole",
@@ -16,6 +21,9 @@ __all__ = [
     "Group",
     "Kid",
     "Parent",
+    "RefreshToken",
+    "RevokedToken",
+    "TrustedAdult",
     "educator_groups",
     "parent_kids",
 ]
@@ -0,0 +1,51 @@
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class CalendarSyncState(Base):
+    """A daycare's link to its external calendar and the incremental sync cursor."""
+
+    __tablename__ = "calendar_sync_states"
+
+    daycare_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("daycares.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    calendar_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    # Opaque token from the last pull; None means the next pull is a full one
+    sync_token: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    last_synced_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+    def __repr__(self):
+        return (
+            f"<CalendarSyncState(daycare_id='{self.daycare_id}', "
+            f"calendar_id='{self.calendar_id}')>"
+        )
+
+
+class CalendarTombstone(Base):
+    """A locally deleted event whose external copy still has to be deleted."""
+
+    __tablename__ = "calendar_tombstones"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    daycare_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("daycares.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    external_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), nullable=False
+    )
+
+    def __repr__(self):
+        return f"<CalendarTombstone(external_id='{self.external_id}')>"
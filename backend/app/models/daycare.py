@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 from uuid import uuid4
 
 from sqlalchemy import DateTime, String, func
@@ -32,6 +32,16 @@ class Daycare(Base):
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=func.now(), onupdate=func.now(), nullable=False
     )
+    # When an event of this daycare was last deleted; with the events' own
+    # timestamps it dates the latest change to the calendar feed
+    events_deleted_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    # SHA-256 of the secret in the calendar feed URL; no feed is served
+    # until one is issued
+    calendar_token_hash: Mapped[Optional[str]] = mapped_column(
+        String(64), nullable=True
+    )
 
     # Relationships
     groups: Mapped[List["Group"]] = relationship(
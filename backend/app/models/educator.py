@@ -3,7 +3,7 @@ from __future__ import annotations
 from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -35,6 +35,12 @@ class Educator(Base):
     email: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     phone_num: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
     jwt_token: Mapped[Optional[str]] = mapped_column(String(512), nullable=True)
+    password_hash: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
+    # Bumped whenever the role, daycare or groups (membership or names) change,
+    # so refresh can reuse claims until then
+    claims_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
     daycare_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey("daycares.id", ondelete="CASCADE"),
@@ -53,5 +59,10 @@ class Educator(Base):
         "Group", secondary="educator_groups", back_populates="educators"
     )
 
+    __table_args__ = (
+        # Keyset pagination of list endpoints: (daycare_id, full_name, id)
+        Index("ix_educators_daycare_full_name_id", "daycare_id", "full_name", "id"),
+    )
+
     def __repr__(self):
         return f"<Educator(id={self.id}, full_name='{self.full_name}', role='{self.role}', email='{self.email}')>"
@@ -1,37 +1,105 @@
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String, Text
+from datetime import datetime, time, timezone
+from typing import Optional, Tuple
+
+from sqlalchemy import (
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
 
 
+def utcnow() -> datetime:
+    """Current time as the naive UTC datetime event dates are stored in"""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def event_start(date: datetime, start_time: Optional[str]) -> Tuple[datetime, bool]:
+    """
+    When an event starts, and whether it is an all-day event.
+
+    A "HH:MM" start time sets the time of day on the event's date. Without
+    one, an event dated at midnight lasts all day.
+    """
+    if start_time:
+        try:
+            hour, minute = (int(part) for part in start_time.split(":"))
+            return (
+                date.replace(hour=hour, minute=minute, second=0, microsecond=0),
+                False,
+            )
+        except ValueError:
+            pass
+    return date, start_time is None and date.time() == time.min
+
+
 class Event(Base):
     __tablename__ = "events"
 
     id = Column(Integer, primary_key=True, index=True)
+    daycare_id = Column(
+        UUID(as_uuid=False),
+        ForeignKey("daycares.id", ondelete="CASCADE"),
+        nullable=False,
+    )
     title = Column(String(255), nullable=False)
     description = Column(Text)
     date = Column(DateTime, nullable=False)
     start_time = Column(String(10))  # HH:MM format
     location = Column(String(255))
-    is_past = Column(Boolean, default=False)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    # External calendar copy: its event ID and the etag of the version we hold
+    external_id = Column(String(255))
+    external_etag = Column(String(255))
+    # Set by every local write until the change is pushed to the calendar
+    sync_pending = Column(Boolean, default=False, server_default="0", nullable=False)
 
     # Relationship with images
     images = relationship(
         "EventImage", back_populates="event", cascade="all, delete-orphan"
     )
 
+    # Keyset pagination and calendar ranges of one daycare's events
+    __table_args__ = (
+        Index("ix_events_daycare_id_date_id", "daycare_id", "date", "id"),
+        # Calendar sync: pulled changes are matched by external ID, and a push
+        # only reads the daycare's pending events
+        Index(
+            "uq_events_daycare_id_external_id",
+            "daycare_id",
+            "external_id",
+            unique=True,
+        ),
+        Index("ix_events_daycare_id_sync_pending", "daycare_id", "sync_pending"),
+    )
+
+    @property
+    def is_past(self) -> bool:
+        """Whether the event has started, dates being naive UTC"""
+        return self.date < utcnow()
+
 
 class EventImage(Base):
     __tablename__ = "event_images"
 
     id = Column(Integer, primary_key=True, index=True)
-    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"), index=True)
+    event_id = Column(Integer, ForeignKey("events.id", ondelete="CASCADE"))
     file_name = Column(String, nullable=False)
     s3_key = Column(String, unique=True, nullable=False)
     status = Column(String, default="pending")  # pending | approved
     created_at = Column(DateTime, server_default=func.now())
 
     event = relationship("Event", back_populates="images")
+
+    # Batched image loads filter on event_id and number images by id per event
+    __table_args__ = (Index("ix_event_images_event_id_id", "event_id", "id"),)
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -41,6 +41,11 @@ class Group(Base):
     )
     kids: Mapped[List[Kid]] = relationship("Kid", back_populates="group")
 
+    __table_args__ = (
+        # Keyset pagination of list endpoints: (daycare_id, name, id)
+        Index("ix_groups_daycare_name_id", "daycare_id", "name", "id"),
+    )
+
     def __repr__(self):
         return (
             f"<Group(id={self.id}, name='{self.name}', daycare_id='{self.daycare_id}')>"
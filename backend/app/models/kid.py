@@ -3,14 +3,14 @@ from __future__ import annotations
 import uuid
 from datetime import date, datetime
 from enum import Enum as PyEnum
-from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
 from sqlalchemy import (
-    JSON,
     Date,
     DateTime,
     Enum,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -18,6 +18,7 @@ from sqlalchemy import (
     func,
 )
 from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.ext.orderinglist import ordering_list
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.core.database import Base
@@ -35,6 +36,12 @@ class AbsenceReason(PyEnum):
     HOLIDAY = "holiday"
 
 
+class AttendanceSource(PyEnum):
+    EDUCATOR = "educator"
+    ABSENCE = "absence"
+    CLOSE_OUT = "close_out"
+
+
 if TYPE_CHECKING:
     from .daycare import Daycare
     from .group import Group
@@ -57,8 +64,9 @@ class Kid(Base):
     group_id: Mapped[int] = mapped_column(
         Integer, ForeignKey("groups.id", ondelete="CASCADE"), nullable=False
     )
-    trusted_adults: Mapped[Optional[List[Dict[str, Any]]]] = mapped_column(
-        JSON, nullable=True
+    # Bumped to revoke every pickup pass issued for this kid
+    pickup_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
     )
     attendance: Mapped[AttendanceStatus] = mapped_column(
         Enum(
@@ -87,11 +95,53 @@ class Kid(Base):
     absences: Mapped[List[KidAbsence]] = relationship(
         "KidAbsence", back_populates="kid", cascade="all, delete-orphan"
     )
+    trusted_adults: Mapped[List[TrustedAdult]] = relationship(
+        "TrustedAdult",
+        back_populates="kid",
+        cascade="all, delete-orphan",
+        order_by="TrustedAdult.position",
+        collection_class=ordering_list("position"),
+    )
+
+    __table_args__ = (
+        # Keyset pagination of the roster: (daycare_id, full_name, id)
+        Index("ix_kids_daycare_full_name_id", "daycare_id", "full_name", "id"),
+    )
 
     def __repr__(self):
         return f"<Kid(id={self.id}, full_name='{self.full_name}', dob='{self.dob}')>"
 
 
+class TrustedAdult(Base):
+    """An adult other than a parent who may pick a kid up."""
+
+    __tablename__ = "trusted_adults"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    kid_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("kids.id", ondelete="CASCADE"), nullable=False
+    )
+    # Order the adults were listed in by the parent
+    position: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    email: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
+    phone_num: Mapped[Optional[str]] = mapped_column(String(20), nullable=True)
+    address: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+
+    # Relationships
+    kid: Mapped[Kid] = relationship("Kid", back_populates="trusted_adults")
+
+    __table_args__ = (
+        Index("ix_trusted_adults_kid_id_position", "kid_id", "position"),
+        # Which kids may this adult pick up
+        Index("ix_trusted_adults_phone_num", "phone_num"),
+        Index("ix_trusted_adults_email", "email"),
+    )
+
+    def __repr__(self):
+        return f"<TrustedAdult(id={self.id}, kid_id={self.kid_id}, name='{self.name}')>"
+
+
 class KidAbsence(Base):
     """Kid absence model for tracking daily absences."""
 
@@ -125,7 +175,57 @@ class KidAbsence(Base):
 
     __table_args__ = (
         UniqueConstraint("kid_id", "date", name="uq_kid_absences_kid_date"),
+        # Daycare/group range queries scan by date, then join kids
+        Index("ix_kid_absences_date_kid_id", "date", "kid_id"),
     )
 
     def __repr__(self):
         return f"<KidAbsence(id={self.id}, kid_id={self.kid_id}, date='{self.date}', reason='{self.reason}')>"
+
+
+class KidAttendanceEntry(Base):
+    """Append-only ledger of attendance changes, one or more rows per kid per day.
+
+    The latest entry for a kid on a date is that day's status, so history is
+    read with a range scan on (daycare_id, date) instead of being rebuilt.
+    """
+
+    __tablename__ = "kid_attendance_ledger"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    kid_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("kids.id", ondelete="CASCADE"), nullable=False
+    )
+    daycare_id: Mapped[str] = mapped_column(
+        UUID(as_uuid=False),
+        ForeignKey("daycares.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    date: Mapped[date] = mapped_column(Date, nullable=False)
+    status: Mapped[AttendanceStatus] = mapped_column(
+        Enum(
+            AttendanceStatus,
+            name="attendance_status",
+            values_callable=lambda obj: [e.value for e in obj],
+        ),
+        nullable=False,
+    )
+    source: Mapped[AttendanceSource] = mapped_column(
+        Enum(
+            AttendanceSource,
+            name="attendance_source",
+            values_callable=lambda obj: [e.value for e in obj],
+        ),
+        nullable=False,
+    )
+    recorded_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_kid_attendance_ledger_daycare_date", "daycare_id", "date"),
+        Index("ix_kid_attendance_ledger_kid_date", "kid_id", "date"),
+    )
+
+    def __repr__(self):
+        return f"<KidAttendanceEntry(kid_id={self.kid_id}, date='{self.date}', status='{self.status}')>"
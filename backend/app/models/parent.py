@@ -1,9 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -23,11 +23,16 @@ class Parent(Base):
     full_name: Mapped[str] = mapped_column(String(100), nullable=False)
     email: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
     phone_num: Mapped[str] = mapped_column(String(20), nullable=False)
+    password_hash: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     daycare_id: Mapped[str] = mapped_column(
         UUID(as_uuid=False),
         ForeignKey("daycares.id", ondelete="CASCADE"),
         nullable=False,
     )
+    # Bumped whenever the daycare changes, so refresh can reuse claims until then
+    claims_version: Mapped[int] = mapped_column(
+        Integer, default=0, server_default="0", nullable=False
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime, default=func.now(), nullable=False
     )
@@ -41,5 +46,10 @@ class Parent(Base):
         "Kid", secondary="parent_kids", back_populates="parents"
     )
 
+    __table_args__ = (
+        # Keyset pagination of list endpoints: (daycare_id, full_name, id)
+        Index("ix_parents_daycare_full_name_id", "daycare_id", "full_name", "id"),
+    )
+
     def __repr__(self):
         return f"<Parent(id={self.id}, full_name='{self.full_name}', email='{self.email}')>"
@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import JSON, DateTime, Integer, String, func
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class RefreshToken(Base):
+    """
+    One refresh token in a rotation family.
+
+    Each use marks the token used and issues a successor in the same family;
+    presenting a used token again revokes the whole family. The access token
+    claims are stored with the token so renewing does not rebuild them.
+    """
+
+    __tablename__ = "refresh_tokens"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    family_id: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    # SHA-256 of the raw token; the raw token is never stored
+    token_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    user_type: Mapped[str] = mapped_column(String(16), nullable=False)
+    user_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    claims: Mapped[Dict[str, Any]] = mapped_column(JSON, nullable=False)
+    # The subject's claims_version the claims were built from
+    claims_version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Set at login and copied to every successor, so rotation never extends it
+    expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    used_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    revoked_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime, default=func.now(), nullable=False
+    )
+
+    def __repr__(self):
+        return f"<RefreshToken(id={self.id}, family_id='{self.family_id}', user_type='{self.user_type}', user_id={self.user_id})>"
@@ -13,7 +13,6 @@ class EventBase(BaseModel):
         None, pattern=r"^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$"
     )
     location: Optional[str] = Field(None, max_length=255)
-    is_past: bool = False
 
 
 class EventCreate(EventBase):
@@ -28,11 +27,12 @@ class EventUpdate(BaseModel):
         None, pattern=r"^([0-1]?[0-9]|2[0-3]):[0-5][0-9]$"
     )
     location: Optional[str] = Field(None, max_length=255)
-    is_past: Optional[bool] = None
 
 
 class Event(EventBase):
     id: int
+    # Derived from date, not stored
+    is_past: bool
     created_at: datetime
     updated_at: Optional[datetime] = None
     images: List["EventImage"] = []
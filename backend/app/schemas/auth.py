@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel
 
@@ -8,6 +8,17 @@ class DevLoginRequest(BaseModel):
     parent_id: Optional[str] = None
 
 
+class LoginRequest(BaseModel):
+    email: str
+    password: str
+    account_type: Literal["educator", "parent"] = "educator"
+
+
 class TokenResponse(BaseModel):
     access_token: str
     token_type: str = "bearer"
+    refresh_token: Optional[str] = None
+
+
+class RefreshRequest(BaseModel):
+    refresh_token: str
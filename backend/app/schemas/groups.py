@@ -1,3 +1,5 @@
+from typing import List
+
 from pydantic import BaseModel
 
 
@@ -8,3 +10,23 @@ class GroupOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class KidAttendanceUpdate(BaseModel):
+    kid_id: int
+    attendance: str
+
+
+class GroupAttendanceUpdateRequest(BaseModel):
+    updates: List[KidAttendanceUpdate]
+
+
+class KidAttendanceResult(BaseModel):
+    kid_id: int
+    attendance: str
+    updated: bool
+
+
+class GroupAttendanceUpdateOut(BaseModel):
+    group_id: int
+    results: List[KidAttendanceResult]
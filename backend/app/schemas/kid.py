@@ -1,9 +1,9 @@
 from datetime import date, datetime
 from typing import List, Optional, Union
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
-from app.models.kid import AbsenceReason, AttendanceStatus
+from app.models.kid import AbsenceReason, AttendanceSource, AttendanceStatus
 from app.schemas.parents import ParentOut
 
 
@@ -13,6 +13,9 @@ class TrustedAdultOut(BaseModel):
     phone_num: Optional[str] = None
     address: Optional[str] = None
 
+    class Config:
+        from_attributes = True
+
 
 class KidBase(BaseModel):
     full_name: str
@@ -48,12 +51,34 @@ class KidOut(KidBase):
         from_attributes = True
 
 
+class KidSummaryOut(BaseModel):
+    """Roster row without the detail columns (GET /kids?view=summary)."""
+
+    id: Union[str, int]
+    full_name: str
+    group_id: Union[str, int]
+    daycare_id: Union[str, int]
+    attendance: AttendanceStatus
+
+    class Config:
+        from_attributes = True
+
+
 class KidAbsenceCreate(BaseModel):
     date: date
     reason: AbsenceReason
     note: Optional[str] = None
 
 
+class KidAbsenceRangeCreate(BaseModel):
+    kid_ids: List[int] = Field(..., min_length=1)
+    start_date: date
+    end_date: Optional[date] = None
+    reason: AbsenceReason
+    note: Optional[str] = None
+    include_weekends: bool = False
+
+
 class KidAbsenceOut(BaseModel):
     id: str
     kid_id: int
@@ -65,3 +90,52 @@ class KidAbsenceOut(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+class KidAttendanceEntryOut(BaseModel):
+    kid_id: int
+    date: date
+    status: AttendanceStatus
+    source: AttendanceSource
+    recorded_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class KidAbsenceConflict(BaseModel):
+    kid_id: int
+    date: date
+
+
+class KidAbsenceRangeOut(BaseModel):
+    created: List[KidAbsenceOut]
+    conflicts: List[KidAbsenceConflict]
+
+
+class PickupPassCreate(BaseModel):
+    adult_name: str
+
+
+class PickupPassOut(BaseModel):
+    token: str
+    kid_id: int
+    adult_name: str
+    expires_at: datetime
+
+
+class PickupPassVerifyRequest(BaseModel):
+    token: str
+
+
+class PickupPassVerification(BaseModel):
+    valid: bool
+    reason: Optional[str] = None
+    kid_id: Optional[int] = None
+    adult_name: Optional[str] = None
+    expires_at: Optional[datetime] = None
+
+
+class PickupPassKeyOut(BaseModel):
+    algorithm: str = "Ed25519"
+    public_key: str
@@ -0,0 +1,141 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from datetime import date
+from typing import Any, Deque, Dict, List, NamedTuple, Optional, Set, Tuple
+
+
+@dataclass(frozen=True)
+class AttendanceChange:
+    """A committed attendance or absence change, as pushed to live boards."""
+
+    seq: int
+    kind: str  # attendance | absence
+    daycare_id: str
+    group_id: int
+    kid_id: int
+    attendance: str
+    date: str
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+class ChangeBatch(NamedTuple):
+    """Changes for one subscriber plus the cursor to resume from."""
+
+    changes: List[AttendanceChange]
+    last_seq: int
+    reset: bool  # True when the client missed changes and must re-fetch
+
+
+class AttendanceHub:
+    """
+    In-process pub/sub hub for attendance changes.
+
+    Writers publish after their transaction commits. Changes are kept in a
+    bounded ring buffer with a process-wide sequence number, so SSE streams and
+    long-poll clients can resume from the last sequence they saw. Waiters are
+    woken through their own event loop, which lets sync endpoints running in
+    the thread pool publish safely.
+    """
+
+    def __init__(self, buffer_size: int = 1000):
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._buffer: Deque[AttendanceChange] = deque(maxlen=buffer_size)
+        self._waiters: Set[Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = set()
+
+    @property
+    def last_seq(self) -> int:
+        return self._seq
+
+    def publish(
+        self,
+        kind: str,
+        daycare_id: str,
+        group_id: int,
+        kid_id: int,
+        attendance: str,
+        target_date: date,
+    ) -> AttendanceChange:
+        """Record a change and wake every waiting subscriber."""
+        with self._lock:
+            self._seq += 1
+            change = AttendanceChange(
+                seq=self._seq,
+                kind=kind,
+                daycare_id=str(daycare_id),
+                group_id=group_id,
+                kid_id=kid_id,
+                attendance=attendance,
+                date=target_date.isoformat(),
+            )
+            self._buffer.append(change)
+            waiters = list(self._waiters)
+
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # Loop already closed; its waiter is discarded on exit
+                pass
+        return change
+
+    def changes_since(
+        self, since: int, daycare_id: str, group_id: Optional[int] = None
+    ) -> ChangeBatch:
+        """
+        Return buffered changes after `since` for a daycare (and group).
+
+        `reset` is set when changes after `since` have already been evicted
+        from the buffer, meaning the client must re-fetch the full roster.
+        """
+        with self._lock:
+            buffered = list(self._buffer)
+            last_seq = self._seq
+
+        # A cursor ahead of the hub means the process restarted
+        reset = since > last_seq or (bool(buffered) and since < buffered[0].seq - 1)
+        changes = [
+            change
+            for change in buffered
+            if change.seq > since
+            and change.daycare_id == str(daycare_id)
+            and (group_id is None or change.group_id == group_id)
+        ]
+        return ChangeBatch(changes, last_seq, reset)
+
+    async def wait_for_changes(
+        self,
+        since: int,
+        daycare_id: str,
+        group_id: Optional[int] = None,
+        timeout: float = 25.0,
+    ) -> ChangeBatch:
+        """Wait up to `timeout` seconds for changes after `since`."""
+        loop = asyncio.get_running_loop()
+        deadline = time.monotonic() + timeout
+        while True:
+            event = asyncio.Event()
+            waiter = (loop, event)
+            with self._lock:
+                self._waiters.add(waiter)
+            try:
+                batch = self.changes_since(since, daycare_id, group_id)
+                remaining = deadline - time.monotonic()
+                if batch.changes or batch.reset or remaining <= 0:
+                    return batch
+                try:
+                    await asyncio.wait_for(event.wait(), remaining)
+                except asyncio.TimeoutError:
+                    return self.changes_since(since, daycare_id, group_id)
+            finally:
+                with self._lock:
+                    self._waiters.discard(waiter)
+
+
+# Create global instance
+attendance_hub = AttendanceHub()
@@ -0,0 +1,468 @@
+import hashlib
+import math
+import secrets
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple, Union
+
+from fastapi import HTTPException, status
+from sqlalchemy import and_, delete, event, func, inspect, or_, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.models.associations import educator_groups
+from app.models.educator import Educator
+from app.models.group import Group
+from app.models.parent import Parent
+from app.models.refresh_token import RefreshToken
+from app.models.revoked_token import RevokedToken
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings (no false negatives)."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        self.capacity = capacity
+        self._size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self._hashes = max(1, round(self._size / capacity * math.log(2)))
+        self._bits = bytearray((self._size + 7) // 8)
+
+    def _positions(self, item: str) -> Iterator[int]:
+        # Double hashing: k positions from two 64-bit halves of one digest
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return ((h1 + i * h2) % self._size for i in range(self._hashes))
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+
+def token_id(payload: Dict[str, Any], token: str) -> str:
+    """The token's jti, or a digest of the raw token for tokens issued without one."""
+    return payload.get("jti") or hashlib.sha256(token.encode()).hexdigest()
+
+
+class RevocationStore:
+    """
+    In-process mirror of the revoked_tokens table.
+
+    Per-request checks go to a Bloom filter first, so the common (not revoked)
+    case is a few bit tests, and only filter hits consult the exact set. Other
+    processes' revocations are picked up by pulling rows with a higher id than
+    the last one seen, at most once per `refresh_interval` seconds.
+
+    Concurrent revocations can commit out of id order, so an id skipped over
+    by a refresh may still appear. Skipped ids are read again on every refresh
+    until they do, or until `gap_timeout` seconds have passed (ids consumed by
+    a rolled-back insert never appear). The first load only tracks the
+    `gap_window` ids below the newest; anything older was settled long ago.
+    """
+
+    def __init__(
+        self,
+        refresh_interval: float = 5.0,
+        capacity: int = 100_000,
+        gap_timeout: float = 300.0,
+        gap_window: int = 100,
+    ):
+        self.refresh_interval = refresh_interval
+        self.capacity = capacity
+        self.gap_timeout = gap_timeout
+        self.gap_window = gap_window
+        self._lock = threading.Lock()
+        self._expiry: Dict[str, datetime] = {}
+        self._bloom = BloomFilter(capacity)
+        self._stale = 0  # pruned entries whose bits are still set
+        self._last_id = 0
+        self._gaps: Dict[int, float] = {}  # unseen id -> when to stop looking
+        self._next_refresh = 0.0
+
+    def is_revoked(self, jti: str) -> bool:
+        if jti not in self._bloom:
+            return False
+        return jti in self._expiry
+
+    def revoke(self, db: Session, jti: str, expires_at: datetime) -> None:
+        """Persist a revocation and apply it to this process immediately."""
+        db.add(RevokedToken(jti=jti, expires_at=expires_at))
+        try:
+            db.commit()
+        except IntegrityError:
+            # Already revoked (e.g. a repeated logout)
+            db.rollback()
+        with self._lock:
+            self._add_all([(jti, expires_at)])
+
+    def refresh(self, db: Session, force: bool = False) -> None:
+        """Pull revocations made by other processes since the last refresh."""
+        now = time.monotonic()
+        with self._lock:
+            if not force and now < self._next_refresh:
+                return
+            self._next_refresh = now + self.refresh_interval
+            last_id = self._last_id
+            gaps = list(self._gaps)
+
+        condition = RevokedToken.id > last_id
+        if gaps:
+            condition = or_(condition, RevokedToken.id.in_(gaps))
+        rows = db.execute(
+            select(RevokedToken.id, RevokedToken.jti, RevokedToken.expires_at)
+            .where(condition)
+            .order_by(RevokedToken.id)
+        ).all()
+
+        with self._lock:
+            if rows:
+                self._add_all((row.jti, row.expires_at) for row in rows)
+                seen = {row.id for row in rows}
+                for row_id in seen:
+                    self._gaps.pop(row_id, None)
+                if rows[-1].id > self._last_id:
+                    deadline = now + self.gap_timeout
+                    first = self._last_id or max(0, rows[-1].id - self.gap_window)
+                    for row_id in range(first + 1, rows[-1].id):
+                        if row_id not in seen:
+                            self._gaps[row_id] = deadline
+                    self._last_id = rows[-1].id
+            self._gaps = {
+                row_id: deadline
+                for row_id, deadline in self._gaps.items()
+                if deadline > now
+            }
+            self._prune()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._expiry.clear()
+            self._bloom = BloomFilter(self.capacity)
+            self._stale = 0
+            self._last_id = 0
+            self._gaps.clear()
+            self._next_refresh = 0.0
+
+    def _add_all(self, entries: Iterable[Tuple[str, datetime]]) -> None:
+        for jti, expires_at in entries:
+            self._expiry[jti] = expires_at
+            self._bloom.add(jti)
+        if len(self._expiry) > self._bloom.capacity:
+            self._rebuild()
+
+    def _prune(self) -> None:
+        """Forget revocations of tokens that have expired anyway."""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        expired = [jti for jti, expires_at in self._expiry.items() if expires_at <= now]
+        for jti in expired:
+            del self._expiry[jti]
+        # Bloom filters cannot delete; rebuild once most bits are stale
+        self._stale += len(expired)
+        if self._stale > len(self._expiry):
+            self._rebuild()
+
+    def _rebuild(self) -> None:
+        capacity = max(self.capacity, 2 * len(self._expiry))
+        self._bloom = BloomFilter(capacity)
+        self._stale = 0
+        for jti in self._expiry:
+            self._bloom.add(jti)
+
+
+# Create global instance
+revocation_store = RevocationStore(settings.token_revocation_refresh_seconds)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def purge_expired_revocations(db: Session) -> int:
+    """
+    Delete revoked_tokens rows whose tokens have expired anyway.
+
+    Stores forget such revocations on their own (see `_prune`), so the rows
+    only slow every worker's refresh. Returns the number of rows deleted.
+    """
+    result = db.execute(
+        delete(RevokedToken).where(RevokedToken.expires_at <= _utcnow())
+    )
+    db.commit()
+    return result.rowcount
+
+
+def _hash_refresh_token(raw: str) -> str:
+    return hashlib.sha256(raw.encode()).hexdigest()
+
+
+def educator_claims(educator: Educator) -> Dict[str, Any]:
+    """Access token claims for an educator (reads educator.groups)."""
+    return {
+        "sub": str(educator.id),
+        "role": "educator" if educator.role == "educator" else "super_educator",
+        "daycare_id": str(educator.daycare_id),
+        "groups": [group.name for group in educator.groups],
+    }
+
+
+def parent_claims(parent: Parent) -> Dict[str, Any]:
+    """Access token claims for a parent (parents have no groups)."""
+    return {
+        "sub": str(parent.id),
+        "role": "parent",
+        "daycare_id": str(parent.daycare_id),
+        "groups": [],
+    }
+
+
+def issue_refresh_token(
+    db: Session,
+    user_type: str,
+    user_id: int,
+    claims: Dict[str, Any],
+    claims_version: int = 0,
+    family_id: Optional[str] = None,
+    expires_at: Optional[datetime] = None,
+) -> str:
+    """
+    Add a refresh token to the session and return the raw token.
+
+    A new family is started unless `family_id` is given, in which case
+    `expires_at` should be the family's expiry. The caller commits.
+    """
+    raw = secrets.token_urlsafe(32)
+    if expires_at is None:
+        expires_at = _utcnow() + timedelta(days=settings.refresh_token_expire_days)
+    db.add(
+        RefreshToken(
+            family_id=family_id or uuid.uuid4().hex,
+            token_hash=_hash_refresh_token(raw),
+            user_type=user_type,
+            user_id=user_id,
+            claims=claims,
+            claims_version=claims_version,
+            expires_at=expires_at,
+        )
+    )
+    return raw
+
+
+def find_login_account(
+    db: Session, account_type: str, email: str
+) -> Optional[Union[Educator, Parent]]:
+    """Look up an educator or parent account by email for credential login."""
+    model = Educator if account_type == "educator" else Parent
+    return db.query(model).filter(model.email == email).first()
+
+
+def complete_login(
+    db: Session,
+    account: Union[Educator, Parent],
+    new_password_hash: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Issue an access and refresh token for an authenticated account.
+
+    Args:
+        db: Database session
+        account: The educator or parent who logged in
+        new_password_hash: Rehashed password to store, if its cost changed
+
+    Returns:
+        Token response payload
+    """
+    if new_password_hash:
+        account.password_hash = new_password_hash
+    if isinstance(account, Educator):
+        claims = educator_claims(account)
+        refresh_token = issue_refresh_token(
+            db, "educator", account.id, claims, claims_version=account.claims_version
+        )
+    else:
+        claims = parent_claims(account)
+        refresh_token = issue_refresh_token(
+            db, "parent", account.id, claims, claims_version=account.claims_version
+        )
+    db.commit()
+    return {
+        "access_token": create_access_token(claims),
+        "token_type": "bearer",
+        "refresh_token": refresh_token,
+    }
+
+
+def _revoke_family(db: Session, family_id: str) -> None:
+    db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=_utcnow())
+    )
+    db.commit()
+
+
+def _invalid_refresh_token() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token"
+    )
+
+
+def rotate_refresh_token(db: Session, raw: str) -> Tuple[str, str]:
+    """
+    Exchange a refresh token for a new access token and refresh token.
+
+    The token, its subject and the subject's claims_version are read in one
+    statement on indexed keys. Claims are reused from the token unless the
+    subject's claims_version moved since they were built. Successors keep the
+    family's expiry, so a family ends `refresh_token_expire_days` after login
+    however often it is used. Reusing an already rotated token revokes its
+    whole family.
+
+    Args:
+        db: Database session
+        raw: Refresh token presented by the client
+
+    Returns:
+        Tuple of (access_token, refresh_token)
+
+    Raises:
+        HTTPException: If the token is unknown, expired, reused or revoked
+    """
+    row = db.execute(
+        select(
+            RefreshToken,
+            func.coalesce(Educator.claims_version, Parent.claims_version),
+            func.coalesce(Educator.id, Parent.id).label("subject_id"),
+        )
+        .outerjoin(
+            Educator,
+            and_(
+                RefreshToken.user_type == "educator",
+                Educator.id == RefreshToken.user_id,
+            ),
+        )
+        .outerjoin(
+            Parent,
+            and_(RefreshToken.user_type == "parent", Parent.id == RefreshToken.user_id),
+        )
+        .where(RefreshToken.token_hash == _hash_refresh_token(raw))
+    ).first()
+    if row is None:
+        raise _invalid_refresh_token()
+
+    token, claims_version, subject_id = row
+    now = _utcnow()
+    if token.revoked_at is not None or token.expires_at <= now:
+        raise _invalid_refresh_token()
+    if token.used_at is not None or subject_id is None:
+        # Replayed token (likely stolen) or deleted user: end the family
+        _revoke_family(db, token.family_id)
+        raise _invalid_refresh_token()
+
+    # Claim the token; losing a concurrent race counts as reuse
+    claimed = db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == token.id, RefreshToken.used_at.is_(None))
+        .values(used_at=now)
+    )
+    if claimed.rowcount != 1:
+        db.rollback()
+        _revoke_family(db, token.family_id)
+        raise _invalid_refresh_token()
+
+    claims = dict(token.claims)
+    if claims_version != token.claims_version:
+        if token.user_type == "educator":
+            claims = educator_claims(db.get(Educator, token.user_id))
+        else:
+            claims = parent_claims(db.get(Parent, token.user_id))
+
+    refresh_token = issue_refresh_token(
+        db,
+        token.user_type,
+        token.user_id,
+        claims,
+        claims_version=claims_version or 0,
+        family_id=token.family_id,
+        expires_at=token.expires_at,
+    )
+    db.commit()
+    return create_access_token(claims), refresh_token
+
+
+def revoke_refresh_token_family(db: Session, raw: str) -> None:
+    """Revoke the family a refresh token belongs to (used on logout)."""
+    family_id = db.scalar(
+        select(RefreshToken.family_id).where(
+            RefreshToken.token_hash == _hash_refresh_token(raw)
+        )
+    )
+    if family_id is not None:
+        _revoke_family(db, family_id)
+
+
+# Changes to these columns alter the claims built from the row
+_EDUCATOR_CLAIM_FIELDS = ("role", "daycare_id", "groups")
+_PARENT_CLAIM_FIELDS = ("daycare_id",)
+
+
+def _claims_changed(obj, fields: Tuple[str, ...]) -> bool:
+    attrs = inspect(obj).attrs
+    return any(attrs[field].history.has_changes() for field in fields)
+
+
+@event.listens_for(Session, "before_flush")
+def _bump_claims_version(session: Session, flush_context, instances) -> None:
+    """
+    Bump claims_version when anything an access token carries changes.
+
+    Covers an educator's role, daycare and groups (including a group being
+    renamed or deleted) and a parent's daycare.
+    """
+    accounts = set()
+    stale_groups = set()
+    for obj in session.dirty:
+        if isinstance(obj, Educator):
+            if _claims_changed(obj, _EDUCATOR_CLAIM_FIELDS):
+                accounts.add(obj)
+        elif isinstance(obj, Parent):
+            if _claims_changed(obj, _PARENT_CLAIM_FIELDS):
+                accounts.add(obj)
+        elif isinstance(obj, Group):
+            history = inspect(obj).attrs.educators.history
+            accounts.update(history.added)
+            accounts.update(history.deleted)
+            if inspect(obj).attrs.name.history.has_changes():
+                stale_groups.add(obj.id)
+    for obj in session.new:
+        if isinstance(obj, Group):
+            accounts.update(obj.educators)
+    stale_groups.update(obj.id for obj in session.deleted if isinstance(obj, Group))
+
+    for account in accounts:
+        if account not in session.new:
+            account.claims_version = (account.claims_version or 0) + 1
+    if stale_groups:
+        # Renamed or deleted groups: bump their members without loading them
+        session.connection().execute(
+            update(Educator)
+            .where(
+                Educator.id.in_(
+                    select(educator_groups.c.educator_id).where(
+                        educator_groups.c.group_id.in_(stale_groups)
+                    )
+                )
+            )
+            .values(claims_version=Educator.claims_version + 1)
+        )
@@ -0,0 +1,148 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Set, Tuple
+
+from sqlalchemy import event, exists, inspect, select
+from sqlalchemy.orm import Session
+
+from app.models.associations import parent_kids
+from app.models.kid import Kid
+from app.models.parent import Parent
+
+
+class ParentLinkCache:
+    """
+    Bounded TTL/LRU cache of parent↔kid link checks.
+
+    `is_parent_of` only caches positive answers, so a newly linked parent is
+    let in straight away, whichever process made the link. Entries are
+    dropped as soon as an ORM flush touches the parent or kid involved (see
+    `_collect_link_changes` below), so the TTL only bounds how long a link
+    removed by raw SQL or another worker keeps being honoured.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 60.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Tuple[int, int], Tuple[float, bool]]" = (
+            OrderedDict()
+        )
+
+    def get(self, parent_id: int, kid_id: int) -> Optional[bool]:
+        """Return the cached answer, or None if absent or expired."""
+        key = (parent_id, kid_id)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, linked = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return linked
+
+    def set(self, parent_id: int, kid_id: int, linked: bool) -> None:
+        with self._lock:
+            self._entries[(parent_id, kid_id)] = (time.monotonic() + self.ttl, linked)
+            self._entries.move_to_end((parent_id, kid_id))
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self, parent_ids: Set[int] = frozenset(), kid_ids: Set[int] = frozenset()
+    ) -> None:
+        """Drop every entry involving one of the given parents or kids."""
+        if not parent_ids and not kid_ids:
+            return
+        with self._lock:
+            stale = [
+                key
+                for key in self._entries
+                if key[0] in parent_ids or key[1] in kid_ids
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Create global instance
+parent_link_cache = ParentLinkCache()
+
+
+def is_parent_of(db: Session, parent_id: int, kid_id: int) -> bool:
+    """
+    Check whether a parent is linked to a kid.
+
+    Answers from the per-process cache when possible, otherwise with a single
+    EXISTS on parent_kids, without loading either side of the relationship.
+    Only links are cached; a missing link is looked up again every time.
+
+    Args:
+        db: Database session
+        parent_id: ID of the parent
+        kid_id: ID of the kid
+
+    Returns:
+        True if the parent is linked to the kid, False otherwise
+    """
+    linked = parent_link_cache.get(parent_id, kid_id)
+    if linked is not None:
+        return linked
+
+    linked = db.scalar(
+        select(
+            exists().where(
+                parent_kids.c.parent_id == parent_id,
+                parent_kids.c.kid_id == kid_id,
+            )
+        )
+    )
+    if linked:
+        parent_link_cache.set(parent_id, kid_id, True)
+    return bool(linked)
+
+
+_PENDING_KEY = "parent_link_changes"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_link_changes(session: Session, flush_context) -> None:
+    """Invalidate cached links for parents/kids whose links were flushed."""
+    parent_ids: Set[int] = set()
+    kid_ids: Set[int] = set()
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        if isinstance(obj, Parent):
+            ids, collection = parent_ids, "kids"
+        elif isinstance(obj, Kid):
+            ids, collection = kid_ids, "parents"
+        else:
+            continue
+        state = inspect(obj)
+        if obj in session.deleted or state.attrs[collection].history.has_changes():
+            ids.add(obj.id)
+
+    if parent_ids or kid_ids:
+        parent_link_cache.invalidate(parent_ids, kid_ids)
+        # Invalidate again on commit, in case a concurrent request cached the
+        # pre-commit state in between
+        pending = session.info.setdefault(_PENDING_KEY, (set(), set()))
+        pending[0].update(parent_ids)
+        pending[1].update(kid_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_link_changes(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        parent_link_cache.invalidate(*pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_link_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,356 @@
+"""
+iCalendar (RFC 5545) feeds of a daycare's events.
+
+Calendar clients poll a subscribed feed every few minutes, so rendered feeds
+are kept in a per-process cache and only rebuilt after an event of that
+daycare is written (see `_collect_feed_changes` below). A feed is rendered
+once into chunks of bytes that responses stream without copying.
+
+Calendar apps cannot send a bearer token, so each daycare's feed URL carries
+a secret instead. Only its SHA-256 is stored; issuing a new one (see
+`rotate_feed_token`) cuts off every subscription made with the old one.
+"""
+
+import hashlib
+import hmac
+import secrets
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, List, NamedTuple, Optional, Set, Tuple
+
+from sqlalchemy import event, func, select, update
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.models.daycare import Daycare
+from app.models.event import Event, event_start
+
+PRODID = "-//Daycare App//Events//EN"
+
+# VEVENTs rendered into one chunk of the cached body
+EVENTS_PER_CHUNK = 500
+
+# RFC 5545 §3.1: lines longer than 75 octets are folded
+_MAX_LINE_OCTETS = 75
+
+
+class CalendarFeed(NamedTuple):
+    etag: str
+    last_modified: datetime
+    chunks: Tuple[bytes, ...]
+
+
+class CalendarFeedCache:
+    """
+    Bounded TTL/LRU cache of rendered feeds, keyed by daycare ID.
+
+    Entries are dropped as soon as an ORM flush touches one of the daycare's
+    events, so the TTL only bounds staleness from writes this process cannot
+    see: raw SQL and other workers.
+    """
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, CalendarFeed]]" = OrderedDict()
+        # Bumped on every invalidation so a feed rendered from older data
+        # is not stored over it
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    def get(self, daycare_id: str) -> Optional[CalendarFeed]:
+        """Return the cached feed, or None if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(daycare_id)
+            if entry is None:
+                return None
+            expires_at, feed = entry
+            if expires_at <= time.monotonic():
+                del self._entries[daycare_id]
+                return None
+            self._entries.move_to_end(daycare_id)
+            return feed
+
+    def set(self, daycare_id: str, feed: CalendarFeed, generation: int) -> None:
+        """Store a feed unless an invalidation happened since `generation`."""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[daycare_id] = (time.monotonic() + self.ttl, feed)
+            self._entries.move_to_end(daycare_id)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, daycare_ids: Set[str]) -> None:
+        if not daycare_ids:
+            return
+        with self._lock:
+            self._generation += 1
+            for daycare_id in daycare_ids:
+                self._entries.pop(daycare_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+
+# Create global instance
+calendar_feed_cache = CalendarFeedCache()
+
+
+def _escape(value: str) -> str:
+    """Escape a TEXT value (RFC 5545 §3.3.11)."""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold(line: str) -> str:
+    """Fold a content line at 75 octets without splitting a UTF-8 character."""
+    encoded = line.encode()
+    if len(encoded) <= _MAX_LINE_OCTETS:
+        return line + "\r\n"
+    parts = []
+    current, size = [], 0
+    # Continuation lines start with a space, which counts towards the limit
+    limit = _MAX_LINE_OCTETS
+    for char in line:
+        width = len(char.encode())
+        if size + width > limit:
+            parts.append("".join(current))
+            current, size, limit = [], 0, _MAX_LINE_OCTETS - 1
+        current.append(char)
+        size += width
+    parts.append("".join(current))
+    return "\r\n ".join(parts) + "\r\n"
+
+
+def _aware(value: datetime) -> datetime:
+    """Read a naive timestamp as UTC."""
+    return value if value.tzinfo is not None else value.replace(tzinfo=timezone.utc)
+
+
+def _utc(value: datetime) -> str:
+    """Format a naive-UTC (or aware) datetime as an iCalendar UTC DATE-TIME."""
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime("%Y%m%dT%H%M%SZ")
+
+
+def render_event(daycare_id: str, row) -> str:
+    """Render one event row as a VEVENT."""
+    stamp = row.updated_at or row.created_at or row.date
+    start, all_day = event_start(row.date, row.start_time)
+    if all_day:
+        dtstart = f"DTSTART;VALUE=DATE:{start:%Y%m%d}"
+    else:
+        dtstart = f"DTSTART:{_utc(start)}"
+    lines = [
+        "BEGIN:VEVENT",
+        f"UID:event-{row.id}@{daycare_id}",
+        f"DTSTAMP:{_utc(stamp)}",
+        dtstart,
+        f"SUMMARY:{_escape(row.title)}",
+    ]
+    if row.description:
+        lines.append(f"DESCRIPTION:{_escape(row.description)}")
+    if row.location:
+        lines.append(f"LOCATION:{_escape(row.location)}")
+    if row.created_at:
+        lines.append(f"CREATED:{_utc(row.created_at)}")
+    if row.updated_at:
+        lines.append(f"LAST-MODIFIED:{_utc(row.updated_at)}")
+    lines.append("END:VEVENT")
+    return "".join(_fold(line) for line in lines)
+
+
+def _render_chunks(daycare_name: str, daycare_id: str, rows: Iterable) -> List[bytes]:
+    header = "".join(
+        _fold(line)
+        for line in (
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            f"PRODID:{PRODID}",
+            "CALSCALE:GREGORIAN",
+            "METHOD:PUBLISH",
+            f"X-WR-CALNAME:{_escape(daycare_name)}",
+        )
+    )
+    chunks = []
+    pending = [header]
+    for count, row in enumerate(rows, 1):
+        pending.append(render_event(daycare_id, row))
+        if count % EVENTS_PER_CHUNK == 0:
+            chunks.append("".join(pending).encode())
+            pending = []
+    pending.append("END:VCALENDAR\r\n")
+    chunks.append("".join(pending).encode())
+    return chunks
+
+
+def get_calendar_feed(db: Session, daycare_id: str) -> Optional[CalendarFeed]:
+    """
+    Get a daycare's feed, rendering it only on a cache miss.
+
+    On a miss, events are read with one ordered SELECT whose rows are fetched
+    in batches, so a long history is never held as ORM objects. Last-Modified
+    is the newest event write or deletion, so it only moves when the events
+    do, whichever process rebuilds the feed.
+
+    Args:
+        db: Database session
+        daycare_id: Daycare whose events are published
+
+    Returns:
+        The feed, or None if the daycare does not exist
+    """
+    feed = calendar_feed_cache.get(daycare_id)
+    if feed is not None:
+        return feed
+
+    generation = calendar_feed_cache.generation
+    daycare = db.execute(
+        select(
+            Daycare.name,
+            Daycare.created_at,
+            Daycare.events_deleted_at,
+            select(func.max(Event.created_at))
+            .where(Event.daycare_id == daycare_id)
+            .scalar_subquery(),
+            select(func.max(Event.updated_at))
+            .where(Event.daycare_id == daycare_id)
+            .scalar_subquery(),
+        ).where(Daycare.id == daycare_id)
+    ).one_or_none()
+    if daycare is None:
+        return None
+    daycare_name, created_at, *changed = daycare
+    # A daycare that never had events dates from its own creation
+    last_modified = max(
+        (_aware(value) for value in changed if value is not None),
+        default=_aware(created_at),
+    )
+
+    rows = db.execute(
+        select(
+            Event.id,
+            Event.title,
+            Event.description,
+            Event.date,
+            Event.start_time,
+            Event.location,
+            Event.created_at,
+            Event.updated_at,
+        )
+        .where(Event.daycare_id == daycare_id)
+        .order_by(Event.date, Event.id)
+        .execution_options(yield_per=EVENTS_PER_CHUNK)
+    )
+    chunks = _render_chunks(daycare_name, daycare_id, rows)
+
+    digest = hashlib.sha1()
+    for chunk in chunks:
+        digest.update(chunk)
+    feed = CalendarFeed(
+        etag=f'"{digest.hexdigest()}"',
+        last_modified=last_modified.replace(microsecond=0),
+        chunks=tuple(chunks),
+    )
+    calendar_feed_cache.set(daycare_id, feed, generation)
+    return feed
+
+
+def _hash_feed_token(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def rotate_feed_token(db: Session, daycare_id: str) -> str:
+    """Issue a new feed secret for a daycare, replacing the old one, and return it."""
+    token = secrets.token_urlsafe(32)
+    daycare = db.get(Daycare, daycare_id)
+    daycare.calendar_token_hash = _hash_feed_token(token)
+    db.commit()
+    return token
+
+
+def feed_token_matches(db: Session, daycare_id: str, token: Optional[str]) -> bool:
+    """
+    Check a feed secret against the daycare's stored hash in constant time.
+
+    False for unknown daycares and for daycares that were never issued one.
+    """
+    try:
+        uuid.UUID(daycare_id)
+    except ValueError:
+        # Not a UUID, so it cannot match (and must not reach a UUID column)
+        return False
+    stored = db.scalar(
+        select(Daycare.calendar_token_hash).where(Daycare.id == daycare_id)
+    )
+    if stored is None or not token:
+        return False
+    return hmac.compare_digest(stored, _hash_feed_token(token))
+
+
+def iter_feed(feed: CalendarFeed) -> Iterator[bytes]:
+    """Body of a feed response, one cached chunk at a time."""
+    yield from feed.chunks
+
+
+def record_event_deletions(connection: Connection, daycare_ids: Set[str]) -> None:
+    """Stamp the daycares' events_deleted_at, which feeds date themselves by."""
+    daycares = Daycare.__table__
+    connection.execute(
+        update(daycares).where(daycares.c.id.in_(daycare_ids))
+        # Not an edit of the daycare itself
+        .values(events_deleted_at=func.now(), updated_at=daycares.c.updated_at)
+    )
+
+
+_PENDING_KEY = "calendar_feed_changes"
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_feed_changes(session: Session, flush_context) -> None:
+    """Invalidate the feeds of daycares whose events were flushed."""
+    daycare_ids: Set[str] = {
+        obj.daycare_id
+        for obj in (*session.new, *session.dirty, *session.deleted)
+        if isinstance(obj, Event) and obj.daycare_id
+    }
+    deleted_from: Set[str] = {
+        obj.daycare_id
+        for obj in session.deleted
+        if isinstance(obj, Event) and obj.daycare_id
+    }
+    if deleted_from:
+        record_event_deletions(session.connection(), deleted_from)
+    if daycare_ids:
+        calendar_feed_cache.invalidate(daycare_ids)
+        # Invalidate again on commit, in case a concurrent request cached the
+        # pre-commit state in between
+        session.info.setdefault(_PENDING_KEY, set()).update(daycare_ids)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_feed_changes(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        calendar_feed_cache.invalidate(pending)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_feed_changes(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,348 @@
+"""
+Incremental two-way sync of a daycare's events with an external calendar.
+
+The calendar speaks a Google Calendar v3 style REST API: listing with a sync
+token returns only what changed since that token was issued (deletions as
+"cancelled" items), and every event carries an etag that changes with each
+edit. A cycle pulls remote changes first, then pushes local edits, so its
+cost follows the number of changes rather than the size of the calendar.
+"""
+
+import json
+import logging
+import urllib.error
+import urllib.request
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote, urlencode
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.calendar_sync import CalendarSyncState
+from app.models.event import Event, event_start, utcnow
+from app.services.event_service import EventService
+
+logger = logging.getLogger(__name__)
+
+
+class CalendarApiError(Exception):
+    """Raised when the calendar API answers with an unexpected status."""
+
+    def __init__(self, status: int, message: str = ""):
+        super().__init__(f"Calendar API returned {status}: {message}")
+        self.status = status
+
+
+class SyncTokenExpired(CalendarApiError):
+    """The sync token is no longer valid (410); a full sync is needed."""
+
+
+class EtagMismatch(CalendarApiError):
+    """The remote event changed since the etag we hold was issued (412)."""
+
+
+class RemoteEventGone(CalendarApiError):
+    """The remote event no longer exists (404 or 410)."""
+
+
+class CalendarClient:
+    """Small JSON client for the calendar API, built on the standard library."""
+
+    def __init__(
+        self,
+        base_url: str,
+        token: str = "",
+        timeout: float = 10.0,
+        page_size: int = 250,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.token = token
+        self.timeout = timeout
+        self.page_size = page_size
+
+    @classmethod
+    def from_settings(cls) -> "CalendarClient":
+        return cls(settings.calendar_api_url, settings.calendar_api_token)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        body: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Tuple[int, Any]:
+        """Send one request and return (status, decoded JSON body or None)."""
+        url = self.base_url + path
+        if params:
+            url += "?" + urlencode(params)
+        data = json.dumps(body).encode() if body is not None else None
+        request = urllib.request.Request(url, data=data, method=method)
+        request.add_header("Accept", "application/json")
+        if data is not None:
+            request.add_header("Content-Type", "application/json")
+        if self.token:
+            request.add_header("Authorization", f"Bearer {self.token}")
+        for name, value in (headers or {}).items():
+            request.add_header(name, value)
+
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                status, payload = response.status, response.read()
+        except urllib.error.HTTPError as e:
+            status, payload = e.code, e.read()
+        return status, json.loads(payload) if payload else None
+
+    def _events_path(self, calendar_id: str, event_id: Optional[str] = None) -> str:
+        path = f"/calendars/{quote(calendar_id, safe='')}/events"
+        if event_id is not None:
+            path += f"/{quote(event_id, safe='')}"
+        return path
+
+    def list_changes(
+        self, calendar_id: str, sync_token: Optional[str]
+    ) -> Tuple[List[Dict[str, Any]], str]:
+        """
+        List events changed since `sync_token`, or every event without one.
+
+        Follows page tokens to the end of the listing.
+
+        Returns:
+            Tuple of (event items, the sync token for the next call)
+
+        Raises:
+            SyncTokenExpired: The server no longer accepts `sync_token`
+        """
+        params: Dict[str, Any] = {"maxResults": self.page_size, "showDeleted": "true"}
+        if sync_token:
+            params["syncToken"] = sync_token
+        items: List[Dict[str, Any]] = []
+        while True:
+            status, payload = self._request(
+                "GET", self._events_path(calendar_id), params
+            )
+            if status == 410:
+                raise SyncTokenExpired(status, "sync token expired")
+            if status != 200:
+                raise CalendarApiError(status, "listing events failed")
+            items.extend(payload.get("items", []))
+            page_token = payload.get("nextPageToken")
+            if not page_token:
+                return items, payload["nextSyncToken"]
+            params["pageToken"] = page_token
+
+    def insert_event(self, calendar_id: str, body: Dict[str, Any]) -> Dict[str, Any]:
+        status, payload = self._request(
+            "POST", self._events_path(calendar_id), body=body
+        )
+        if status not in (200, 201):
+            raise CalendarApiError(status, "creating an event failed")
+        return payload
+
+    def update_event(
+        self, calendar_id: str, event_id: str, body: Dict[str, Any], etag: str
+    ) -> Dict[str, Any]:
+        """Replace an event, provided it is still at `etag`."""
+        status, payload = self._request(
+            "PUT",
+            self._events_path(calendar_id, event_id),
+            body=body,
+            headers={"If-Match": etag},
+        )
+        if status == 412:
+            raise EtagMismatch(status, f"event {event_id} changed remotely")
+        if status in (404, 410):
+            raise RemoteEventGone(status, f"event {event_id} no longer exists")
+        if status != 200:
+            raise CalendarApiError(status, f"updating event {event_id} failed")
+        return payload
+
+    def delete_event(self, calendar_id: str, event_id: str) -> None:
+        """Delete an event; one that is already gone counts as deleted."""
+        status, _ = self._request("DELETE", self._events_path(calendar_id, event_id))
+        if status not in (200, 204, 404, 410):
+            raise CalendarApiError(status, f"deleting event {event_id} failed")
+
+
+class SyncResult(NamedTuple):
+    pulled: int
+    pulled_deletes: int
+    pushed: int
+    pushed_deletes: int
+    full_resync: bool
+
+
+def _remote_datetime(value: str) -> datetime:
+    """Parse an RFC 3339 dateTime into the naive UTC event dates are stored in."""
+    parsed = datetime.fromisoformat(value)
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def event_from_remote(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a remote event item to the columns EventService.apply_remote_changes takes."""
+    start = item.get("start") or {}
+    location = item.get("location")
+    if "dateTime" in start:
+        date = _remote_datetime(start["dateTime"])
+        start_time = date.strftime("%H:%M")
+    else:
+        # All-day events have a date only
+        date = datetime.fromisoformat(start["date"])
+        start_time = None
+    return {
+        "external_id": item["id"],
+        "external_etag": item["etag"],
+        "title": (item.get("summary") or "Untitled event")[:255],
+        "description": item.get("description"),
+        "location": location[:255] if location else None,
+        "date": date,
+        "start_time": start_time,
+    }
+
+
+def event_to_remote(event: Event) -> Dict[str, Any]:
+    """Map a local event to a remote event body."""
+    start_at, all_day = event_start(event.date, event.start_time)
+    if all_day:
+        start = {"date": start_at.date().isoformat()}
+        # The end date is exclusive
+        end = {"date": (start_at.date() + timedelta(days=1)).isoformat()}
+    else:
+        # Events have a start only; publish them as instants
+        start = end = {"dateTime": start_at.strftime("%Y-%m-%dT%H:%M:%SZ")}
+    return {
+        "summary": event.title,
+        "description": event.description,
+        "location": event.location,
+        "start": start,
+        "end": end,
+    }
+
+
+class CalendarSyncEngine:
+    """
+    Syncs one daycare's events with its linked external calendar.
+
+    Pulled changes are matched to local events by external ID and skipped when
+    their etag is the one we already hold, so the echo of our own pushes costs
+    nothing. When both sides changed an event, the pulled version wins.
+    """
+
+    def __init__(self, db: Session, daycare_id: str, client: CalendarClient):
+        self.db = db
+        self.client = client
+        self.events = EventService(db, daycare_id)
+        self.state = db.get(CalendarSyncState, daycare_id)
+        if self.state is None:
+            raise ValueError("Calendar sync is not configured for this daycare")
+
+    def sync(self) -> SyncResult:
+        """Pull, then push, committing after each half."""
+        pulled, pulled_deletes, full_resync = self.pull()
+        pushed, pushed_deletes = self.push()
+        self.state.last_synced_at = utcnow()
+        self.db.commit()
+        return SyncResult(pulled, pulled_deletes, pushed, pushed_deletes, full_resync)
+
+    def pull(self) -> Tuple[int, int, bool]:
+        """
+        Apply remote changes since the stored sync token.
+
+        Without a token, or once the server expires it, every remote event is
+        listed instead; linked events missing from that listing were deleted.
+
+        Returns:
+            Tuple of (events upserted, events deleted, whether it was a full sync)
+        """
+        calendar_id = self.state.calendar_id
+        full_resync = self.state.sync_token is None
+        try:
+            items, next_token = self.client.list_changes(
+                calendar_id, self.state.sync_token
+            )
+        except SyncTokenExpired:
+            logger.info("Sync token expired for %s, resyncing", calendar_id)
+            full_resync = True
+            items, next_token = self.client.list_changes(calendar_id, None)
+
+        deleted = {item["id"] for item in items if item.get("status") == "cancelled"}
+        live = [item for item in items if item.get("status") != "cancelled"]
+        if full_resync:
+            listed = {item["id"] for item in live}
+            deleted |= self.events.get_external_ids() - listed
+
+        held = self.events.get_external_etags(item["id"] for item in live)
+        upserts = [
+            event_from_remote(item)
+            for item in live
+            if held.get(item["id"]) != item.get("etag")
+        ]
+        upserted, removed = self.events.apply_remote_changes(upserts, deleted)
+        self.state.sync_token = next_token
+        self.db.commit()
+        return upserted, removed, full_resync
+
+    def push(self) -> Tuple[int, int]:
+        """
+        Send local creates, edits and deletes to the calendar.
+
+        Edits are conditional on the etag we hold. If the event changed
+        remotely in the meantime it stays pending, and the next pull brings
+        the remote version in. An edited event that is gone from the calendar
+        is inserted again under a new external ID. Whatever was pushed is
+        recorded even if a later request fails, so nothing is pushed twice.
+
+        Returns:
+            Tuple of (events created or updated, events deleted)
+        """
+        calendar_id = self.state.calendar_id
+        synced: List[Tuple[int, str, str, Optional[str]]] = []
+        removed: List[int] = []
+        try:
+            for event, updated_at in self.events.get_unsynced_events():
+                body = event_to_remote(event)
+                if event.external_id:
+                    try:
+                        remote = self.client.update_event(
+                            calendar_id, event.external_id, body, event.external_etag
+                        )
+                    except EtagMismatch:
+                        continue
+                    except RemoteEventGone:
+                        remote = self.client.insert_event(calendar_id, body)
+                else:
+                    remote = self.client.insert_event(calendar_id, body)
+                synced.append((event.id, remote["id"], remote["etag"], updated_at))
+
+            for tombstone in self.events.get_tombstones():
+                self.client.delete_event(calendar_id, tombstone.external_id)
+                removed.append(tombstone.id)
+        finally:
+            self.events.mark_synced(synced)
+            self.events.clear_tombstones(removed)
+            self.db.commit()
+        return len(synced), len(removed)
+
+
+def sync_all_calendars(
+    db: Session, client: CalendarClient
+) -> Dict[str, Optional[SyncResult]]:
+    """
+    Sync every daycare with a linked calendar.
+
+    A daycare whose sync fails is logged and skipped (None in the result), so
+    one unreachable calendar does not hold up the others.
+    """
+    results: Dict[str, Optional[SyncResult]] = {}
+    daycare_ids = db.query(CalendarSyncState.daycare_id).all()
+    for (daycare_id,) in daycare_ids:
+        try:
+            results[daycare_id] = CalendarSyncEngine(db, daycare_id, client).sync()
+        except (CalendarApiError, OSError) as e:
+            db.rollback()
+            logger.warning("Calendar sync failed for daycare %s: %s", daycare_id, e)
+            results[daycare_id] = None
+    return results
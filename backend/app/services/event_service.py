@@ -1,25 +1,47 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+from sqlalchemy import (
+    String,
+    bindparam,
+    case,
+    cast,
+    delete,
+    event,
+    func,
+    insert,
+    select,
+    update,
+)
 from sqlalchemy.orm import Session
 
-from app.models.event import Event, EventImage
+from app.models.calendar_sync import CalendarTombstone
+from app.models.event import Event, EventImage, utcnow
 from app.models.schemas import EventCreate, EventImageCreate, EventUpdate
+from app.services.calendar_feed import calendar_feed_cache, record_event_deletions
+from app.services.read_model import EventRow, event_filters, get_event_rows
 from app.services.s3_service import s3_service
 
+# Event columns an external calendar can change
+REMOTE_COLUMNS = ("title", "description", "location", "date", "start_time")
+
 
 class EventService:
-    def __init__(self, db: Session):
+    """Events and images of one daycare; other daycares' rows are never visible"""
+
+    def __init__(self, db: Session, daycare_id: str):
         self.db = db
+        self.daycare_id = daycare_id
 
     def create_event(self, event_data: EventCreate) -> Event:
         """Create a new event"""
         db_event = Event(
+            daycare_id=self.daycare_id,
             title=event_data.title,
             description=event_data.description,
             date=event_data.date,
             start_time=event_data.start_time,
             location=event_data.location,
-            is_past=event_data.is_past,
         )
         self.db.add(db_event)
         self.db.commit()
@@ -28,7 +50,11 @@ class EventService:
 
     def get_event(self, event_id: int) -> Optional[Event]:
         """Get event by ID"""
-        return self.db.query(Event).filter(Event.id == event_id).first()
+        return (
+            self.db.query(Event)
+            .filter(Event.id == event_id, Event.daycare_id == self.daycare_id)
+            .first()
+        )
 
     def get_events(
         self,
@@ -36,16 +62,102 @@ class EventService:
         limit: int = 100,
         upcoming_only: bool = False,
         past_only: bool = False,
-    ) -> List[Event]:
-        """Get events with optional filtering"""
-        query = self.db.query(Event)
+        images_limit: Optional[int] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[EventRow]:
+        """Get events with optional filtering (offset based, prefer get_events_page)"""
+        events, _ = get_event_rows(
+            self.db,
+            self.daycare_id,
+            limit=limit,
+            skip=skip,
+            upcoming_only=upcoming_only,
+            past_only=past_only,
+            images_limit=images_limit,
+            start=start,
+            end=end,
+        )
+        return events
+
+    def get_events_page(
+        self,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        upcoming_only: bool = False,
+        past_only: bool = False,
+        images_limit: Optional[int] = None,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Tuple[List[EventRow], Optional[str]]:
+        """Get one page of events ordered by (date, id) and the next page's cursor
+
+        Images of the whole page are loaded with one IN select, capped at
+        `images_limit` per event when given. `start` and `end` restrict the
+        listing to the calendar window [start, end).
+        """
+        return get_event_rows(
+            self.db,
+            self.daycare_id,
+            cursor=cursor,
+            limit=limit,
+            upcoming_only=upcoming_only,
+            past_only=past_only,
+            images_limit=images_limit,
+            start=start,
+            end=end,
+        )
+
+    def get_events_fingerprint(
+        self,
+        upcoming_only: bool = False,
+        past_only: bool = False,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Tuple[Any, ...]:
+        """
+        Cheap fingerprint of the listed events and their images for ETags.
 
-        if upcoming_only:
-            query = query.filter(~Event.is_past)
-        elif past_only:
-            query = query.filter(Event.is_past)
+        Includes how many of the listed events have passed, so the tag changes
+        when the clock moves an event into the past even though no row did:
+        that flips its `is_past` and its upcoming/past membership.
+        """
+        now = utcnow()
+        # Scalar subqueries of a single SELECT, so a 304 never hydrates events
+        event_ids = (
+            self._events_query(upcoming_only, past_only, start, end, now).with_entities(
+                Event.id
+            )
+        ).subquery()
+        events = Event.id.in_(select(event_ids.c.id))
+        images = EventImage.event_id.in_(select(event_ids.c.id))
 
-        return query.offset(skip).limit(limit).all()
+        row = self.db.execute(
+            select(
+                select(func.count(Event.id)).where(events).scalar_subquery(),
+                select(func.count(Event.id))
+                .where(events, Event.date < now)
+                .scalar_subquery(),
+                select(func.max(Event.created_at)).where(events).scalar_subquery(),
+                select(func.max(Event.updated_at)).where(events).scalar_subquery(),
+                select(func.count(EventImage.id)).where(images).scalar_subquery(),
+                select(func.max(EventImage.created_at)).where(images).scalar_subquery(),
+            )
+        ).one()
+        return tuple(row)
+
+    def _events_query(
+        self,
+        upcoming_only: bool,
+        past_only: bool,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        now: Optional[datetime] = None,
+    ):
+        """Base events query with the past/upcoming and calendar filters applied"""
+        return self.db.query(Event).filter(
+            *event_filters(self.daycare_id, upcoming_only, past_only, start, end, now)
+        )
 
     def update_event(self, event_id: int, event_data: EventUpdate) -> Optional[Event]:
         """Update an event"""
@@ -108,7 +220,12 @@ class EventService:
 
     def delete_event_image(self, image_id: int) -> bool:
         """Delete an event image"""
-        db_image = self.db.query(EventImage).filter(EventImage.id == image_id).first()
+        db_image = (
+            self.db.query(EventImage)
+            .join(EventImage.event)
+            .filter(EventImage.id == image_id, Event.daycare_id == self.daycare_id)
+            .first()
+        )
         if not db_image:
             return False
 
@@ -137,3 +254,200 @@ class EventService:
     ) -> EventImage:
         """Confirm image upload and create database record"""
         return self.add_image_to_event(event_id, image_data, s3_key)
+
+    # External calendar sync. Writes below use Core statements, which bypass
+    # `_track_calendar_changes`, so synced data is never queued to be pushed back.
+
+    def get_external_etags(self, external_ids: Iterable[str]) -> Dict[str, str]:
+        """Map the given external IDs to the etag of the local copy, if any"""
+        external_ids = list(external_ids)
+        if not external_ids:
+            return {}
+        rows = self.db.execute(
+            select(Event.external_id, Event.external_etag).where(
+                Event.daycare_id == self.daycare_id,
+                Event.external_id.in_(external_ids),
+            )
+        )
+        return dict(rows.all())
+
+    def get_external_ids(self) -> Set[str]:
+        """External IDs of every linked event (only needed for a full resync)"""
+        return set(
+            self.db.scalars(
+                select(Event.external_id).where(
+                    Event.daycare_id == self.daycare_id,
+                    Event.external_id.is_not(None),
+                )
+            )
+        )
+
+    def apply_remote_changes(
+        self, upserts: List[Dict[str, Any]], deleted_external_ids: Iterable[str]
+    ) -> Tuple[int, int]:
+        """
+        Apply changes pulled from the external calendar in batched statements.
+
+        Each upsert holds `external_id`, `external_etag` and REMOTE_COLUMNS.
+        New events are added with one executemany INSERT and known ones with
+        one executemany UPDATE, where the pulled version wins over a pending
+        local edit. Deleted events and their images go in one DELETE each.
+
+        Args:
+            upserts: Created or changed external events
+            deleted_external_ids: External IDs of deleted events
+
+        Returns:
+            Tuple of (events upserted, events deleted)
+        """
+        events = Event.__table__
+        existing = {}
+        if upserts:
+            existing = dict(
+                self.db.execute(
+                    select(Event.external_id, Event.id).where(
+                        Event.daycare_id == self.daycare_id,
+                        Event.external_id.in_([row["external_id"] for row in upserts]),
+                    )
+                ).all()
+            )
+
+        new_rows = [
+            {**row, "daycare_id": self.daycare_id, "sync_pending": False}
+            for row in upserts
+            if row["external_id"] not in existing
+        ]
+        if new_rows:
+            self.db.execute(insert(events), new_rows)
+
+        changed_rows = [
+            {
+                "b_id": existing[row["external_id"]],
+                **{f"b_{column}": row[column] for column in REMOTE_COLUMNS},
+                "b_external_etag": row["external_etag"],
+            }
+            for row in upserts
+            if row["external_id"] in existing
+        ]
+        if changed_rows:
+            self.db.execute(
+                update(events)
+                .where(events.c.id == bindparam("b_id"))
+                .values(
+                    {column: bindparam(f"b_{column}") for column in REMOTE_COLUMNS},
+                )
+                .values(external_etag=bindparam("b_external_etag"), sync_pending=False),
+                changed_rows,
+            )
+
+        deleted = 0
+        deleted_external_ids = list(deleted_external_ids)
+        if deleted_external_ids:
+            doomed = select(Event.id).where(
+                Event.daycare_id == self.daycare_id,
+                Event.external_id.in_(deleted_external_ids),
+            )
+            s3_keys = self.db.scalars(
+                select(EventImage.s3_key).where(EventImage.event_id.in_(doomed))
+            ).all()
+            self.db.execute(delete(EventImage).where(EventImage.event_id.in_(doomed)))
+            deleted = self.db.execute(
+                delete(events).where(
+                    events.c.daycare_id == self.daycare_id,
+                    events.c.external_id.in_(deleted_external_ids),
+                )
+            ).rowcount
+            if deleted:
+                record_event_deletions(self.db.connection(), {self.daycare_id})
+            for s3_key in s3_keys:
+                s3_service.delete_object(s3_key)
+
+        if upserts or deleted:
+            calendar_feed_cache.invalidate({self.daycare_id})
+        return len(upserts), deleted
+
+    def get_unsynced_events(self) -> List[Tuple[Event, Optional[str]]]:
+        """
+        Events written locally since they were last pushed.
+
+        Each comes with its `updated_at` as text rendered by the database, to
+        hand back to `mark_synced` unchanged: the database's own rendering
+        compares exactly, where a round-tripped datetime may not (SQLite
+        stores `now()` without the microseconds a bound value carries).
+        """
+        return (
+            self.db.query(Event, cast(Event.updated_at, String))
+            .filter(Event.daycare_id == self.daycare_id, Event.sync_pending)
+            .order_by(Event.id)
+            .all()
+        )
+
+    def mark_synced(self, pushed: List[Tuple[int, str, str, Optional[str]]]) -> None:
+        """
+        Record pushed events with one executemany UPDATE.
+
+        `pushed` holds (event id, external id, etag, updated_at text from
+        `get_unsynced_events`). An event edited again while it was being
+        pushed keeps `sync_pending`.
+        """
+        if not pushed:
+            return
+        events = Event.__table__
+        self.db.execute(
+            update(events)
+            .where(events.c.id == bindparam("b_id"))
+            .values(
+                external_id=bindparam("b_external_id"),
+                external_etag=bindparam("b_external_etag"),
+                sync_pending=case(
+                    (
+                        cast(events.c.updated_at, String).is_not_distinct_from(
+                            bindparam("b_updated_at", type_=String)
+                        ),
+                        False,
+                    ),
+                    else_=events.c.sync_pending,
+                ),
+                # Bookkeeping only, the event itself did not change
+                updated_at=events.c.updated_at,
+            ),
+            [
+                {
+                    "b_id": event_id,
+                    "b_external_id": external_id,
+                    "b_external_etag": etag,
+                    "b_updated_at": updated_at,
+                }
+                for event_id, external_id, etag, updated_at in pushed
+            ],
+        )
+
+    def get_tombstones(self) -> List[CalendarTombstone]:
+        """Locally deleted events still to be deleted from the calendar"""
+        return (
+            self.db.query(CalendarTombstone)
+            .filter(CalendarTombstone.daycare_id == self.daycare_id)
+            .order_by(CalendarTombstone.id)
+            .all()
+        )
+
+    def clear_tombstones(self, tombstone_ids: List[int]) -> None:
+        if tombstone_ids:
+            self.db.execute(
+                delete(CalendarTombstone).where(CalendarTombstone.id.in_(tombstone_ids))
+            )
+
+
+@event.listens_for(Session, "before_flush")
+def _track_calendar_changes(session: Session, flush_context, instances) -> None:
+    """Queue local event writes for the next push to the external calendar."""
+    for obj in (*session.new, *session.dirty):
+        if isinstance(obj, Event) and (obj in session.new or session.is_modified(obj)):
+            obj.sync_pending = True
+    for obj in session.deleted:
+        if isinstance(obj, Event) and obj.external_id:
+            session.add(
+                CalendarTombstone(
+                    daycare_id=obj.daycare_id, external_id=obj.external_id
+                )
+            )
@@ -1,13 +1,31 @@
-from datetime import date
-from typing import List, Optional
+import uuid
+from datetime import date, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 from fastapi import HTTPException
+from sqlalchemy import and_, delete, func, insert, or_, select, update
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
-from sqlalchemy.orm import Session
-
-from app.models.kid import Kid, KidAbsence
+from sqlalchemy.orm import Query, Session, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.database import loader_policy
+from app.models.associations import parent_kids
+from app.models.kid import (
+    AttendanceSource,
+    AttendanceStatus,
+    Kid,
+    KidAbsence,
+    KidAttendanceEntry,
+    TrustedAdult,
+)
 from app.models.parent import Parent
-from app.schemas.kid import KidAbsenceCreate
+from app.schemas.kid import KidAbsenceCreate, KidAbsenceRangeCreate
+from app.services.attendance_hub import attendance_hub
+from app.services.authorization_service import is_parent_of
+
+# Relationships KidOut reads, each loaded with one batched SELECT per page
+KID_OUT_LOADERS = (selectinload(Kid.parents), selectinload(Kid.trusted_adults))
 
 
 def create_kid(
@@ -66,7 +84,7 @@ def create_kid(
         dob=dob,
         daycare_id=daycare_id,
         group_id=group_id,
-        trusted_adults=trusted_adults or [],
+        trusted_adults=[TrustedAdult(**adult) for adult in trusted_adults or []],
     )
 
     db.add(kid)
@@ -82,6 +100,74 @@ def create_kid(
     return kid
 
 
+def replace_trusted_adults(
+    db: Session, kid: Kid, trusted_adults: List[Dict[str, Any]]
+) -> Set[str]:
+    """
+    Replace a kid's trusted adults with one DELETE and one multi-row INSERT.
+
+    The old rows are not loaded; the DELETE returns their names instead. The
+    caller commits.
+
+    Args:
+        db: Database session
+        kid: The kid whose trusted adults are replaced
+        trusted_adults: New trusted adults, in display order
+
+    Returns:
+        Names of adults that were removed (and not re-added)
+    """
+    old_names = db.scalars(
+        delete(TrustedAdult)
+        .where(TrustedAdult.kid_id == kid.id)
+        .returning(TrustedAdult.name)
+        .execution_options(synchronize_session=False)
+    ).all()
+    if trusted_adults:
+        db.execute(
+            insert(TrustedAdult.__table__),
+            [
+                {**adult, "kid_id": kid.id, "position": position}
+                for position, adult in enumerate(trusted_adults)
+            ],
+        )
+    db.expire(kid, ["trusted_adults"])
+    # Touch the kid so roster fingerprints (ETags) change
+    kid.updated_at = func.now()
+    return set(old_names) - {adult["name"] for adult in trusted_adults}
+
+
+def get_kids_for_trusted_adult(
+    db: Session,
+    daycare_id: str,
+    phone_num: Optional[str] = None,
+    email: Optional[str] = None,
+) -> List[Kid]:
+    """
+    Get the kids in a daycare that an adult (by phone or email) may pick up.
+
+    Uses the phone/email indexes on trusted_adults rather than scanning kids.
+    """
+    conditions = []
+    if phone_num:
+        conditions.append(TrustedAdult.phone_num == phone_num)
+    if email:
+        conditions.append(TrustedAdult.email == email)
+    if not conditions:
+        raise HTTPException(
+            status_code=400, detail="Either phone_num or email is required"
+        )
+
+    matching = select(TrustedAdult.kid_id).where(or_(*conditions))
+    return (
+        db.query(Kid)
+        .options(*loader_policy(*KID_OUT_LOADERS))
+        .filter(Kid.daycare_id == daycare_id, Kid.id.in_(matching))
+        .order_by(Kid.full_name, Kid.id)
+        .all()
+    )
+
+
 def get_kid_by_id(db: Session, kid_id: int) -> Optional[Kid]:
     """Get a kid by ID."""
     return db.query(Kid).filter(Kid.id == kid_id).first()
@@ -94,10 +180,13 @@ def get_kids_by_daycare(db: Session, daycare_id: str) -> List[Kid]:
 
 def get_kids_by_parent(db: Session, parent_id: int) -> List[Kid]:
     """Get all kids linked to a specific parent."""
-    parent = db.query(Parent).filter(Parent.id == parent_id).first()
-    if not parent:
-        return []
-    return parent.kids
+    return (
+        db.query(Kid)
+        .options(*loader_policy(*KID_OUT_LOADERS))
+        .join(parent_kids, parent_kids.c.kid_id == Kid.id)
+        .filter(parent_kids.c.parent_id == parent_id)
+        .all()
+    )
 
 
 def get_kids_for_parent(db: Session, parent_id: int) -> List[Kid]:
@@ -164,8 +253,7 @@ def create_kid_absence(
         raise HTTPException(status_code=404, detail="Kid not found")
 
     # Check if parent is linked to this kid
-    parent_linked = any(parent.id == parent_id for parent in kid.parents)
-    if not parent_linked:
+    if not is_parent_of(db, parent_id, kid_id):
         raise HTTPException(
             status_code=403,
             detail="Parent not authorized to create absences for this kid",
@@ -191,8 +279,23 @@ def create_kid_absence(
             note=absence_data.note,
         )
         db.add(absence)
+        record_attendance(
+            db,
+            kid,
+            AttendanceStatus(absence_data.reason.value),
+            AttendanceSource.ABSENCE,
+            absence_data.date,
+        )
         db.commit()
         db.refresh(absence)
+        attendance_hub.publish(
+            "absence",
+            kid.daycare_id,
+            kid.group_id,
+            kid.id,
+            absence.reason.value,
+            absence.date,
+        )
         return absence
     except IntegrityError as e:
         db.rollback()
@@ -223,14 +326,10 @@ def get_kid_absences(db: Session, kid_id: int, parent_id: int) -> List[KidAbsenc
     Raises:
         HTTPException: If validation fails
     """
-    # Verify kid exists and parent is linked to kid
-    kid = db.query(Kid).filter(Kid.id == kid_id).first()
-    if not kid:
-        raise HTTPException(status_code=404, detail="Kid not found")
-
-    # Check if parent is linked to this kid
-    parent_linked = any(parent.id == parent_id for parent in kid.parents)
-    if not parent_linked:
+    # A linked kid exists, so the existence check is only needed on a miss
+    if not is_parent_of(db, parent_id, kid_id):
+        if db.query(Kid.id).filter(Kid.id == kid_id).first() is None:
+            raise HTTPException(status_code=404, detail="Kid not found")
         raise HTTPException(
             status_code=403,
             detail="Parent not authorized to view absences for this kid",
@@ -239,6 +338,44 @@ def get_kid_absences(db: Session, kid_id: int, parent_id: int) -> List[KidAbsenc
     return db.query(KidAbsence).filter(KidAbsence.kid_id == kid_id).all()
 
 
+def get_absences_in_range(
+    db: Session,
+    daycare_id: str,
+    start_date: date,
+    end_date: date,
+    group_id: Optional[int] = None,
+) -> Query:
+    """
+    Build a query for absences across a daycare (or group) in a date range.
+
+    The date range is served by the (date, kid_id) index and scoping goes
+    through kids.group_id. A query is returned rather than a list so callers
+    can page through a term's worth of data instead of materializing it.
+
+    Args:
+        db: Database session
+        daycare_id: Daycare to read
+        start_date: First day of the range (inclusive)
+        end_date: Last day of the range (inclusive)
+        group_id: Optionally limit to kids currently in this group
+
+    Returns:
+        Unordered query of KidAbsence objects
+    """
+    query = (
+        db.query(KidAbsence)
+        .join(Kid, Kid.id == KidAbsence.kid_id)
+        .filter(
+            Kid.daycare_id == daycare_id,
+            KidAbsence.date >= start_date,
+            KidAbsence.date <= end_date,
+        )
+    )
+    if group_id is not None:
+        query = query.filter(Kid.group_id == group_id)
+    return query
+
+
 def get_effective_attendance(db: Session, kid: Kid, target_date: date = None) -> str:
     """
     Get effective attendance for a kid considering absences.
@@ -267,3 +404,490 @@ def get_effective_attendance(db: Session, kid: Kid, target_date: date = None) ->
         return absence.reason.value
     else:
         return kid.attendance.value
+
+
+def get_effective_attendance_bulk(
+    db: Session, kid_ids: Iterable[int], target_date: date = None
+) -> Dict[int, str]:
+    """
+    Get effective attendance for many kids with a single query.
+
+    Kids are LEFT JOINed to their absence on the target date, so the cost is
+    one round trip regardless of how many kids are requested.
+
+    Args:
+        db: Database session
+        kid_ids: IDs of the kids to resolve
+        target_date: Date to check attendance for (defaults to today)
+
+    Returns:
+        Mapping of kid ID to effective attendance status
+    """
+    kid_ids = list(kid_ids)
+    if not kid_ids:
+        return {}
+
+    if target_date is None:
+        target_date = date.today()
+
+    rows = db.execute(
+        select(Kid.id, Kid.attendance, KidAbsence.reason)
+        .outerjoin(
+            KidAbsence,
+            and_(KidAbsence.kid_id == Kid.id, KidAbsence.date == target_date),
+        )
+        .where(Kid.id.in_(kid_ids))
+    )
+
+    # An absence on the target date wins over the stored attendance value
+    return {
+        kid_id: (reason.value if reason is not None else attendance.value)
+        for kid_id, attendance, reason in rows
+    }
+
+
+def apply_effective_attendance(
+    db: Session, kids: List[Kid], target_date: date = None
+) -> List[Kid]:
+    """
+    Overlay effective attendance onto already loaded kids for a roster response.
+
+    The value is set as committed state, so the session never sees the kids as
+    dirty and the override cannot be flushed back to the attendance column.
+
+    Args:
+        db: Database session
+        kids: Kids to update in place
+        target_date: Date to check attendance for (defaults to today)
+
+    Returns:
+        The same list of kids
+    """
+    statuses = get_effective_attendance_bulk(db, [kid.id for kid in kids], target_date)
+    for kid in kids:
+        status = statuses.get(kid.id)
+        if status is not None:
+            set_committed_value(kid, "attendance", AttendanceStatus(status))
+    return kids
+
+
+def record_attendance(
+    db: Session,
+    kid: Kid,
+    status: AttendanceStatus,
+    source: AttendanceSource,
+    target_date: date = None,
+) -> KidAttendanceEntry:
+    """
+    Append an entry to the attendance ledger.
+
+    The entry is added to the session but not committed, so it is written in
+    the same transaction as the change it records.
+
+    Args:
+        db: Database session
+        kid: Kid the entry is for
+        status: Attendance status for the day
+        source: What produced the status
+        target_date: Day the status applies to (defaults to today)
+
+    Returns:
+        The pending KidAttendanceEntry
+    """
+    if target_date is None:
+        target_date = date.today()
+
+    entry = KidAttendanceEntry(
+        kid_id=kid.id,
+        daycare_id=kid.daycare_id,
+        date=target_date,
+        status=status,
+        source=source,
+    )
+    db.add(entry)
+    return entry
+
+
+def set_attendance(
+    db: Session, kid: Kid, status: AttendanceStatus, target_date: date = None
+) -> date:
+    """
+    Set a kid's attendance as an educator override.
+
+    Any absence on the target date is removed and the change is recorded in
+    the attendance ledger. Nothing is committed; callers publish the change
+    to attendance_hub once it is.
+
+    Args:
+        db: Database session
+        kid: Kid to update
+        status: New attendance status
+        target_date: Day the override applies to (defaults to today)
+
+    Returns:
+        The day the override applies to
+    """
+    if target_date is None:
+        target_date = date.today()
+
+    kid.attendance = status
+    existing_absence = (
+        db.query(KidAbsence)
+        .filter(KidAbsence.kid_id == kid.id, KidAbsence.date == target_date)
+        .first()
+    )
+    if existing_absence:
+        db.delete(existing_absence)
+    record_attendance(db, kid, status, AttendanceSource.EDUCATOR, target_date)
+    return target_date
+
+
+def close_out_attendance_day(
+    db: Session, target_date: date = None, daycare_id: Optional[str] = None
+) -> int:
+    """
+    Snapshot every kid's effective attendance for a day into the ledger.
+
+    Meant to run nightly so each kid has a final entry for the day even if
+    nobody touched their attendance. Entries are written with one multi-row
+    insert.
+
+    Args:
+        db: Database session
+        target_date: Day to close out (defaults to today)
+        daycare_id: Optionally limit the close-out to one daycare
+
+    Returns:
+        Number of ledger entries written
+    """
+    if target_date is None:
+        target_date = date.today()
+
+    query = select(Kid.id, Kid.daycare_id)
+    if daycare_id:
+        query = query.where(Kid.daycare_id == daycare_id)
+    kids = db.execute(query).all()
+
+    statuses = get_effective_attendance_bulk(
+        db, [kid_id for kid_id, _ in kids], target_date
+    )
+    entries = [
+        {
+            "kid_id": kid_id,
+            "daycare_id": kid_daycare_id,
+            "date": target_date,
+            "status": AttendanceStatus(statuses[kid_id]),
+            "source": AttendanceSource.CLOSE_OUT,
+        }
+        for kid_id, kid_daycare_id in kids
+    ]
+    if entries:
+        db.execute(insert(KidAttendanceEntry), entries)
+    db.commit()
+    return len(entries)
+
+
+def get_attendance_history(
+    db: Session,
+    daycare_id: str,
+    start_date: date,
+    end_date: date,
+    group_id: Optional[int] = None,
+) -> List[KidAttendanceEntry]:
+    """
+    Get each kid's final attendance status per day within a date range.
+
+    The latest ledger entry per kid and day wins. The lookup is a single range
+    scan on the (daycare_id, date) index rather than a replay of absences.
+
+    Args:
+        db: Database session
+        daycare_id: Daycare to read
+        start_date: First day of the range (inclusive)
+        end_date: Last day of the range (inclusive)
+        group_id: Optionally limit to kids currently in this group
+
+    Returns:
+        List of KidAttendanceEntry objects ordered by date and kid
+    """
+    latest = select(func.max(KidAttendanceEntry.id).label("id")).where(
+        KidAttendanceEntry.daycare_id == daycare_id,
+        KidAttendanceEntry.date >= start_date,
+        KidAttendanceEntry.date <= end_date,
+    )
+    if group_id is not None:
+        latest = latest.join(Kid, Kid.id == KidAttendanceEntry.kid_id).where(
+            Kid.group_id == group_id
+        )
+    latest = latest.group_by(
+        KidAttendanceEntry.kid_id, KidAttendanceEntry.date
+    ).subquery()
+
+    return (
+        db.query(KidAttendanceEntry)
+        .join(latest, KidAttendanceEntry.id == latest.c.id)
+        .order_by(KidAttendanceEntry.date, KidAttendanceEntry.kid_id)
+        .all()
+    )
+
+
+def bulk_update_attendance(
+    db: Session,
+    group_id: int,
+    updates: Dict[int, AttendanceStatus],
+    target_date: date = None,
+) -> Dict[int, bool]:
+    """
+    Set attendance for many kids of a group in one transaction.
+
+    Applies the same teacher-override semantics as the per-kid endpoint: the
+    attendance column is updated, any absence on the target date is removed
+    and a ledger entry is appended. Statements are set-based, so the number of
+    round trips does not grow with the number of kids.
+
+    Args:
+        db: Database session
+        group_id: Group the kids must belong to
+        updates: Mapping of kid ID to the new attendance status
+        target_date: Day the override applies to (defaults to today)
+
+    Returns:
+        Mapping of kid ID to whether it was updated (False if not in the group)
+    """
+    if target_date is None:
+        target_date = date.today()
+
+    kids = dict(
+        db.execute(
+            select(Kid.id, Kid.daycare_id).where(
+                Kid.group_id == group_id, Kid.id.in_(list(updates))
+            )
+        ).all()
+    )
+    if kids:
+        # One UPDATE per distinct status keeps the statement count bounded
+        by_status: Dict[AttendanceStatus, List[int]] = {}
+        for kid_id in kids:
+            by_status.setdefault(updates[kid_id], []).append(kid_id)
+        for status, kid_ids in by_status.items():
+            db.execute(
+                update(Kid)
+                .where(Kid.id.in_(kid_ids))
+                .values(attendance=status)
+                .execution_options(synchronize_session=False)
+            )
+
+        db.execute(
+            delete(KidAbsence)
+            .where(KidAbsence.kid_id.in_(list(kids)), KidAbsence.date == target_date)
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            insert(KidAttendanceEntry),
+            [
+                {
+                    "kid_id": kid_id,
+                    "daycare_id": daycare_id,
+                    "date": target_date,
+                    "status": updates[kid_id],
+                    "source": AttendanceSource.EDUCATOR,
+                }
+                for kid_id, daycare_id in kids.items()
+            ],
+        )
+        db.commit()
+
+        for kid_id, daycare_id in kids.items():
+            attendance_hub.publish(
+                "attendance",
+                daycare_id,
+                group_id,
+                kid_id,
+                updates[kid_id].value,
+                target_date,
+            )
+
+    return {kid_id: kid_id in kids for kid_id in updates}
+
+
+def get_roster_fingerprint(
+    db: Session,
+    daycare_id: str,
+    group_id: Optional[str] = None,
+    target_date: date = None,
+) -> Tuple[Any, ...]:
+    """
+    Get a cheap fingerprint of everything a kids roster response is built from.
+
+    Counts and latest update times of the kids, their absences on the target
+    date and their linked parents are read as scalar subqueries of a single
+    SELECT, so no rows are hydrated.
+
+    Args:
+        db: Database session
+        daycare_id: Daycare of the roster
+        group_id: Optional group filter of the roster
+        target_date: Day effective attendance is resolved for (defaults to today)
+
+    Returns:
+        Tuple of fingerprint values, including the target date
+    """
+    if target_date is None:
+        target_date = date.today()
+
+    roster = select(Kid.id).where(Kid.daycare_id == daycare_id)
+    if group_id:
+        roster = roster.where(Kid.group_id == group_id)
+
+    kids = Kid.id.in_(roster)
+    absences = and_(KidAbsence.kid_id.in_(roster), KidAbsence.date == target_date)
+    links = parent_kids.c.kid_id.in_(roster)
+    parents = Parent.id.in_(select(parent_kids.c.parent_id).where(links))
+
+    row = db.execute(
+        select(
+            select(func.count(Kid.id)).where(kids).scalar_subquery(),
+            select(func.max(Kid.updated_at)).where(kids).scalar_subquery(),
+            select(func.count(KidAbsence.id)).where(absences).scalar_subquery(),
+            select(func.max(KidAbsence.updated_at)).where(absences).scalar_subquery(),
+            select(func.count())
+            .select_from(parent_kids)
+            .where(links)
+            .scalar_subquery(),
+            select(func.max(Parent.updated_at)).where(parents).scalar_subquery(),
+        )
+    ).one()
+    return (target_date.isoformat(), *row)
+
+
+# Longest absence range that can be reported in one request
+MAX_ABSENCE_RANGE_DAYS = 62
+
+
+def _insert_for(db: Session, model):
+    """Dialect-specific INSERT supporting ON CONFLICT for the session's database."""
+    if db.get_bind().dialect.name == "sqlite":
+        return sqlite.insert(model)
+    return postgresql.insert(model)
+
+
+def create_kid_absence_range(
+    db: Session, absence_data: KidAbsenceRangeCreate, parent_id: int
+) -> Tuple[List[KidAbsence], List[Tuple[int, date]]]:
+    """
+    Create absences for one or more kids over a date range.
+
+    The parent link for every kid is checked with one query, and all days are
+    written with a single multi-row INSERT ... ON CONFLICT DO NOTHING on
+    (kid_id, date). Days that already had an absence are reported back as
+    conflicts instead of failing the whole request.
+
+    Args:
+        db: Database session
+        absence_data: Kids, date range, reason and note
+        parent_id: ID of the parent creating the absences
+
+    Returns:
+        Tuple of (created KidAbsence objects, list of (kid_id, date) conflicts)
+
+    Raises:
+        HTTPException: If validation fails
+    """
+    start_date = absence_data.start_date
+    end_date = absence_data.end_date or start_date
+    if end_date < start_date:
+        raise HTTPException(
+            status_code=400, detail="end_date must not be before start_date"
+        )
+    if (end_date - start_date).days >= MAX_ABSENCE_RANGE_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Absence range cannot exceed {MAX_ABSENCE_RANGE_DAYS} days",
+        )
+
+    days = [
+        start_date + timedelta(days=offset)
+        for offset in range((end_date - start_date).days + 1)
+    ]
+    if not absence_data.include_weekends:
+        days = [day for day in days if day.weekday() < 5]
+    if not days:
+        raise HTTPException(status_code=400, detail="No days to report in range")
+
+    # Verify every kid exists and is linked to the parent in one query
+    kid_ids = list(dict.fromkeys(absence_data.kid_ids))
+    rows = db.execute(
+        select(Kid.id, Kid.daycare_id, Kid.group_id, parent_kids.c.parent_id)
+        .outerjoin(
+            parent_kids,
+            and_(
+                parent_kids.c.kid_id == Kid.id,
+                parent_kids.c.parent_id == parent_id,
+            ),
+        )
+        .where(Kid.id.in_(kid_ids))
+    ).all()
+    kids = {row.id: row for row in rows}
+    if len(kids) != len(kid_ids):
+        raise HTTPException(status_code=404, detail="Kid not found")
+    if any(row.parent_id is None for row in rows):
+        raise HTTPException(
+            status_code=403,
+            detail="Parent not authorized to create absences for this kid",
+        )
+
+    values = [
+        {
+            "id": str(uuid.uuid4()),
+            "kid_id": kid_id,
+            "date": day,
+            "reason": absence_data.reason,
+            "note": absence_data.note,
+        }
+        for kid_id in kid_ids
+        for day in days
+    ]
+    stmt = (
+        _insert_for(db, KidAbsence)
+        .values(values)
+        .on_conflict_do_nothing(index_elements=["kid_id", "date"])
+        .returning(KidAbsence)
+    )
+    created = db.scalars(stmt).all()
+
+    status = AttendanceStatus(absence_data.reason.value)
+    if created:
+        db.execute(
+            insert(KidAttendanceEntry),
+            [
+                {
+                    "kid_id": absence.kid_id,
+                    "daycare_id": kids[absence.kid_id].daycare_id,
+                    "date": absence.date,
+                    "status": status,
+                    "source": AttendanceSource.ABSENCE,
+                }
+                for absence in created
+            ],
+        )
+    # RETURNING already loaded every column; detach so commit doesn't expire
+    # them and serialization doesn't reload each row
+    for absence in created:
+        db.expunge(absence)
+    db.commit()
+
+    for absence in created:
+        kid = kids[absence.kid_id]
+        attendance_hub.publish(
+            "absence", kid.daycare_id, kid.group_id, kid.id, status.value, absence.date
+        )
+
+    created_keys = {(absence.kid_id, absence.date) for absence in created}
+    conflicts = [
+        (kid_id, day)
+        for kid_id in kid_ids
+        for day in days
+        if (kid_id, day) not in created_keys
+    ]
+    created = sorted(created, key=lambda absence: (absence.kid_id, absence.date))
+    return created, conflicts
@@ -0,0 +1,224 @@
+import base64
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
+
+from cryptography.exceptions import InvalidSignature
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+    Ed25519PublicKey,
+)
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+from fastapi import HTTPException
+from sqlalchemy import event, select, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.kid import Kid
+
+# Prefix identifying the pass format, so it can evolve without ambiguity
+PASS_PREFIX = "pp1"
+
+
+class InvalidPickupPass(Exception):
+    """Raised when a pickup pass fails verification; the message is the reason."""
+
+
+@dataclass(frozen=True, slots=True)
+class PickupPass:
+    """The verified contents of a pickup pass."""
+
+    kid_id: int
+    daycare_id: str
+    adult_name: str
+    version: int
+    expires_at: int  # unix timestamp
+
+    def to_payload(self) -> Dict[str, object]:
+        return {
+            "k": self.kid_id,
+            "d": self.daycare_id,
+            "a": self.adult_name,
+            "v": self.version,
+            "e": self.expires_at,
+        }
+
+
+def _b64(raw: bytes) -> str:
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def _unb64(text: str) -> bytes:
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+@lru_cache(maxsize=1)
+def _signing_key() -> Ed25519PrivateKey:
+    """
+    The Ed25519 key passes are signed with.
+
+    PICKUP_PASS_SIGNING_KEY holds a base64url 32-byte seed; without it the
+    seed is derived from SECRET_KEY, so rotating the secret rotates passes.
+    """
+    if settings.pickup_pass_signing_key:
+        seed = _unb64(settings.pickup_pass_signing_key)
+    else:
+        seed = hashlib.sha256(f"pickup-pass:{settings.secret_key}".encode()).digest()
+    return Ed25519PrivateKey.from_private_bytes(seed)
+
+
+@lru_cache(maxsize=1)
+def _verify_key() -> Ed25519PublicKey:
+    return _signing_key().public_key()
+
+
+def public_key() -> str:
+    """Base64url raw public key, for verifying passes offline."""
+    return _b64(_verify_key().public_bytes(Encoding.Raw, PublicFormat.Raw))
+
+
+def sign_pickup_pass(pickup_pass: PickupPass) -> str:
+    """Encode and sign a pass as `pp1.<payload>.<signature>` (fits a QR code)."""
+    payload = _b64(json.dumps(pickup_pass.to_payload(), separators=(",", ":")).encode())
+    signed = f"{PASS_PREFIX}.{payload}"
+    return f"{signed}.{_b64(_signing_key().sign(signed.encode()))}"
+
+
+def verify_pickup_pass(token: str, now: Optional[float] = None) -> PickupPass:
+    """
+    Check a pass's signature and expiry, without touching the database.
+
+    Revocation is checked separately against the kid's pickup_version.
+
+    Raises:
+        InvalidPickupPass: If the pass is malformed, forged or expired
+    """
+    try:
+        prefix, payload, signature = token.split(".")
+        if prefix != PASS_PREFIX:
+            raise ValueError
+        _verify_key().verify(_unb64(signature), f"{prefix}.{payload}".encode())
+        data = json.loads(_unb64(payload))
+        pickup_pass = PickupPass(
+            kid_id=int(data["k"]),
+            daycare_id=str(data["d"]),
+            adult_name=str(data["a"]),
+            version=int(data["v"]),
+            expires_at=int(data["e"]),
+        )
+    except InvalidSignature:
+        raise InvalidPickupPass("Invalid signature")
+    except (ValueError, KeyError, TypeError):
+        raise InvalidPickupPass("Malformed pickup pass")
+
+    if pickup_pass.expires_at <= (time.time() if now is None else now):
+        raise InvalidPickupPass("Pickup pass has expired")
+    return pickup_pass
+
+
+class PickupVersionCache:
+    """
+    Per-process TTL cache of Kid.pickup_version.
+
+    Revocations made by this process update it once they are committed; the
+    TTL bounds how long a revocation made by another worker can go unnoticed.
+    """
+
+    def __init__(self, ttl: float = 30.0):
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[int, Tuple[float, int]] = {}
+
+    def get(self, kid_id: int) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(kid_id)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def set(self, kid_id: int, version: int) -> None:
+        with self._lock:
+            self._entries[kid_id] = (time.monotonic() + self.ttl, version)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+# Create global instance
+pickup_version_cache = PickupVersionCache()
+
+
+def get_pickup_version(db: Session, kid_id: int) -> Optional[int]:
+    """Current pickup_version of a kid (None if the kid does not exist)."""
+    version = pickup_version_cache.get(kid_id)
+    if version is None:
+        version = db.scalar(select(Kid.pickup_version).where(Kid.id == kid_id))
+        if version is not None:
+            pickup_version_cache.set(kid_id, version)
+    return version
+
+
+def issue_pickup_pass(kid: Kid, adult_name: str) -> Tuple[str, PickupPass]:
+    """
+    Issue a pass for one of the kid's trusted adults.
+
+    Args:
+        kid: The kid to be picked up
+        adult_name: Name of a trusted adult listed on the kid
+
+    Returns:
+        Tuple of (signed pass, its contents)
+
+    Raises:
+        HTTPException: If the adult is not one of the kid's trusted adults
+    """
+    names = {adult.name for adult in kid.trusted_adults}
+    if adult_name not in names:
+        raise HTTPException(
+            status_code=404, detail="Trusted adult not found for this kid"
+        )
+    pickup_pass = PickupPass(
+        kid_id=kid.id,
+        daycare_id=str(kid.daycare_id),
+        adult_name=adult_name,
+        version=kid.pickup_version,
+        expires_at=int(time.time()) + settings.pickup_pass_ttl_minutes * 60,
+    )
+    return sign_pickup_pass(pickup_pass), pickup_pass
+
+
+def revoke_pickup_passes(db: Session, kid_id: int) -> None:
+    """
+    Invalidate every pass issued for a kid by bumping its pickup_version.
+
+    The bump is applied in the current transaction; the caller commits. The
+    cache only sees the new version after that commit, so a request that is
+    rolled back leaves the kid's passes valid.
+    """
+    version = db.scalar(
+        update(Kid)
+        .where(Kid.id == kid_id)
+        .values(pickup_version=Kid.pickup_version + 1)
+        .returning(Kid.pickup_version)
+    )
+    if version is not None:
+        db.info.setdefault(_PENDING_KEY, {})[kid_id] = version
+
+
+_PENDING_KEY = "pickup_version_changes"
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pickup_versions(session: Session) -> None:
+    for kid_id, version in session.info.pop(_PENDING_KEY, {}).items():
+        pickup_version_cache.set(kid_id, version)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_pickup_versions(session: Session) -> None:
+    session.info.pop(_PENDING_KEY, None)
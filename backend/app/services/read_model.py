@@ -0,0 +1,434 @@
+"""
+Read-only queries for the list endpoints.
+
+Rows are selected as Core tuples and mapped into NamedTuple DTOs, so no ORM
+identities are built or tracked by the Session. Relationships are loaded with
+one batched IN select each. The response models read the DTOs with
+`from_attributes` like they would ORM objects. NamedTuples are used rather
+than dataclasses because FastAPI deep-copies dataclasses via asdict() before
+validating them.
+"""
+
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import and_, func, select
+from sqlalchemy.orm import Session
+
+from app.models.associations import educator_groups, parent_kids
+from app.models.educator import Educator
+from app.models.event import Event, EventImage, utcnow
+from app.models.group import Group
+from app.models.kid import Kid, KidAbsence, TrustedAdult
+from app.models.parent import Parent
+from app.services.s3_service import s3_service
+from app.utils.pagination import paginate_rows
+
+
+class ParentRow(NamedTuple):
+    id: int
+    full_name: str
+    email: Optional[str]
+    phone_num: Optional[str]
+
+
+class GroupRow(NamedTuple):
+    id: int
+    name: str
+    daycare_id: str
+
+
+class EducatorGroupRow(NamedTuple):
+    id: int
+    name: str
+
+
+class EducatorRow(NamedTuple):
+    id: int
+    full_name: str
+    role: str
+    email: Optional[str]
+    phone_num: Optional[str]
+    groups: Tuple[EducatorGroupRow, ...]
+
+
+class TrustedAdultRow(NamedTuple):
+    name: str
+    email: Optional[str]
+    phone_num: Optional[str]
+    address: Optional[str]
+
+
+class KidSummaryRow(NamedTuple):
+    id: int
+    full_name: str
+    group_id: int
+    daycare_id: str
+    attendance: str
+
+
+class KidRow(NamedTuple):
+    id: int
+    full_name: str
+    dob: date
+    group_id: int
+    daycare_id: str
+    attendance: str
+    allergies: Optional[str]
+    need_to_know: Optional[str]
+    trusted_adults: Tuple[TrustedAdultRow, ...]
+    parents: Tuple[ParentRow, ...]
+
+
+class EventImageRow(NamedTuple):
+    id: int
+    event_id: int
+    file_name: str
+    s3_key: str
+    image_url: str
+    created_at: Optional[datetime]
+
+
+class EventRow(NamedTuple):
+    id: int
+    title: str
+    description: Optional[str]
+    date: datetime
+    start_time: Optional[str]
+    location: Optional[str]
+    is_past: bool
+    created_at: Optional[datetime]
+    updated_at: Optional[datetime]
+    images: Tuple[EventImageRow, ...]
+
+
+def _grouped(rows: Iterable, make) -> Dict[int, Tuple]:
+    """Group (owner_id, *columns) rows into a tuple of DTOs per owner."""
+    grouped = defaultdict(list)
+    for owner_id, *columns in rows:
+        grouped[owner_id].append(make(*columns))
+    return {owner_id: tuple(items) for owner_id, items in grouped.items()}
+
+
+def get_parent_rows(
+    db: Session,
+    daycare_id: Optional[str],
+    search: Optional[str],
+    cursor: Optional[str],
+    limit: Optional[int],
+) -> Tuple[List[ParentRow], Optional[str]]:
+    """Get one page of parents ordered by (full_name, id)."""
+    statement = select(Parent.id, Parent.full_name, Parent.email, Parent.phone_num)
+    if daycare_id:
+        statement = statement.where(Parent.daycare_id == daycare_id)
+    if search:
+        statement = statement.where(
+            Parent.full_name.ilike(f"%{search}%") | Parent.email.ilike(f"%{search}%")
+        )
+
+    rows, next_cursor = paginate_rows(
+        db, statement, Parent.full_name, Parent.id, cursor, limit
+    )
+    return [ParentRow(*row) for row in rows], next_cursor
+
+
+def get_group_rows(
+    db: Session, daycare_id: str, cursor: Optional[str], limit: Optional[int]
+) -> Tuple[List[GroupRow], Optional[str]]:
+    """Get one page of a daycare's groups ordered by (name, id)."""
+    statement = select(Group.id, Group.name, Group.daycare_id).where(
+        Group.daycare_id == daycare_id
+    )
+    rows, next_cursor = paginate_rows(
+        db, statement, Group.name, Group.id, cursor, limit
+    )
+    return [GroupRow(*row) for row in rows], next_cursor
+
+
+def get_educator_rows(
+    db: Session,
+    daycare_id: Optional[str],
+    group: Optional[str],
+    search: Optional[str],
+    cursor: Optional[str],
+    limit: Optional[int],
+) -> Tuple[List[EducatorRow], Optional[str]]:
+    """Get one page of educators ordered by (full_name, id), with their groups."""
+    statement = select(
+        Educator.id,
+        Educator.full_name,
+        Educator.role,
+        Educator.email,
+        Educator.phone_num,
+    )
+    if daycare_id:
+        statement = statement.where(Educator.daycare_id == daycare_id)
+    if search:
+        statement = statement.where(Educator.full_name.ilike(f"%{search}%"))
+    if group:
+        statement = statement.where(Educator.groups.any(Group.name == group))
+
+    rows, next_cursor = paginate_rows(
+        db, statement, Educator.full_name, Educator.id, cursor, limit
+    )
+    if not rows:
+        return [], next_cursor
+
+    groups = _grouped(
+        db.execute(
+            select(educator_groups.c.educator_id, Group.id, Group.name)
+            .join(Group, Group.id == educator_groups.c.group_id)
+            .where(educator_groups.c.educator_id.in_([row.id for row in rows]))
+            .order_by(educator_groups.c.educator_id, Group.id)
+        ),
+        EducatorGroupRow,
+    )
+    educators = [EducatorRow(*row, groups=groups.get(row.id, ())) for row in rows]
+    return educators, next_cursor
+
+
+def get_kid_rows(
+    db: Session,
+    daycare_id: str,
+    group_id: Optional[str],
+    cursor: Optional[str],
+    limit: Optional[int],
+    summary: bool = False,
+    target_date: Optional[date] = None,
+) -> Tuple[List, Optional[str]]:
+    """
+    Get one page of a roster ordered by (full_name, id).
+
+    Effective attendance comes from a LEFT JOIN to the target date's absence
+    in the same SELECT. Full rows also get their trusted adults and parents,
+    one IN select each; summary rows skip them and the detail columns.
+
+    Args:
+        db: Database session
+        daycare_id: Daycare of the roster
+        group_id: Optional group filter
+        cursor: Cursor from the previous page
+        limit: Page size (None for every row)
+        summary: Return KidSummaryRow instead of KidRow
+        target_date: Day attendance is resolved for (defaults to today)
+
+    Returns:
+        Tuple of (rows, next cursor)
+    """
+    if target_date is None:
+        target_date = date.today()
+
+    columns = [Kid.id, Kid.full_name, Kid.group_id, Kid.daycare_id, Kid.attendance]
+    if not summary:
+        columns += [Kid.dob, Kid.allergies, Kid.need_to_know]
+    statement = (
+        select(*columns, KidAbsence.reason)
+        .outerjoin(
+            KidAbsence,
+            and_(KidAbsence.kid_id == Kid.id, KidAbsence.date == target_date),
+        )
+        .where(Kid.daycare_id == daycare_id)
+    )
+    if group_id:
+        statement = statement.where(Kid.group_id == group_id)
+
+    rows, next_cursor = paginate_rows(
+        db, statement, Kid.full_name, Kid.id, cursor, limit
+    )
+
+    # An absence on the target date wins over the stored attendance value
+    def attendance(row) -> str:
+        return (row.reason or row.attendance).value
+
+    if summary:
+        return [
+            KidSummaryRow(
+                row.id, row.full_name, row.group_id, row.daycare_id, attendance(row)
+            )
+            for row in rows
+        ], next_cursor
+    if not rows:
+        return [], next_cursor
+
+    kid_ids = [row.id for row in rows]
+    trusted_adults = _grouped(
+        db.execute(
+            select(
+                TrustedAdult.kid_id,
+                TrustedAdult.name,
+                TrustedAdult.email,
+                TrustedAdult.phone_num,
+                TrustedAdult.address,
+            )
+            .where(TrustedAdult.kid_id.in_(kid_ids))
+            .order_by(TrustedAdult.kid_id, TrustedAdult.position)
+        ),
+        TrustedAdultRow,
+    )
+    parents = _grouped(
+        db.execute(
+            select(
+                parent_kids.c.kid_id,
+                Parent.id,
+                Parent.full_name,
+                Parent.email,
+                Parent.phone_num,
+            )
+            .join(Parent, Parent.id == parent_kids.c.parent_id)
+            .where(parent_kids.c.kid_id.in_(kid_ids))
+            .order_by(parent_kids.c.kid_id, Parent.id)
+        ),
+        ParentRow,
+    )
+    return [
+        KidRow(
+            id=row.id,
+            full_name=row.full_name,
+            dob=row.dob,
+            group_id=row.group_id,
+            daycare_id=row.daycare_id,
+            attendance=attendance(row),
+            allergies=row.allergies,
+            need_to_know=row.need_to_know,
+            trusted_adults=trusted_adults.get(row.id, ()),
+            parents=parents.get(row.id, ()),
+        )
+        for row in rows
+    ], next_cursor
+
+
+def get_event_image_rows(
+    db: Session, event_ids: List[int], images_limit: Optional[int] = None
+) -> Dict[int, Tuple[EventImageRow, ...]]:
+    """
+    Get the images of several events with one IN select, oldest first.
+
+    With `images_limit`, each event's images are numbered with ROW_NUMBER()
+    over (event_id, id) and only the first `images_limit` are returned, so a
+    listing can ship cover thumbnails without fetching whole galleries.
+    """
+    if not event_ids or images_limit == 0:
+        return {}
+
+    columns = (
+        EventImage.id,
+        EventImage.event_id,
+        EventImage.file_name,
+        EventImage.s3_key,
+        EventImage.created_at,
+    )
+    statement = select(*columns).where(EventImage.event_id.in_(event_ids))
+    if images_limit is not None:
+        numbered = statement.add_columns(
+            func.row_number()
+            .over(partition_by=EventImage.event_id, order_by=EventImage.id)
+            .label("position")
+        ).subquery()
+        statement = select(*(numbered.c[column.key] for column in columns)).where(
+            numbered.c.position <= images_limit
+        )
+        order = (numbered.c.event_id, numbered.c.id)
+    else:
+        order = (EventImage.event_id, EventImage.id)
+
+    images = defaultdict(list)
+    for image in db.execute(statement.order_by(*order)):
+        images[image.event_id].append(
+            EventImageRow(
+                id=image.id,
+                event_id=image.event_id,
+                file_name=image.file_name,
+                s3_key=image.s3_key,
+                image_url=s3_service.get_object_url(image.s3_key),
+                created_at=image.created_at,
+            )
+        )
+    return {event_id: tuple(items) for event_id, items in images.items()}
+
+
+def event_filters(
+    daycare_id: str,
+    upcoming_only: bool = False,
+    past_only: bool = False,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    now: Optional[datetime] = None,
+) -> List:
+    """
+    WHERE clauses of one daycare's event listing.
+
+    All of them are ranges over the (daycare_id, date, id) index, so a listing
+    only reads that daycare's events. Past and upcoming are split at `now`.
+    The calendar window is half-open, [start, end), so consecutive weeks or
+    months never share an event.
+    """
+    clauses = [Event.daycare_id == daycare_id]
+    if upcoming_only:
+        clauses.append(Event.date >= (now or utcnow()))
+    elif past_only:
+        clauses.append(Event.date < (now or utcnow()))
+    if start is not None:
+        clauses.append(Event.date >= start)
+    if end is not None:
+        clauses.append(Event.date < end)
+    return clauses
+
+
+def get_event_rows(
+    db: Session,
+    daycare_id: str,
+    cursor: Optional[str] = None,
+    limit: int = 100,
+    skip: int = 0,
+    upcoming_only: bool = False,
+    past_only: bool = False,
+    images_limit: Optional[int] = None,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+) -> Tuple[List[EventRow], Optional[str]]:
+    """
+    Get one page of a daycare's events ordered by (date, id), with their images.
+
+    A legacy `skip` pages with OFFSET and returns no cursor. `images_limit`
+    caps the images returned per event (0 skips the images query). `start`
+    and `end` bound the page to a calendar window, see event_filters.
+    """
+    now = utcnow()
+    statement = select(
+        Event.id,
+        Event.title,
+        Event.description,
+        Event.date,
+        Event.start_time,
+        Event.location,
+        Event.created_at,
+        Event.updated_at,
+    ).where(*event_filters(daycare_id, upcoming_only, past_only, start, end, now))
+
+    if skip:
+        rows = db.execute(
+            statement.order_by(Event.date, Event.id).offset(skip).limit(limit)
+        ).all()
+        next_cursor = None
+    else:
+        rows, next_cursor = paginate_rows(
+            db, statement, Event.date, Event.id, cursor, limit
+        )
+
+    images = get_event_image_rows(db, [row.id for row in rows], images_limit)
+    return [
+        EventRow(
+            id=row.id,
+            title=row.title,
+            description=row.description,
+            date=row.date,
+            start_time=row.start_time,
+            location=row.location,
+            is_past=row.date < now,
+            created_at=row.created_at,
+            updated_at=row.updated_at,
+            images=images.get(row.id, ()),
+        )
+        for row in rows
+    ], next_cursor
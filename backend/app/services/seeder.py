@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 
 from app.models.daycare import Daycare
 from app.models.group import Group
-from app.models.kid import Kid
+from app.models.kid import Kid, TrustedAdult
 from app.models.parent import Parent
 
 
@@ -73,6 +73,7 @@ def insert_dummy_parents(db: Session, daycare_id: str) -> list[Parent]:
                 ]
             )
         )
+        .order_by(Parent.id)
         .all()
     )
 
@@ -133,7 +134,12 @@ def insert_dummy_parents(db: Session, daycare_id: str) -> list[Parent]:
         db.refresh(parent)
 
     # Get all parents for this daycare
-    all_parents = db.query(Parent).filter(Parent.daycare_id == daycare_id).all()
+    all_parents = (
+        db.query(Parent)
+        .filter(Parent.daycare_id == daycare_id)
+        .order_by(Parent.id)
+        .all()
+    )
     print(f"✅ Seeded {len(all_parents)} parents successfully!")
     return all_parents
 
@@ -182,7 +188,7 @@ def insert_dummy_kids(
                 {
                     "name": "Grandma Sara",
                     "email": "grandma@example.com",
-                    "phone": "+1555000001",
+                    "phone_num": "+1555000001",
                     "address": "123 Main St, City",
                 }
             ],
@@ -196,7 +202,7 @@ def insert_dummy_kids(
                 {
                     "name": "Uncle Mike",
                     "email": "mike@example.com",
-                    "phone": "+1555000002",
+                    "phone_num": "+1555000002",
                     "address": "456 Oak Ave, City",
                 }
             ],
@@ -218,7 +224,7 @@ def insert_dummy_kids(
                 {
                     "name": "Aunt Sarah",
                     "email": "sarah@example.com",
-                    "phone": "+1555000003",
+                    "phone_num": "+1555000003",
                     "address": "789 Pine St, City",
                 }
             ],
@@ -232,7 +238,7 @@ def insert_dummy_kids(
                 {
                     "name": "Family Friend Tom",
                     "email": "tom@example.com",
-                    "phone": "+1555000004",
+                    "phone_num": "+1555000004",
                     "address": "321 Elm St, City",
                 }
             ],
@@ -254,7 +260,7 @@ def insert_dummy_kids(
                 {
                     "name": "Neighbor Lisa",
                     "email": "lisa@example.com",
-                    "phone": "+1555000005",
+                    "phone_num": "+1555000005",
                     "address": "654 Maple Dr, City",
                 }
             ],
@@ -268,7 +274,7 @@ def insert_dummy_kids(
                 {
                     "name": "Cousin Alex",
                     "email": "alex@example.com",
-                    "phone": "+1555000006",
+                    "phone_num": "+1555000006",
                     "address": "987 Cedar Ln, City",
                 }
             ],
@@ -300,7 +306,9 @@ def insert_dummy_kids(
             dob=kid_data["dob"],
             daycare_id=daycare_id,
             group_id=groups[kid_data["group_index"]].id,
-            trusted_adults=kid_data["trusted_adults"],
+            trusted_adults=[
+                TrustedAdult(**adult) for adult in kid_data["trusted_adults"]
+            ],
         )
         db.add(kid)
         kids.append(kid)
@@ -330,7 +338,7 @@ def insert_dummy_kids(
             )
 
     # Get all kids for this daycare
-    all_kids = db.query(Kid).filter(Kid.daycare_id == daycare_id).all()
+    all_kids = db.query(Kid).filter(Kid.daycare_id == daycare_id).order_by(Kid.id).all()
     print(f"✅ Seeded {len(all_kids)} kids successfully!")
     return all_kids
 
@@ -341,6 +349,7 @@ def clear_daycare_data(db: Session) -> None:
     # Delete in reverse order of dependencies
     db.execute(text("DELETE FROM parent_kids"))
     db.execute(text("DELETE FROM educator_groups"))
+    db.execute(text("DELETE FROM trusted_adults"))
     db.execute(text("DELETE FROM kids"))
     db.execute(text("DELETE FROM parents"))
     db.execute(text("DELETE FROM educators"))
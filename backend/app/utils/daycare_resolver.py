@@ -1,19 +1,84 @@
+import threading
 import uuid
+from collections import OrderedDict
+from typing import Optional
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
 from app.models.daycare import Daycare
 
+# Placeholder daycare ID sent by dev clients (e.g. the Android emulator)
+DEV_DAYCARE_ID = "default-daycare-id"
+
+
+class DaycareCache:
+    """
+    Per-process cache for tenant resolution.
+
+    Holds the ID the dev placeholder resolves to (looked up once per process)
+    and a bounded LRU of daycare IDs known to exist. Only positive answers are
+    cached, so a daycare created after a miss is found on the next request.
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        self.maxsize = maxsize
+        self.dev_daycare_id: Optional[str] = None
+        self._lock = threading.Lock()
+        self._known: "OrderedDict[str, None]" = OrderedDict()
+
+    def is_known(self, daycare_id: str) -> bool:
+        with self._lock:
+            if daycare_id in self._known:
+                self._known.move_to_end(daycare_id)
+                return True
+            return False
+
+    def add(self, daycare_id: str) -> None:
+        with self._lock:
+            self._known[daycare_id] = None
+            self._known.move_to_end(daycare_id)
+            while len(self._known) > self.maxsize:
+                self._known.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.dev_daycare_id = None
+            self._known.clear()
+
+
+# Create global instance
+daycare_cache = DaycareCache()
+
 
 def resolve_daycare_id(db: Session, daycare_id: str) -> str:
     """Resolve daycare ID, mapping 'default-daycare-id' to a real UUID in local and test environments."""
-    if settings.app_env in ("local", "test") and daycare_id == "default-daycare-id":
+    if settings.app_env in ("local", "test") and daycare_id == DEV_DAYCARE_ID:
+        if daycare_cache.dev_daycare_id is not None:
+            return daycare_cache.dev_daycare_id
         daycare = db.query(Daycare).first()
         if not daycare:
             daycare = Daycare(id=str(uuid.uuid4()), name="Local Dev Daycare")
             db.add(daycare)
             db.commit()
             db.refresh(daycare)
+        daycare_cache.dev_daycare_id = daycare.id
+        daycare_cache.add(daycare.id)
         return daycare.id
     return daycare_id
+
+
+def daycare_exists(db: Session, daycare_id: str) -> bool:
+    """Check that a daycare exists, answering repeat checks from the cache."""
+    if daycare_cache.is_known(daycare_id):
+        return True
+    try:
+        uuid.UUID(daycare_id)
+    except ValueError:
+        # Not a UUID, so it cannot match (and must not reach a UUID column)
+        return False
+    found = db.scalar(select(Daycare.id).where(Daycare.id == daycare_id)) is not None
+    if found:
+        daycare_cache.add(daycare_id)
+    return found
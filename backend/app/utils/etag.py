@@ -0,0 +1,42 @@
+# Conditional GET (ETag / If-None-Match) helpers
+import hashlib
+from typing import Any, Optional
+
+from fastapi import Request, Response
+
+
+def weak_etag(*parts: Any) -> str:
+    """Build a weak ETag from cheap fingerprint values (counts, timestamps, params)."""
+    digest = hashlib.sha1(repr(parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(
+        candidate.strip().removeprefix("W/") == opaque
+        for candidate in if_none_match.split(",")
+    )
+
+
+def conditional_response(
+    request: Request, response: Response, *fingerprint: Any
+) -> Optional[Response]:
+    """
+    Answer a conditional GET from a fingerprint of the data behind a listing.
+
+    The request's query string is folded into the tag so each page and filter
+    gets its own ETag. Returns a bodiless 304 when the client's copy is still
+    current, otherwise sets the ETag header on `response` and returns None so
+    the endpoint builds the full payload.
+    """
+    etag = weak_etag(request.url.path, request.url.query, *fingerprint)
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
@@ -0,0 +1,157 @@
+# Keyset (cursor) pagination helpers
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Tuple
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import Row, Select, tuple_
+from sqlalchemy.orm import Query as OrmQuery
+from sqlalchemy.orm import Session
+
+# Page size when a cursor is sent without a limit
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 500
+
+# Response header carrying the cursor for the next page (absent on the last page)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class PageParams:
+    """
+    Query parameters shared by every paginated list endpoint.
+
+    Pagination is opt-in: a request with neither `limit` nor `cursor` gets the
+    whole listing, as before pagination existed, so clients that do not know
+    about X-Next-Cursor are never silently truncated. `limit` is None then.
+    """
+
+    def __init__(
+        self,
+        cursor: Optional[str] = Query(
+            None, description="Opaque cursor from the previous page's X-Next-Cursor"
+        ),
+        limit: Optional[int] = Query(
+            None,
+            ge=1,
+            le=MAX_PAGE_SIZE,
+            description="Page size; without it (and a cursor) nothing is paged",
+        ),
+    ):
+        self.cursor = cursor
+        if limit is None and cursor is not None:
+            limit = DEFAULT_PAGE_SIZE
+        self.limit = limit
+
+
+def encode_cursor(sort_value: Any, row_id: Any) -> str:
+    """Encode the last row's (sort value, id) into an opaque cursor."""
+    if isinstance(sort_value, (date, datetime)):
+        sort_value = sort_value.isoformat()
+    raw = json.dumps([sort_value, row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[Any, Any]:
+    """Decode a cursor produced by encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        sort_value, row_id = json.loads(base64.urlsafe_b64decode(padded))
+        return sort_value, row_id
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def _coerce(column, value: Any) -> Any:
+    """Convert a decoded JSON value back to the column's Python type."""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if value is None or isinstance(value, python_type):
+        return value
+    try:
+        if python_type is datetime:
+            return datetime.fromisoformat(value)
+        if python_type is date:
+            return date.fromisoformat(value)
+        return python_type(value)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
+
+
+def paginate(
+    query: OrmQuery,
+    sort_column,
+    id_column,
+    cursor: Optional[str],
+    limit: Optional[int],
+) -> Tuple[List[Any], Optional[str]]:
+    """
+    Return one page of `query` ordered by (sort_column, id_column).
+
+    Rows after the cursor are selected with a row-value comparison, which a
+    composite index on the same columns serves as a range scan, so deep pages
+    cost the same as the first one. One extra row is fetched to detect whether
+    another page exists. A `limit` of None returns every row.
+    """
+    if cursor:
+        query = query.filter(_after_cursor(sort_column, id_column, cursor))
+
+    rows = query.order_by(sort_column, id_column).limit(_look_ahead(limit)).all()
+    return _split_page(rows, sort_column, id_column, limit)
+
+
+def paginate_rows(
+    db: Session,
+    statement: Select,
+    sort_column,
+    id_column,
+    cursor: Optional[str],
+    limit: Optional[int],
+) -> Tuple[List[Row], Optional[str]]:
+    """
+    Like paginate, for a Core SELECT: returns Row tuples, not ORM objects.
+
+    The statement must select `sort_column` and `id_column` under their keys.
+    """
+    if cursor:
+        statement = statement.where(_after_cursor(sort_column, id_column, cursor))
+
+    rows = db.execute(
+        statement.order_by(sort_column, id_column).limit(_look_ahead(limit))
+    ).all()
+    return _split_page(rows, sort_column, id_column, limit)
+
+
+def _after_cursor(sort_column, id_column, cursor: str):
+    """Row-value condition selecting the rows after `cursor`."""
+    sort_value, row_id = decode_cursor(cursor)
+    return tuple_(sort_column, id_column) > tuple_(
+        _coerce(sort_column, sort_value), _coerce(id_column, row_id)
+    )
+
+
+def _look_ahead(limit: Optional[int]) -> Optional[int]:
+    """LIMIT that fetches one row past the page (no LIMIT when unpaged)."""
+    return None if limit is None else limit + 1
+
+
+def _split_page(
+    rows: List[Any], sort_column, id_column, limit: Optional[int]
+) -> Tuple[List[Any], Optional[str]]:
+    """Trim the look-ahead row and build the next cursor from the last row."""
+    if limit is None or len(rows) <= limit:
+        return rows, None
+
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, encode_cursor(
+        getattr(last, sort_column.key), getattr(last, id_column.key)
+    )
+
+
+def set_next_cursor(response: Response, next_cursor: Optional[str]) -> None:
+    """Expose the next page's cursor on the response, if there is one."""
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
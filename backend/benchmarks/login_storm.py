@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Benchmark: /kids latency with and without a concurrent login storm.
+
+Runs the app under uvicorn against a throwaway SQLite database, measures
+GET /kids latency on its own, then again while several clients hammer
+POST /auth/login. Pass --shared-pool to hash on FastAPI's default thread
+pool instead of the dedicated password pool, for comparison.
+
+Usage: python benchmarks/login_storm.py [--requests N] [--storm-clients N] [--shared-pool]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+from datetime import date
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DB_PATH = "./benchmark_login_storm.db"
+os.environ.setdefault("APP_ENV", "test")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+from fastapi.concurrency import run_in_threadpool  # noqa: E402
+
+from app.api import auth  # noqa: E402
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.core.passwords import hash_password  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models.daycare import Daycare  # noqa: E402
+from app.models.educator import Educator  # noqa: E402
+from app.models.group import Group  # noqa: E402
+from app.models.kid import Kid  # noqa: E402
+
+PORT = 8765
+BASE_URL = f"http://127.0.0.1:{PORT}"
+PASSWORD = "benchmark-password"
+
+
+class SharedPoolHasher:
+    """Hash on the default thread pool (the behavior the dedicated pool avoids)."""
+
+    async def run(self, func, *args):
+        return await run_in_threadpool(func, *args)
+
+
+def seed(kids: int) -> str:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        daycare = Daycare(name="Benchmark Daycare")
+        db.add(daycare)
+        db.commit()
+        group = Group(name="Group A", daycare_id=daycare.id)
+        db.add(group)
+        db.commit()
+        db.add_all(
+            Kid(
+                full_name=f"Kid {i:04d}",
+                dob=date(2020, 1, 1),
+                daycare_id=daycare.id,
+                group_id=group.id,
+            )
+            for i in range(kids)
+        )
+        db.add(
+            Educator(
+                full_name="Benchmark Educator",
+                role="educator",
+                email="bench@example.com",
+                daycare_id=daycare.id,
+                password_hash=hash_password(PASSWORD),
+            )
+        )
+        db.commit()
+        return daycare.id
+    finally:
+        db.close()
+
+
+def measure(daycare_id: str, count: int) -> list:
+    latencies = []
+    with httpx.Client() as http:
+        for _ in range(count):
+            start = time.perf_counter()
+            response = http.get(
+                f"{BASE_URL}/api/v1/kids", params={"daycare_id": daycare_id}
+            )
+            response.raise_for_status()
+            latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def storm(stop: threading.Event, counts: list) -> None:
+    with httpx.Client() as http:
+        while not stop.is_set():
+            response = http.post(
+                f"{BASE_URL}/api/v1/auth/login",
+                json={"email": "bench@example.com", "password": PASSWORD},
+            )
+            counts.append(response.status_code)
+
+
+def report(label: str, latencies: list) -> None:
+    ordered = sorted(latencies)
+    p99 = ordered[max(0, int(len(ordered) * 0.99) - 1)]
+    print(
+        f"{label:<22} p50={statistics.median(ordered):7.1f} ms  "
+        f"p99={p99:7.1f} ms  max={ordered[-1]:7.1f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--kids", type=int, default=100)
+    parser.add_argument("--storm-clients", type=int, default=16)
+    parser.add_argument("--shared-pool", action="store_true")
+    args = parser.parse_args()
+
+    if args.shared_pool:
+        auth.password_hasher = SharedPoolHasher()
+
+    daycare_id = seed(args.kids)
+    server = uvicorn.Server(
+        uvicorn.Config(app, port=PORT, log_level="warning", lifespan="off")
+    )
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+
+    try:
+        measure(daycare_id, 20)  # warm up
+        report("/kids alone", measure(daycare_id, args.requests))
+
+        stop = threading.Event()
+        statuses: list = []
+        stormers = [
+            threading.Thread(target=storm, args=(stop, statuses))
+            for _ in range(args.storm_clients)
+        ]
+        for thread in stormers:
+            thread.start()
+        time.sleep(0.5)
+        report("/kids during storm", measure(daycare_id, args.requests))
+        stop.set()
+        for thread in stormers:
+            thread.join()
+
+        ok = statuses.count(200)
+        shed = statuses.count(503)
+        print(f"logins: {ok} ok, {shed} shed with 503, {len(statuses)} total")
+    finally:
+        server.should_exit = True
+        if os.path.exists(DB_PATH):
+            os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
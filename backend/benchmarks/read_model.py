@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""Benchmark: ORM list path vs the Core read model at 10k rows.
+
+Seeds a throwaway SQLite database, then for kids (full and summary), parents,
+educators and events runs both paths the way an endpoint would: query, then
+validate into the response model and dump JSON. Reports median latency and
+peak traced memory per path.
+
+Usage: python benchmarks/read_model.py [--rows N] [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+from typing import List
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+DB_PATH = "./benchmark_read_model.db"
+os.environ.setdefault("APP_ENV", "test")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_PATH}"
+
+from pydantic import TypeAdapter  # noqa: E402
+from sqlalchemy.orm import selectinload  # noqa: E402
+
+from app.core.database import Base, SessionLocal, engine  # noqa: E402
+from app.models.daycare import Daycare  # noqa: E402
+from app.models.educator import Educator  # noqa: E402
+from app.models.event import Event  # noqa: E402
+from app.models.group import Group  # noqa: E402
+from app.models.kid import Kid, TrustedAdult  # noqa: E402
+from app.models.parent import Parent  # noqa: E402
+from app.models.schemas import EventWithImages  # noqa: E402
+from app.schemas.educators import EducatorOut  # noqa: E402
+from app.schemas.kid import KidOut, KidSummaryOut  # noqa: E402
+from app.schemas.parents import ParentOut  # noqa: E402
+from app.services.kid_service import (  # noqa: E402
+    KID_OUT_LOADERS,
+    apply_effective_attendance,
+)
+from app.services.read_model import (  # noqa: E402
+    get_educator_rows,
+    get_event_rows,
+    get_kid_rows,
+    get_parent_rows,
+)
+from app.utils.pagination import paginate  # noqa: E402
+
+
+def seed(rows: int) -> str:
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        daycare = Daycare(name="Benchmark Daycare")
+        db.add(daycare)
+        db.commit()
+        groups = [Group(name=f"Group {i}", daycare_id=daycare.id) for i in range(4)]
+        db.add_all(groups)
+        db.commit()
+
+        parents = [
+            Parent(
+                full_name=f"Parent {i:05d}",
+                email=f"parent{i}@example.com",
+                phone_num="+1555000000",
+                daycare_id=daycare.id,
+            )
+            for i in range(rows)
+        ]
+        db.add_all(parents)
+        for i in range(rows):
+            kid = Kid(
+                full_name=f"Kid {i:05d}",
+                dob=date(2020, 1, 1),
+                daycare_id=daycare.id,
+                group_id=groups[i % 4].id,
+                allergies="Peanuts, tree nuts and shellfish " * 4,
+                need_to_know="Naps after lunch, needs an inhaler before sport " * 4,
+                trusted_adults=[TrustedAdult(name="Grandma", phone_num="+1555")],
+            )
+            kid.parents.append(parents[i])
+            db.add(kid)
+        db.add_all(
+            Educator(
+                full_name=f"Educator {i:05d}",
+                role="educator",
+                email=f"educator{i}@example.com",
+                daycare_id=daycare.id,
+                groups=[groups[i % 4]],
+            )
+            for i in range(rows)
+        )
+        # No images: EventImage rows lack the image_url the ORM path would need
+        start = datetime(2026, 1, 1, 9)
+        db.add_all(
+            Event(
+                daycare_id=daycare.id,
+                title=f"Event {i}",
+                description="Bring a hat and a water bottle",
+                date=start + timedelta(hours=i),
+            )
+            for i in range(rows)
+        )
+        db.commit()
+        return daycare.id
+    finally:
+        db.close()
+
+
+def run(fn, repeat: int):
+    """Median latency (ms) and peak traced memory (MB) of fn() with a fresh session."""
+    latencies: List[float] = []
+    for _ in range(repeat):
+        db = SessionLocal()
+        try:
+            start = time.perf_counter()
+            fn(db)
+            latencies.append((time.perf_counter() - start) * 1000)
+        finally:
+            db.close()
+
+    db = SessionLocal()
+    try:
+        tracemalloc.start()
+        fn(db)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    finally:
+        db.close()
+    return statistics.median(latencies), peak / 1024 / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"Seeding {args.rows} rows per table...")
+    daycare_id = seed(args.rows)
+    limit = args.rows
+
+    kids_out = TypeAdapter(List[KidOut])
+    summary_out = TypeAdapter(List[KidSummaryOut])
+    parents_out = TypeAdapter(List[ParentOut])
+    educators_out = TypeAdapter(List[EducatorOut])
+    events_out = TypeAdapter(List[EventWithImages])
+
+    def orm_kids(db):
+        query = (
+            db.query(Kid).options(*KID_OUT_LOADERS).filter(Kid.daycare_id == daycare_id)
+        )
+        kids, _ = paginate(query, Kid.full_name, Kid.id, None, limit)
+        kids_out.dump_json(
+            kids_out.validate_python(apply_effective_attendance(db, kids))
+        )
+
+    def core_kids(db):
+        kids, _ = get_kid_rows(db, daycare_id, None, None, limit)
+        kids_out.dump_json(kids_out.validate_python(kids))
+
+    def core_summary(db):
+        kids, _ = get_kid_rows(db, daycare_id, None, None, limit, summary=True)
+        summary_out.dump_json(summary_out.validate_python(kids))
+
+    def orm_parents(db):
+        query = db.query(Parent).filter(Parent.daycare_id == daycare_id)
+        parents, _ = paginate(query, Parent.full_name, Parent.id, None, limit)
+        parents_out.dump_json(parents_out.validate_python(parents))
+
+    def core_parents(db):
+        parents, _ = get_parent_rows(db, daycare_id, None, None, limit)
+        parents_out.dump_json(parents_out.validate_python(parents))
+
+    def orm_educators(db):
+        query = db.query(Educator).options(selectinload(Educator.groups))
+        query = query.filter(Educator.daycare_id == daycare_id)
+        educators, _ = paginate(query, Educator.full_name, Educator.id, None, limit)
+        educators_out.dump_json(educators_out.validate_python(educators))
+
+    def core_educators(db):
+        educators, _ = get_educator_rows(db, daycare_id, None, None, None, limit)
+        educators_out.dump_json(educators_out.validate_python(educators))
+
+    def orm_events(db):
+        # Each event's images relationship lazy-loads on serialization
+        query = db.query(Event).filter(Event.daycare_id == daycare_id)
+        events, _ = paginate(query, Event.date, Event.id, None, limit)
+        events_out.dump_json(events_out.validate_python(events))
+
+    def core_events(db):
+        events, _ = get_event_rows(db, daycare_id, limit=limit)
+        events_out.dump_json(events_out.validate_python(events))
+
+    cases = [
+        ("kids (full)", orm_kids, core_kids),
+        # ORM full rows vs the summary projection clients can ask for instead
+        ("kids (summary)", orm_kids, core_summary),
+        ("parents", orm_parents, core_parents),
+        ("educators", orm_educators, core_educators),
+        ("events", orm_events, core_events),
+    ]
+    print(f"{'endpoint':<16}{'ORM ms':>10}{'Core ms':>10}{'ORM MB':>10}{'Core MB':>10}")
+    for label, orm_fn, core_fn in cases:
+        orm_ms, orm_mb = run(orm_fn, args.repeat)
+        core_ms, core_mb = run(core_fn, args.repeat)
+        print(
+            f"{label:<16}{orm_ms:>10.1f}{core_ms:>10.1f}{orm_mb:>10.1f}{core_mb:>10.1f}"
+        )
+
+    os.remove(DB_PATH)
+
+
+if __name__ == "__main__":
+    main()
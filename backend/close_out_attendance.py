@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""Nightly close-out: snapshot every kid's effective attendance into the ledger.
+
+Usage: python close_out_attendance.py [YYYY-MM-DD]
+"""
+
+import sys
+from datetime import date
+
+from app.core.database import SessionLocal
+from app.services.kid_service import close_out_attendance_day
+
+target_date = date.fromisoformat(sys.argv[1]) if len(sys.argv) > 1 else date.today()
+
+db = SessionLocal()
+try:
+    written = close_out_attendance_day(db, target_date)
+    print(f"Closed out attendance for {target_date}: {written} entries written")
+except Exception as e:
+    db.rollback()
+    print(f"Close-out failed: {e}")
+    sys.exit(1)
+finally:
+    db.close()
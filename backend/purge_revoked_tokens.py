@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""Nightly cleanup: delete revocations of access tokens that have expired.
+
+Usage: python purge_revoked_tokens.py
+"""
+
+import sys
+
+from app.core.database import SessionLocal
+from app.services.auth_service import purge_expired_revocations
+
+db = SessionLocal()
+try:
+    deleted = purge_expired_revocations(db)
+    print(f"Purged {deleted} expired token revocations")
+except Exception as e:
+    db.rollback()
+    print(f"Purge failed: {e}")
+    sys.exit(1)
+finally:
+    db.close()
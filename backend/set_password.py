@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""Set the login password of an educator or parent.
+
+Usage: python set_password.py educator|parent EMAIL
+"""
+
+import getpass
+import sys
+
+from app.core.database import SessionLocal
+from app.core.passwords import hash_password
+from app.services.auth_service import find_login_account
+
+if len(sys.argv) != 3 or sys.argv[1] not in ("educator", "parent"):
+    print(__doc__)
+    sys.exit(2)
+
+account_type, email = sys.argv[1], sys.argv[2]
+
+db = SessionLocal()
+try:
+    account = find_login_account(db, account_type, email)
+    if account is None:
+        print(f"No {account_type} with email {email}")
+        sys.exit(1)
+    account.password_hash = hash_password(getpass.getpass("New password: "))
+    db.commit()
+    print(f"Password set for {account_type} {email}")
+finally:
+    db.close()
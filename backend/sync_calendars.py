@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+"""Incremental sync of every linked daycare calendar (run every few minutes).
+
+Usage: python sync_calendars.py
+"""
+
+import sys
+
+from app.core.database import SessionLocal
+from app.services.calendar_sync import CalendarClient, sync_all_calendars
+
+db = SessionLocal()
+try:
+    results = sync_all_calendars(db, CalendarClient.from_settings())
+    for daycare_id, result in results.items():
+        if result is None:
+            print(f"{daycare_id}: sync failed")
+        else:
+            print(
+                f"{daycare_id}: pulled {result.pulled} (-{result.pulled_deletes}), "
+                f"pushed {result.pushed} (-{result.pushed_deletes})"
+                + (", full resync" if result.full_resync else "")
+            )
+    if any(result is None for result in results.values()):
+        sys.exit(1)
+finally:
+    db.close()
@@ -1,18 +1,33 @@
+import itertools
 import os
+from contextlib import contextmanager
+from datetime import date
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker
 
 # Set test environment BEFORE importing app
 os.environ["APP_ENV"] = "test"
 os.environ["ENVIRONMENT"] = "test"
 os.environ["SECRET_KEY"] = "test-secret-key"
+os.environ["DB_RAISE_ON_LAZY_LOAD"] = "true"
+os.environ["ALLOW_DEV_DAYCARE_SCOPE"] = "true"
 
 from app.core.database import Base, get_db
 from app.core.security import create_access_token
 from app.main import app
+from app.models.daycare import Daycare
+from app.models.group import Group
+from app.models.kid import Kid, TrustedAdult
+from app.models.parent import Parent
+from app.services.auth_service import revocation_store
+from app.services.authorization_service import parent_link_cache
+from app.services.calendar_feed import calendar_feed_cache
+from app.services.pickup_pass_service import pickup_version_cache
+from app.utils.daycare_resolver import daycare_cache
 
 # Create test database
 SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
@@ -64,6 +79,12 @@ def clean_db():
         for table in tables:
             conn.execute(text(f"DELETE FROM {table}"))
         conn.commit()
+    # Raw DELETEs bypass the ORM hooks that invalidate cached parent links
+    parent_link_cache.clear()
+    daycare_cache.clear()
+    revocation_store.clear()
+    pickup_version_cache.clear()
+    calendar_feed_cache.clear()
     yield
 
 
@@ -108,3 +129,153 @@ def make_token():
         return create_access_token(data)
 
     return _make_token
+
+
+@pytest.fixture
+def count_queries():
+    """Helper fixture to count SQL statements executed by any engine.
+
+    Listens on the Engine class because test modules may import this conftest
+    under a different module name, which gives them their own engine object.
+    """
+
+    @contextmanager
+    def _count_queries():
+        statements = []
+
+        def _before_cursor_execute(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        try:
+            yield statements
+        finally:
+            event.remove(Engine, "before_cursor_execute", _before_cursor_execute)
+
+    return _count_queries
+
+
+@pytest.fixture
+def auth_headers(make_token):
+    """Helper fixture to build a bearer Authorization header for a daycare."""
+
+    def _auth_headers(
+        daycare_id: str = "default-daycare-id", user_id: str = "1", role="educator"
+    ):
+        token = make_token(user_id, role, daycare_id=daycare_id)
+        return {"Authorization": f"Bearer {token}"}
+
+    return _auth_headers
+
+
+@pytest.fixture
+def make_daycare():
+    """Helper fixture to create a daycare and return its ID."""
+
+    def _make_daycare(name: str = "Test Daycare") -> str:
+        db = TestingSessionLocal()
+        try:
+            daycare = Daycare(name=name)
+            db.add(daycare)
+            db.commit()
+            return daycare.id
+        finally:
+            db.close()
+
+    return _make_daycare
+
+
+@pytest.fixture
+def make_group():
+    """Helper fixture to create a group in a daycare and return its ID."""
+
+    def _make_group(daycare_id: str, name: str = "Group A") -> int:
+        db = TestingSessionLocal()
+        try:
+            group = Group(name=name, daycare_id=daycare_id)
+            db.add(group)
+            db.commit()
+            return group.id
+        finally:
+            db.close()
+
+    return _make_group
+
+
+@pytest.fixture
+def make_parent():
+    """Helper fixture to create a parent with a unique email and return its ID."""
+    numbers = itertools.count()
+
+    def _make_parent(
+        daycare_id: str, full_name: str = "Test Parent", email: str = None
+    ) -> int:
+        db = TestingSessionLocal()
+        try:
+            parent = Parent(
+                full_name=full_name,
+                email=email or f"parent{next(numbers)}@example.com",
+                phone_num="+1234567890",
+                daycare_id=daycare_id,
+            )
+            db.add(parent)
+            db.commit()
+            return parent.id
+        finally:
+            db.close()
+
+    return _make_parent
+
+
+@pytest.fixture
+def make_kids():
+    """Helper fixture to create kids named "Kid 0".."Kid n" and return their IDs.
+
+    Kids are linked to `parent_ids`, get copies of `trusted_adults`, and any
+    other keyword sets a Kid column, e.g. attendance.
+    """
+
+    def _make_kids(
+        daycare_id: str,
+        group_id: int,
+        count: int = 1,
+        parent_ids: list = (),
+        trusted_adults: list = (),
+        **fields,
+    ) -> list:
+        db = TestingSessionLocal()
+        try:
+            parents = db.query(Parent).filter(Parent.id.in_(parent_ids)).all()
+            kids = [
+                Kid(
+                    **{"full_name": f"Kid {i}", "dob": date(2020, 1, 1), **fields},
+                    daycare_id=daycare_id,
+                    group_id=group_id,
+                    parents=list(parents),
+                    trusted_adults=[TrustedAdult(**adult) for adult in trusted_adults],
+                )
+                for i in range(count)
+            ]
+            db.add_all(kids)
+            db.commit()
+            return [kid.id for kid in kids]
+        finally:
+            db.close()
+
+    return _make_kids
+
+
+@pytest.fixture
+def make_roster(make_daycare, make_group, make_kids):
+    """Helper fixture to create a daycare with one group of kids.
+
+    Returns (daycare ID, group ID, kid IDs); keywords go to `make_kids`.
+    """
+
+    def _make_roster(kid_count: int = 1, **kid_fields) -> tuple:
+        daycare_id = make_daycare()
+        group_id = make_group(daycare_id)
+        kid_ids = make_kids(daycare_id, group_id, count=kid_count, **kid_fields)
+        return daycare_id, group_id, kid_ids
+
+    return _make_roster
@@ -0,0 +1,104 @@
+import asyncio
+import threading
+import time
+from datetime import date
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.services.attendance_hub import AttendanceHub, attendance_hub
+
+client = TestClient(app)
+
+
+def test_hub_filters_by_daycare_and_group():
+    """Subscribers only see changes for their own scope."""
+    hub = AttendanceHub()
+    hub.publish("attendance", "dc-1", 1, 10, "in-care", date(2026, 3, 4))
+    hub.publish("absence", "dc-1", 2, 20, "sick", date(2026, 3, 4))
+    hub.publish("attendance", "dc-2", 1, 30, "out", date(2026, 3, 4))
+
+    batch = hub.changes_since(0, "dc-1")
+    assert [c.kid_id for c in batch.changes] == [10, 20]
+    assert batch.last_seq == 3
+    assert not batch.reset
+
+    batch = hub.changes_since(0, "dc-1", group_id=2)
+    assert [c.kid_id for c in batch.changes] == [20]
+    assert batch.changes[0].to_dict()["date"] == "2026-03-04"
+
+
+def test_hub_signals_reset_when_changes_were_evicted():
+    """Clients that fall behind the ring buffer are told to re-fetch."""
+    hub = AttendanceHub(buffer_size=2)
+    for kid_id in range(4):
+        hub.publish("attendance", "dc-1", 1, kid_id, "out", date(2026, 3, 4))
+
+    assert hub.changes_since(0, "dc-1").reset
+    assert not hub.changes_since(2, "dc-1").reset
+    # A cursor from before a restart is ahead of the hub
+    assert AttendanceHub().changes_since(5, "dc-1").reset
+
+
+def test_hub_wakes_waiters_published_from_another_thread():
+    """Sync endpoints publishing from the thread pool wake async waiters."""
+    hub = AttendanceHub()
+
+    async def wait():
+        return await hub.wait_for_changes(0, "dc-1", timeout=5)
+
+    timer = threading.Timer(
+        0.05,
+        hub.publish,
+        args=("attendance", "dc-1", 1, 10, "in-care", date(2026, 3, 4)),
+    )
+    timer.start()
+    started = time.monotonic()
+    batch = asyncio.run(wait())
+    timer.join()
+
+    assert [c.kid_id for c in batch.changes] == [10]
+    assert time.monotonic() - started < 2
+
+
+def test_long_poll_returns_committed_attendance_change(clean_db, make_roster):
+    """The long-poll endpoint reports an educator's attendance toggle."""
+    daycare_id, group_id, (kid_id,) = make_roster()
+
+    since = attendance_hub.last_seq
+    response = client.patch(
+        f"/api/v1/kids/{kid_id}/attendance", json={"attendance": "in-care"}
+    )
+    assert response.status_code == 200
+
+    response = client.get(
+        "/api/v1/kids/attendance/changes",
+        params={"daycare_id": daycare_id, "since": since, "timeout": 0},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["reset"] is False
+    assert data["last_seq"] == since + 1
+    assert data["changes"] == [
+        {
+            "seq": since + 1,
+            "kind": "attendance",
+            "daycare_id": daycare_id,
+            "group_id": group_id,
+            "kid_id": kid_id,
+            "attendance": "in-care",
+            "date": date.today().isoformat(),
+        }
+    ]
+
+
+def test_long_poll_times_out_empty(clean_db):
+    """With nothing new the long-poll returns an empty batch at the timeout."""
+    response = client.get(
+        "/api/v1/kids/attendance/changes",
+        params={"daycare_id": "default-daycare-id", "timeout": 0.05},
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["changes"] == []
+    assert data["last_seq"] == attendance_hub.last_seq
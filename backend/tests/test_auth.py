@@ -4,9 +4,14 @@ from unittest.mock import patch
 
 import pytest
 from fastapi.testclient import TestClient
+from freezegun import freeze_time
 from jose import jwt
 
-from app.core.security import create_access_token, decode_access_token
+from app.core.security import (
+    VerifiedTokenCache,
+    create_access_token,
+    decode_access_token,
+)
 from app.main import app
 
 client = TestClient(app)
@@ -117,6 +122,64 @@ class TestJWTSecurity:
             decode_access_token(expired_token)
 
 
+class TestVerifiedTokenCache:
+    """Test the verified-JWT cache used by get_current_user."""
+
+    def test_repeated_token_is_verified_once(self):
+        """Only the first decode of a token runs signature verification."""
+        cache = VerifiedTokenCache()
+        token = create_access_token({"sub": "1", "role": "educator"})
+
+        with patch(
+            "app.core.security.decode_access_token", wraps=decode_access_token
+        ) as verify:
+            first = cache.decode(token)
+            second = cache.decode(token)
+
+        assert verify.call_count == 1
+        assert first == second
+        assert first["sub"] == "1"
+        assert cache.stats() == {"hits": 1, "misses": 1, "size": 1}
+
+    def test_entries_honored_only_until_exp(self):
+        """A cached token is re-verified (and rejected) once it expires."""
+        cache = VerifiedTokenCache()
+        token = create_access_token(
+            {"sub": "1", "role": "educator"}, expires_delta=timedelta(seconds=60)
+        )
+        cache.decode(token)
+
+        with freeze_time(datetime.now(timezone.utc) + timedelta(seconds=120)):
+            with pytest.raises(Exception):
+                cache.decode(token)
+        assert cache.stats()["hits"] == 0
+
+    def test_invalid_tokens_are_not_cached(self):
+        """Tokens that fail verification fail every time."""
+        cache = VerifiedTokenCache()
+        for _ in range(2):
+            with pytest.raises(Exception):
+                cache.decode("invalid.token.here")
+        assert cache.stats() == {"hits": 0, "misses": 2, "size": 0}
+
+    def test_cache_is_bounded(self):
+        """The least recently used token is evicted past maxsize."""
+        cache = VerifiedTokenCache(maxsize=2)
+        tokens = [create_access_token({"sub": str(i)}) for i in range(3)]
+        for token in tokens:
+            cache.decode(token)
+        assert cache.stats()["size"] == 2
+
+        cache.decode(tokens[0])
+        assert cache.stats()["hits"] == 0
+
+    def test_health_exposes_counters(self):
+        """Hit/miss counters are visible on the health endpoint."""
+        response = client.get("/health")
+        assert response.status_code == 200
+        assert set(response.json()["token_cache"]) == {"hits", "misses", "size"}
+
+
 class TestAuthEndpoints:
     """Test authentication endpoints."""
 
@@ -478,3 +541,131 @@ def test_logout(client_fixture):
     assert response.status_code == 200
     data = response.json()
     assert data["message"] == "Logged out successfully"
+
+
+def test_logout_revokes_token(client_fixture):
+    """After logout the same token is rejected; a fresh token still works."""
+    token = client_fixture.post("/api/v1/auth/switch-role?role=educator").json()[
+        "access_token"
+    ]
+    headers = {"Authorization": f"Bearer {token}"}
+    assert client_fixture.get("/api/v1/auth/me", headers=headers).status_code == 200
+
+    assert (
+        client_fixture.post("/api/v1/auth/logout", headers=headers).status_code == 200
+    )
+
+    response = client_fixture.get("/api/v1/auth/me", headers=headers)
+    assert response.status_code == 401
+    assert response.json()["detail"] == "Token has been revoked"
+
+    other = client_fixture.post("/api/v1/auth/switch-role?role=educator").json()[
+        "access_token"
+    ]
+    response = client_fixture.get(
+        "/api/v1/auth/me", headers={"Authorization": f"Bearer {other}"}
+    )
+    assert response.status_code == 200
+
+
+def test_revocations_from_other_workers_are_pulled_incrementally(count_queries):
+    """A store picks up rows written elsewhere, reading only new ids."""
+    from app.models.revoked_token import RevokedToken
+    from app.services.auth_service import RevocationStore
+    from tests.conftest import TestingSessionLocal
+
+    expires_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+    store = RevocationStore(refresh_interval=60)
+    db = TestingSessionLocal()
+    try:
+        db.add(RevokedToken(jti="first", expires_at=expires_at))
+        db.commit()
+        store.refresh(db)
+        assert store.is_revoked("first")
+
+        db.add(RevokedToken(jti="second", expires_at=expires_at))
+        db.commit()
+        with count_queries() as statements:
+            store.refresh(db)
+        assert statements == []  # not due yet
+        assert not store.is_revoked("second")
+
+        store.refresh(db, force=True)
+        assert store.is_revoked("second")
+        assert not store.is_revoked("never-revoked")
+    finally:
+        db.close()
+
+
+def test_revocations_committed_out_of_id_order_are_not_missed():
+    """A row whose id was skipped by a refresh is picked up once committed."""
+    from app.models.revoked_token import RevokedToken
+    from app.services.auth_service import RevocationStore
+    from tests.conftest import TestingSessionLocal
+
+    expires_at = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(hours=1)
+    store = RevocationStore(refresh_interval=60)
+    db = TestingSessionLocal()
+    try:
+        # id 11 commits while the logout holding id 10 is still in flight
+        db.add(RevokedToken(id=11, jti="later", expires_at=expires_at))
+        db.commit()
+        store.refresh(db, force=True)
+        assert store.is_revoked("later")
+
+        db.add(RevokedToken(id=10, jti="earlier", expires_at=expires_at))
+        db.commit()
+        store.refresh(db, force=True)
+        assert store.is_revoked("earlier")
+
+        # Ids that never commit are only looked for until the timeout
+        store.gap_timeout = 0
+        db.add(RevokedToken(id=14, jti="latest", expires_at=expires_at))
+        db.commit()
+        store.refresh(db, force=True)
+        assert store.is_revoked("latest")
+        assert 12 not in store._gaps and 13 not in store._gaps
+    finally:
+        db.close()
+
+
+def test_expired_revocations_are_purged():
+    """Rows of expired tokens are deleted; live revocations stay in force."""
+    from sqlalchemy import select
+
+    from app.models.revoked_token import RevokedToken
+    from app.services.auth_service import RevocationStore, purge_expired_revocations
+    from tests.conftest import TestingSessionLocal
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)
+    store = RevocationStore(refresh_interval=60)
+    db = TestingSessionLocal()
+    try:
+        db.add_all(
+            [
+                RevokedToken(jti="expired", expires_at=now - timedelta(minutes=1)),
+                RevokedToken(jti="live", expires_at=now + timedelta(hours=1)),
+            ]
+        )
+        db.commit()
+
+        assert purge_expired_revocations(db) == 1
+        assert db.scalars(select(RevokedToken.jti)).all() == ["live"]
+        assert purge_expired_revocations(db) == 0
+
+        store.refresh(db, force=True)
+        assert store.is_revoked("live")
+    finally:
+        db.close()
+
+
+def test_bloom_filter_has_no_false_negatives():
+    from app.services.auth_service import BloomFilter
+
+    bloom = BloomFilter(capacity=1000)
+    items = [f"jti-{i}" for i in range(1000)]
+    for item in items:
+        bloom.add(item)
+    assert all(item in bloom for item in items)
+    false_positives = sum(f"other-{i}" in bloom for i in range(10000))
+    assert false_positives < 100
@@ -0,0 +1,251 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.daycare import Daycare
+from app.models.event import Event
+from app.services import calendar_feed
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def daycares(make_daycare):
+    """Two daycares; Sunny has two events, Rainy one."""
+    sunny_id, rainy_id = make_daycare("Sunny, Side"), make_daycare("Rainy")
+    db = TestingSessionLocal()
+    try:
+        db.add_all(
+            [
+                Event(
+                    title="Picnic; bring hats",
+                    description="Meet at the gate\nLunch provided. " + "é" * 80,
+                    location="Park",
+                    date=datetime(2026, 6, 1, 10),
+                    daycare_id=sunny_id,
+                ),
+                Event(
+                    title="Concert",
+                    date=datetime(2026, 5, 1),
+                    start_time="09:30",
+                    daycare_id=sunny_id,
+                ),
+                Event(
+                    title="Rainy Trip", date=datetime(2026, 5, 2), daycare_id=rainy_id
+                ),
+            ]
+        )
+        db.commit()
+        return sunny_id, rainy_id
+    finally:
+        db.close()
+
+
+@pytest.fixture
+def feed_url():
+    """Issue a daycare a feed secret and return its feed URL."""
+
+    def _feed_url(daycare_id: str) -> str:
+        db = TestingSessionLocal()
+        try:
+            token = calendar_feed.rotate_feed_token(db, daycare_id)
+        finally:
+            db.close()
+        return f"/api/v1/calendar/{daycare_id}.ics?token={token}"
+
+    return _feed_url
+
+
+def _unfold(body: str) -> list:
+    return body.replace("\r\n ", "").split("\r\n")
+
+
+def test_feed_renders_the_daycares_events(clean_db, daycares, feed_url):
+    sunny_id, _ = daycares
+
+    response = client.get(feed_url(sunny_id))
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/calendar; charset=utf-8"
+    body = response.content.decode()
+    assert all(
+        len(line.encode()) <= 75 for line in body.split("\r\n")
+    ), "lines are folded at 75 octets"
+
+    lines = _unfold(body)
+    assert lines[0] == "BEGIN:VCALENDAR"
+    assert lines[-2:] == ["END:VCALENDAR", ""]
+    assert "X-WR-CALNAME:Sunny\\, Side" in lines
+    summaries = [line for line in lines if line.startswith("SUMMARY:")]
+    assert summaries == ["SUMMARY:Concert", "SUMMARY:Picnic\\; bring hats"]
+    assert "DTSTART:20260601T100000Z" in lines
+    assert "DTSTART:20260501T093000Z" in lines, "start_time sets the time of day"
+    assert "LOCATION:Park" in lines
+    assert ("DESCRIPTION:Meet at the gate\\nLunch provided. " + "é" * 80) in lines
+
+    assert client.get("/api/v1/calendar/not-a-daycare.ics?token=x").status_code == 404
+
+
+def test_feed_requires_the_daycares_secret(clean_db, daycares, feed_url):
+    sunny_id, rainy_id = daycares
+    # No secret issued yet
+    assert client.get(f"/api/v1/calendar/{sunny_id}.ics").status_code == 404
+
+    url = feed_url(sunny_id)
+    assert client.get(url).status_code == 200
+    token = url.split("token=")[1]
+    for wrong in (
+        f"/api/v1/calendar/{sunny_id}.ics",
+        f"/api/v1/calendar/{sunny_id}.ics?token=",
+        f"/api/v1/calendar/{sunny_id}.ics?token={token[:-1]}x",
+        # Another daycare's secret does not open this feed
+        f"/api/v1/calendar/{sunny_id}.ics?" + feed_url(rainy_id).split("?")[1],
+        f"/api/v1/calendar/{rainy_id}.ics?token={token}",
+    ):
+        response = client.get(wrong)
+        assert response.status_code == 404, wrong
+        assert "ETag" not in response.headers
+
+
+def test_rotating_the_secret_replaces_the_feed_url(clean_db, daycares, make_token):
+    sunny_id, _ = daycares
+
+    def rotate(role):
+        token = make_token("1", role, daycare_id=sunny_id)
+        return client.post(
+            "/api/v1/calendar/token", headers={"Authorization": f"Bearer {token}"}
+        )
+
+    assert rotate("educator").status_code == 403
+    first = rotate("super_educator")
+    assert first.status_code == 200
+    old_url = first.json()["url"]
+    assert old_url.endswith(
+        f"/api/v1/calendar/{sunny_id}.ics?token={first.json()['token']}"
+    )
+    assert client.get(old_url).status_code == 200
+
+    new_url = rotate("super_educator").json()["url"]
+    assert client.get(new_url).status_code == 200
+    assert client.get(old_url).status_code == 404
+
+    db = TestingSessionLocal()
+    try:
+        stored = db.get(Daycare, sunny_id).calendar_token_hash
+    finally:
+        db.close()
+    assert new_url.split("token=")[1] not in stored, "only a hash is stored"
+
+
+def test_polls_are_served_from_the_cache(clean_db, daycares, count_queries, feed_url):
+    sunny_id, rainy_id = daycares
+    url = feed_url(sunny_id)
+    first = client.get(url)
+
+    with count_queries() as statements:
+        again = client.get(url)
+        not_modified = client.get(url, headers={"If-None-Match": first.headers["ETag"]})
+        not_modified_since = client.get(
+            url, headers={"If-Modified-Since": first.headers["Last-Modified"]}
+        )
+    # Only the feed secret is read; the events are not
+    assert len(statements) == 3
+    assert all("calendar_token_hash" in statement for statement in statements)
+    assert again.content == first.content
+    assert not_modified.status_code == 304
+    assert not_modified_since.status_code == 304
+
+    # A write to another daycare leaves this feed cached
+    db = TestingSessionLocal()
+    try:
+        db.add(Event(title="Elsewhere", date=datetime(2026, 7, 1), daycare_id=rainy_id))
+        db.commit()
+    finally:
+        db.close()
+    with count_queries() as statements:
+        client.get(url)
+    assert len(statements) == 1
+
+
+def test_event_writes_invalidate_the_feed(clean_db, daycares, make_token, feed_url):
+    sunny_id, _ = daycares
+    url = feed_url(sunny_id)
+    etag = client.get(url).headers["ETag"]
+    headers = {
+        "Authorization": f"Bearer {make_token('1', 'educator', daycare_id=sunny_id)}"
+    }
+
+    response = client.post(
+        "/api/v1/events/",
+        json={"title": "Sports Day", "date": "2026-07-01T09:00:00"},
+        headers=headers,
+    )
+    event_id = response.json()["id"]
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert "SUMMARY:Sports Day" in _unfold(response.content.decode())
+
+    client.put(
+        f"/api/v1/events/{event_id}", json={"title": "Field Day"}, headers=headers
+    )
+    assert "SUMMARY:Field Day" in _unfold(client.get(url).content.decode())
+
+    client.delete(f"/api/v1/events/{event_id}", headers=headers)
+    assert "SUMMARY:Field Day" not in _unfold(client.get(url).content.decode())
+
+
+def test_large_feeds_stream_in_chunks(clean_db, daycares, monkeypatch):
+    monkeypatch.setattr(calendar_feed, "EVENTS_PER_CHUNK", 2)
+    sunny_id, _ = daycares
+
+    db = TestingSessionLocal()
+    try:
+        feed = calendar_feed.get_calendar_feed(db, sunny_id)
+    finally:
+        db.close()
+    # Header and first two events, then the footer
+    assert len(feed.chunks) == 2
+    assert b"".join(feed.chunks).count(b"BEGIN:VEVENT") == 2
+
+
+def test_events_without_a_time_are_all_day(clean_db, daycares, feed_url):
+    _, rainy_id = daycares
+
+    lines = _unfold(client.get(feed_url(rainy_id)).content.decode())
+    assert "DTSTART;VALUE=DATE:20260502" in lines
+
+
+def test_last_modified_follows_event_writes_and_deletes(
+    clean_db, daycares, make_token, feed_url
+):
+    _, rainy_id = daycares
+    url = feed_url(rainy_id)
+    db = TestingSessionLocal()
+    try:
+        db.query(Event).update(
+            {"created_at": datetime(2026, 3, 2, 8, 15, 30), "updated_at": None}
+        )
+        db.commit()
+    finally:
+        db.close()
+    calendar_feed.calendar_feed_cache.clear()
+
+    # Rebuilding the feed does not move it
+    assert client.get(url).headers["Last-Modified"] == "Mon, 02 Mar 2026 08:15:30 GMT"
+    calendar_feed.calendar_feed_cache.clear()
+    assert client.get(url).headers["Last-Modified"] == "Mon, 02 Mar 2026 08:15:30 GMT"
+
+    headers = {
+        "Authorization": f"Bearer {make_token('1', 'educator', daycare_id=rainy_id)}"
+    }
+    event_id = client.get("/api/v1/events/", headers=headers).json()[0]["id"]
+    response = client.delete(f"/api/v1/events/{event_id}", headers=headers)
+    assert response.status_code == 204
+
+    deleted = client.get(
+        url, headers={"If-Modified-Since": "Mon, 02 Mar 2026 08:15:30 GMT"}
+    )
+    assert deleted.status_code == 200
+    assert deleted.headers["Last-Modified"] != "Mon, 02 Mar 2026 08:15:30 GMT"
@@ -0,0 +1,369 @@
+import json
+import threading
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.calendar_sync import CalendarSyncState, CalendarTombstone
+from app.models.daycare import Daycare
+from app.models.event import Event
+from app.services.calendar_sync import CalendarClient, CalendarSyncEngine
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+CALENDAR_ID = "sunny@group.calendar.example.com"
+
+
+class FakeCalendar:
+    """In-memory calendar speaking the sync token and etag protocol."""
+
+    def __init__(self):
+        self.events = {}
+        self.changes = []  # event IDs, in the order they changed
+        self.oldest_token = 0
+        self.requests = []
+        self._next_id = 0
+
+    def _touch(self, item):
+        item["etag"] = f'"{len(self.changes) + 1}"'
+        self.events[item["id"]] = item
+        self.changes.append(item["id"])
+
+    def add(self, summary, start, **fields):
+        self._next_id += 1
+        item = {"id": f"remote{self._next_id}", "summary": summary, "start": start}
+        item.update(fields)
+        self._touch(item)
+        return item["id"]
+
+    def edit(self, event_id, **fields):
+        self._touch({**self.events[event_id], **fields})
+
+    def cancel(self, event_id):
+        self._touch({"id": event_id, "status": "cancelled"})
+
+    def expire_tokens(self):
+        self.oldest_token = len(self.changes)
+
+    def handle(self, method, path, query, headers, body):
+        self.requests.append(method)
+        event_id = unquote(path.rsplit("/", 1)[1]) if path.count("/") > 3 else None
+        if method == "GET":
+            return self._list(query)
+        if method == "POST":
+            self._next_id += 1
+            item = {**body, "id": f"local{self._next_id}"}
+            self._touch(item)
+            return 200, item
+        current = self.events.get(event_id)
+        if current is None or current.get("status") == "cancelled":
+            return 404, None
+        if method == "PUT":
+            if headers.get("If-Match") != current["etag"]:
+                return 412, {"error": "precondition failed"}
+            self._touch({**body, "id": event_id})
+            return 200, self.events[event_id]
+        self.cancel(event_id)
+        return 204, None
+
+    def _list(self, query):
+        if "syncToken" in query:
+            token = int(query["syncToken"][0])
+            if token < self.oldest_token:
+                return 410, {"error": "sync token expired"}
+            ids = dict.fromkeys(self.changes[token:])
+            items = [self.events[event_id] for event_id in ids]
+        else:
+            items = [
+                item
+                for item in self.events.values()
+                if item.get("status") != "cancelled"
+            ]
+        offset = int(query.get("pageToken", ["0"])[0])
+        size = int(query["maxResults"][0])
+        page = {"items": items[offset : offset + size]}
+        if offset + size < len(items):
+            page["nextPageToken"] = str(offset + size)
+        else:
+            page["nextSyncToken"] = str(len(self.changes))
+        return 200, page
+
+
+@pytest.fixture
+def fake_calendar():
+    calendar = FakeCalendar()
+
+    class Handler(BaseHTTPRequestHandler):
+        def _respond(self):
+            url = urlparse(self.path)
+            length = int(self.headers.get("Content-Length") or 0)
+            body = json.loads(self.rfile.read(length)) if length else None
+            status, payload = calendar.handle(
+                self.command, url.path, parse_qs(url.query), self.headers, body
+            )
+            data = json.dumps(payload).encode() if payload is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        do_GET = do_POST = do_PUT = do_DELETE = _respond
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    calendar.client = CalendarClient(
+        f"http://127.0.0.1:{server.server_address[1]}", page_size=2
+    )
+    yield calendar
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def daycare_id(make_daycare):
+    """A daycare linked to CALENDAR_ID."""
+    daycare_id = make_daycare("Sunny")
+    db = TestingSessionLocal()
+    try:
+        db.add(CalendarSyncState(daycare_id=daycare_id, calendar_id=CALENDAR_ID))
+        db.commit()
+        return daycare_id
+    finally:
+        db.close()
+
+
+def _sync(daycare_id, calendar):
+    db = TestingSessionLocal()
+    try:
+        return CalendarSyncEngine(db, daycare_id, calendar.client).sync()
+    finally:
+        db.close()
+
+
+def _local_events(daycare_id):
+    db = TestingSessionLocal()
+    try:
+        events = db.query(Event).filter(Event.daycare_id == daycare_id).all()
+        return {event.title: event for event in events}
+    finally:
+        db.close()
+
+
+def test_first_sync_pulls_remote_and_pushes_local_events(
+    clean_db, daycare_id, fake_calendar, auth_headers
+):
+    fake_calendar.add(
+        "Swimming", {"dateTime": "2026-06-01T10:00:00+02:00"}, location="Pool"
+    )
+    fake_calendar.add("Closed", {"date": "2026-06-05"})
+    fake_calendar.add("Parents evening", {"dateTime": "2026-06-10T18:00:00Z"})
+    response = client.post(
+        "/api/v1/events/",
+        json={"title": "Sports Day", "date": "2026-07-01T09:00:00"},
+        headers=auth_headers(daycare_id),
+    )
+    assert response.status_code == 201
+
+    result = _sync(daycare_id, fake_calendar)
+    assert (result.pulled, result.pushed, result.full_resync) == (3, 1, True)
+
+    events = _local_events(daycare_id)
+    assert events["Swimming"].date == datetime(2026, 6, 1, 8)
+    assert events["Swimming"].start_time == "08:00"
+    assert events["Swimming"].location == "Pool"
+    assert events["Closed"].date == datetime(2026, 6, 5)
+    assert events["Closed"].start_time is None
+    assert not any(event.sync_pending for event in events.values())
+
+    sports_day = events["Sports Day"]
+    remote = fake_calendar.events[sports_day.external_id]
+    assert remote["summary"] == "Sports Day"
+    assert remote["start"] == {"dateTime": "2026-07-01T09:00:00Z"}
+    assert sports_day.external_etag == remote["etag"]
+
+    # Nothing changed: one listing, and the echo of our push is skipped
+    fake_calendar.requests.clear()
+    result = _sync(daycare_id, fake_calendar)
+    assert result[:4] == (0, 0, 0, 0)
+    assert fake_calendar.requests == ["GET"]
+
+
+def test_pulled_changes_are_applied_in_batches(
+    clean_db, daycare_id, fake_calendar, count_queries
+):
+    ids = [
+        fake_calendar.add(f"Event {i}", {"dateTime": f"2026-06-0{i}T09:00:00Z"})
+        for i in range(1, 7)
+    ]
+    _sync(daycare_id, fake_calendar)
+
+    fake_calendar.edit(ids[0], summary="Event 1 (moved)")
+    fake_calendar.edit(ids[1], summary="Event 2 (moved)")
+    fake_calendar.cancel(ids[2])
+    fake_calendar.cancel(ids[3])
+    fake_calendar.add("Event 7", {"dateTime": "2026-06-07T09:00:00Z"})
+    fake_calendar.add("Event 8", {"dateTime": "2026-06-08T09:00:00Z"})
+
+    db = TestingSessionLocal()
+    try:
+        engine = CalendarSyncEngine(db, daycare_id, fake_calendar.client)
+        with count_queries() as statements:
+            assert engine.pull() == (4, 2, False)
+    finally:
+        db.close()
+
+    # One executemany each for the new, changed and deleted events
+    for verb in ("INSERT INTO events", "UPDATE events", "DELETE FROM events"):
+        assert sum(statement.startswith(verb) for statement in statements) == 1
+
+    db = TestingSessionLocal()
+    try:
+        # Dates the daycare's calendar feed
+        assert db.get(Daycare, daycare_id).events_deleted_at is not None
+    finally:
+        db.close()
+
+    assert sorted(_local_events(daycare_id)) == [
+        "Event 1 (moved)",
+        "Event 2 (moved)",
+        "Event 5",
+        "Event 6",
+        "Event 7",
+        "Event 8",
+    ]
+
+
+def test_local_edits_and_deletes_are_pushed(
+    clean_db, daycare_id, fake_calendar, auth_headers
+):
+    kept = fake_calendar.add("Swimming", {"dateTime": "2026-06-01T09:00:00Z"})
+    dropped = fake_calendar.add("Zoo trip", {"dateTime": "2026-06-02T09:00:00Z"})
+    _sync(daycare_id, fake_calendar)
+    events = _local_events(daycare_id)
+    headers = auth_headers(daycare_id)
+
+    response = client.put(
+        f"/api/v1/events/{events['Swimming'].id}",
+        json={"title": "Swimming lessons"},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    response = client.delete(f"/api/v1/events/{events['Zoo trip'].id}", headers=headers)
+    assert response.status_code == 204
+
+    result = _sync(daycare_id, fake_calendar)
+    assert (result.pushed, result.pushed_deletes) == (1, 1)
+    assert fake_calendar.events[kept]["summary"] == "Swimming lessons"
+    assert fake_calendar.events[dropped]["status"] == "cancelled"
+
+    db = TestingSessionLocal()
+    try:
+        assert db.query(CalendarTombstone).count() == 0
+    finally:
+        db.close()
+    assert _sync(daycare_id, fake_calendar)[:4] == (0, 0, 0, 0)
+
+
+def test_edits_of_events_gone_from_the_calendar_are_reinserted(
+    clean_db, daycare_id, fake_calendar, auth_headers
+):
+    remote_id = fake_calendar.add("Swimming", {"dateTime": "2026-06-01T09:00:00Z"})
+    _sync(daycare_id, fake_calendar)
+    event_id = _local_events(daycare_id)["Swimming"].id
+
+    # Purged remotely without a cancellation showing up in the listing
+    del fake_calendar.events[remote_id]
+    client.put(
+        f"/api/v1/events/{event_id}",
+        json={"title": "Swimming lessons"},
+        headers=auth_headers(daycare_id),
+    )
+
+    result = _sync(daycare_id, fake_calendar)
+    assert result.pushed == 1
+    event = _local_events(daycare_id)["Swimming lessons"]
+    assert event.external_id != remote_id
+    assert fake_calendar.events[event.external_id]["summary"] == "Swimming lessons"
+    assert not event.sync_pending
+
+
+def test_all_day_events_are_pushed_as_dates(
+    clean_db, daycare_id, fake_calendar, auth_headers
+):
+    headers = auth_headers(daycare_id)
+    client.post(
+        "/api/v1/events/",
+        json={"title": "Closed", "date": "2026-06-05T00:00:00"},
+        headers=headers,
+    )
+    client.post(
+        "/api/v1/events/",
+        json={"title": "Concert", "date": "2026-06-06T00:00:00", "start_time": "17:30"},
+        headers=headers,
+    )
+    _sync(daycare_id, fake_calendar)
+
+    events = _local_events(daycare_id)
+    closed = fake_calendar.events[events["Closed"].external_id]
+    assert closed["start"] == {"date": "2026-06-05"}
+    assert closed["end"] == {"date": "2026-06-06"}
+    concert = fake_calendar.events[events["Concert"].external_id]
+    assert concert["start"] == concert["end"] == {"dateTime": "2026-06-06T17:30:00Z"}
+
+
+def test_remote_version_wins_a_conflict(
+    clean_db, daycare_id, fake_calendar, auth_headers
+):
+    remote_id = fake_calendar.add("Swimming", {"dateTime": "2026-06-01T09:00:00Z"})
+    _sync(daycare_id, fake_calendar)
+    event_id = _local_events(daycare_id)["Swimming"].id
+
+    client.put(
+        f"/api/v1/events/{event_id}",
+        json={"title": "Swimming (local)"},
+        headers=auth_headers(daycare_id),
+    )
+    fake_calendar.edit(remote_id, summary="Swimming (remote)")
+
+    # A push based on a stale etag is refused and the edit stays pending
+    db = TestingSessionLocal()
+    try:
+        engine = CalendarSyncEngine(db, daycare_id, fake_calendar.client)
+        assert engine.push() == (0, 0)
+    finally:
+        db.close()
+    assert _local_events(daycare_id)["Swimming (local)"].sync_pending
+
+    result = _sync(daycare_id, fake_calendar)
+    assert (result.pulled, result.pushed) == (1, 0)
+    assert list(_local_events(daycare_id)) == ["Swimming (remote)"]
+    assert fake_calendar.events[remote_id]["summary"] == "Swimming (remote)"
+
+
+def test_expired_sync_token_falls_back_to_a_full_sync(
+    clean_db, daycare_id, fake_calendar
+):
+    ids = [
+        fake_calendar.add(f"Event {i}", {"dateTime": f"2026-06-0{i}T09:00:00Z"})
+        for i in range(1, 4)
+    ]
+    _sync(daycare_id, fake_calendar)
+
+    fake_calendar.cancel(ids[0])
+    fake_calendar.edit(ids[1], summary="Event 2 (moved)")
+    fake_calendar.expire_tokens()
+
+    result = _sync(daycare_id, fake_calendar)
+    assert (result.pulled, result.pulled_deletes, result.full_resync) == (1, 1, True)
+    assert sorted(_local_events(daycare_id)) == ["Event 2 (moved)", "Event 3"]
+    assert _sync(daycare_id, fake_calendar).full_resync is False
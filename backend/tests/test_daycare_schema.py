@@ -5,7 +5,7 @@ from sqlalchemy.orm import sessionmaker
 from app.models.daycare import Daycare
 from app.models.educator import Educator, EducatorRole
 from app.models.group import Group
-from app.models.kid import Kid
+from app.models.kid import Kid, TrustedAdult
 from app.models.parent import Parent
 from app.services.seeder import clear_daycare_data, seed_daycare_data
 
@@ -153,12 +153,12 @@ class TestDaycareSchema:
             daycare_id=daycare.id,
             group_id=group.id,
             trusted_adults=[
-                {
-                    "name": "Trusted Adult",
-                    "email": "trusted@example.com",
-                    "phone": "+1234567890",
-                    "address": "123 Test St",
-                }
+                TrustedAdult(
+                    name="Trusted Adult",
+                    email="trusted@example.com",
+                    phone_num="+1234567890",
+                    address="123 Test St",
+                )
             ],
         )
         db_session.add(kid)
@@ -172,7 +172,8 @@ class TestDaycareSchema:
         assert kid.daycare == daycare
         assert kid.group == group
         assert len(kid.trusted_adults) == 1
-        assert kid.trusted_adults[0]["name"] == "Trusted Adult"
+        assert kid.trusted_adults[0].name == "Trusted Adult"
+        assert kid.trusted_adults[0].position == 0
 
     def test_educator_group_relationship(self, db_session):
         """Test many-to-many relationship between educators and groups."""
@@ -431,23 +432,21 @@ class TestDaycareSchema:
         )
         assert len(groups_in_daycare) == 3
 
-    def test_trusted_adults_json_storage(self, seeded_data):
-        """Test that trusted_adults JSON data is stored and retrieved correctly."""
+    def test_trusted_adults_storage(self, seeded_data):
+        """Test that trusted adults are stored as rows linked to their kid."""
         kids_with_trusted_adults = (
-            seeded_data.query(Kid).filter(Kid.trusted_adults.isnot(None)).all()
+            seeded_data.query(Kid).filter(Kid.trusted_adults.any()).all()
         )
 
         assert len(kids_with_trusted_adults) > 0
 
         for kid in kids_with_trusted_adults:
-            assert kid.trusted_adults is not None
-            assert isinstance(kid.trusted_adults, list)
-            if len(kid.trusted_adults) > 0:
-                trusted_adult = kid.trusted_adults[0]
-                assert "name" in trusted_adult
-                assert "email" in trusted_adult
-                assert "phone" in trusted_adult
-                assert "address" in trusted_adult
+            trusted_adult = kid.trusted_adults[0]
+            assert trusted_adult.kid_id == kid.id
+            assert trusted_adult.name
+            assert trusted_adult.email
+            assert trusted_adult.phone_num
+            assert trusted_adult.address
 
     def test_duplicate_email_constraints_within_table(self, db_session):
         """Test that email uniqueness constraints work within the same table."""
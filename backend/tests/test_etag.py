@@ -0,0 +1,110 @@
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.event import utcnow
+from app.models.kid import AbsenceReason, KidAbsence
+from app.utils.etag import etag_matches, weak_etag
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+def test_kids_returns_304_when_unchanged(clean_db, make_roster, count_queries):
+    """A matching If-None-Match gets a bodiless 304 from a single query."""
+    daycare_id, _, _ = make_roster()
+
+    url = f"/api/v1/kids?daycare_id={daycare_id}"
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+
+    with count_queries() as statements:
+        second = client.get(url, headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["ETag"] == etag
+    assert len(statements) == 1
+
+
+def test_kids_etag_changes_with_todays_absences(clean_db, make_roster):
+    """Reporting an absence today invalidates the roster's ETag."""
+    daycare_id, _, (kid_id,) = make_roster()
+
+    url = f"/api/v1/kids?daycare_id={daycare_id}"
+    etag = client.get(url).headers["ETag"]
+
+    db = TestingSessionLocal()
+    try:
+        db.add(KidAbsence(kid_id=kid_id, date=date.today(), reason=AbsenceReason.SICK))
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()[0]["attendance"] == "sick"
+    assert response.headers["ETag"] != etag
+
+
+def test_kids_etag_differs_per_page_and_filter(clean_db, make_roster):
+    """Different query strings never share an ETag."""
+    daycare_id, _, _ = make_roster()
+
+    base = client.get(f"/api/v1/kids?daycare_id={daycare_id}").headers["ETag"]
+    paged = client.get(f"/api/v1/kids?daycare_id={daycare_id}&limit=1")
+    assert paged.headers["ETag"] != base
+
+
+def test_events_returns_304_until_an_event_is_added(clean_db, auth_headers):
+    """Event listings revalidate against the events fingerprint."""
+    url = "/api/v1/events/"
+    headers = auth_headers()
+    event = {"title": "Trip", "date": "2026-03-04T10:00:00"}
+    client.post(url, json=event, headers=headers)
+
+    first = client.get(url, headers=headers)
+    etag = first.headers["ETag"]
+    revalidate = {**headers, "If-None-Match": etag}
+    assert client.get(url, headers=revalidate).status_code == 304
+
+    client.post(url, json={**event, "title": "Concert"}, headers=headers)
+    response = client.get(url, headers=revalidate)
+    assert response.status_code == 200
+    assert len(response.json()) == 2
+
+
+def test_events_etag_changes_when_an_event_passes(clean_db, auth_headers, monkeypatch):
+    """is_past and upcoming/past membership follow the clock, and so does the tag."""
+    headers = auth_headers()
+    soon = utcnow() + timedelta(minutes=30)
+    event = {"title": "Trip", "date": soon.isoformat()}
+    assert (
+        client.post("/api/v1/events/", json=event, headers=headers).status_code == 201
+    )
+
+    etags = {}
+    for url in ("/api/v1/events/", "/api/v1/events/upcoming"):
+        etags[url] = client.get(url, headers=headers).headers["ETag"]
+        revalidate = {**headers, "If-None-Match": etags[url]}
+        assert client.get(url, headers=revalidate).status_code == 304
+
+    later = soon + timedelta(minutes=1)
+    monkeypatch.setattr("app.services.event_service.utcnow", lambda: later)
+    for url, etag in etags.items():
+        revalidate = {**headers, "If-None-Match": etag}
+        assert client.get(url, headers=revalidate).status_code == 200
+
+
+def test_etag_matching_rules():
+    """If-None-Match uses weak comparison and accepts lists and '*'."""
+    etag = weak_etag("a", 1)
+    opaque = etag.removeprefix("W/")
+    assert etag_matches(etag, etag)
+    assert etag_matches(opaque, etag)
+    assert etag_matches(f'"other", {etag}', etag)
+    assert etag_matches("*", etag)
+    assert not etag_matches(None, etag)
+    assert not etag_matches('"other"', etag)
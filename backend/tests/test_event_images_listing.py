@@ -0,0 +1,113 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.event import Event, EventImage
+from app.services.event_service import EventService
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+START = datetime(2026, 5, 1, 10)
+
+
+@pytest.fixture
+def make_events(make_daycare):
+    """Events with images in a new daycare, returning its ID."""
+
+    def _make_events(count, images_per_event=3):
+        daycare_id = make_daycare()
+        db = TestingSessionLocal()
+        try:
+            for i in range(count):
+                event = Event(
+                    title=f"Event {i}",
+                    date=START + timedelta(days=i),
+                    daycare_id=daycare_id,
+                )
+                event.images = [
+                    EventImage(file_name=f"{i}-{n}.jpg", s3_key=f"events/{i}/{n}")
+                    for n in range(images_per_event)
+                ]
+                db.add(event)
+            db.commit()
+            return daycare_id
+        finally:
+            db.close()
+
+    return _make_events
+
+
+def _image_queries(statements):
+    return [s for s in statements if "FROM event_images" in s and "count" not in s]
+
+
+def test_listing_loads_images_with_one_query(
+    clean_db, make_events, count_queries, auth_headers
+):
+    """100 events cost one image query, not one per event."""
+    headers = auth_headers(make_events(100, images_per_event=2))
+
+    with count_queries() as statements:
+        response = client.get("/api/v1/events/?limit=100", headers=headers)
+    assert response.status_code == 200
+    assert len(response.json()) == 100
+    assert all(len(event["images"]) == 2 for event in response.json())
+    assert len(_image_queries(statements)) == 1
+    # Revocation refresh, fingerprint, events page, images
+    assert len(statements) == 4
+
+
+def test_images_limit_caps_images_per_event(
+    clean_db, make_events, count_queries, auth_headers
+):
+    headers = auth_headers(make_events(3))
+
+    response = client.get("/api/v1/events/?images_limit=1", headers=headers)
+    assert response.status_code == 200
+    covers = [event["images"] for event in response.json()]
+    assert [[image["file_name"] for image in images] for images in covers] == [
+        ["0-0.jpg"],
+        ["1-0.jpg"],
+        ["2-0.jpg"],
+    ]
+
+    response = client.get("/api/v1/events/past?images_limit=2", headers=headers)
+    assert [len(event["images"]) for event in response.json()] == [2, 2, 2]
+
+    with count_queries() as statements:
+        response = client.get(
+            "/api/v1/events/upcoming?images_limit=0&skip=0", headers=headers
+        )
+    assert _image_queries(statements) == []
+
+    with count_queries() as statements:
+        response = client.get("/api/v1/events/?images_limit=0", headers=headers)
+    assert [event["images"] for event in response.json()] == [[], [], []]
+    assert _image_queries(statements) == []
+
+    assert (
+        client.get("/api/v1/events/?images_limit=-1", headers=headers).status_code
+        == 422
+    )
+
+
+def test_event_service_batches_images(clean_db, make_events, count_queries):
+    daycare_id = make_events(4, images_per_event=3)
+
+    db = TestingSessionLocal()
+    try:
+        service = EventService(db, daycare_id)
+        with count_queries() as statements:
+            events = service.get_events(skip=1, limit=2, images_limit=2)
+        assert len(statements) == 2
+        assert [event.title for event in events] == ["Event 1", "Event 2"]
+        assert [len(event.images) for event in events] == [2, 2]
+
+        events, next_cursor = service.get_events_page(limit=3)
+        assert next_cursor is not None
+        assert [len(event.images) for event in events] == [3, 3, 3]
+    finally:
+        db.close()
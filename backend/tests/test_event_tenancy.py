@@ -0,0 +1,104 @@
+from datetime import datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.models.event import Event, EventImage
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def daycares(make_daycare):
+    """Two daycares with one event (and one image) each."""
+    names = ["Sunny", "Rainy"]
+    daycare_ids = [make_daycare(name) for name in names]
+    db = TestingSessionLocal()
+    try:
+        events = []
+        for name, daycare_id in zip(names, daycare_ids):
+            event = Event(
+                title=f"{name} Picnic",
+                date=datetime(2026, 6, 1, 10),
+                daycare_id=daycare_id,
+            )
+            event.images = [EventImage(file_name="cover.jpg", s3_key=f"{name}/cover")]
+            events.append(event)
+        db.add_all(events)
+        db.commit()
+        return daycare_ids, [(event.id, event.images[0].id) for event in events]
+    finally:
+        db.close()
+
+
+def test_events_are_scoped_to_the_token_daycare(clean_db, daycares, make_token):
+    (sunny_id, rainy_id), (sunny_event, rainy_event) = daycares
+    headers = {
+        "Authorization": f"Bearer {make_token('1', 'educator', daycare_id=sunny_id)}"
+    }
+
+    response = client.get("/api/v1/events/", headers=headers)
+    assert response.status_code == 200
+    assert [event["title"] for event in response.json()] == ["Sunny Picnic"]
+
+    response = client.get(f"/api/v1/events/?daycare_id={rainy_id}", headers=headers)
+    assert response.status_code == 403
+
+    # Another daycare's event and image do not exist for this caller
+    rainy_event_id, rainy_image_id = rainy_event
+    assert (
+        client.get(f"/api/v1/events/{rainy_event_id}", headers=headers).status_code
+        == 404
+    )
+    response = client.put(
+        f"/api/v1/events/{rainy_event_id}", json={"title": "Mine"}, headers=headers
+    )
+    assert response.status_code == 404
+    response = client.delete(f"/api/v1/events/images/{rainy_image_id}", headers=headers)
+    assert response.status_code == 404
+    response = client.get(f"/api/v1/events/{rainy_event_id}/images", headers=headers)
+    assert response.status_code == 404
+
+    response = client.post(
+        "/api/v1/events/",
+        json={"title": "Sports Day", "date": "2026-07-01T09:00:00"},
+        headers=headers,
+    )
+    assert response.status_code == 201
+    db = TestingSessionLocal()
+    try:
+        assert db.get(Event, response.json()["id"]).daycare_id == sunny_id
+    finally:
+        db.close()
+
+
+def test_events_require_an_authenticated_daycare(
+    clean_db, daycares, make_token, monkeypatch
+):
+    (sunny_id, rainy_id), (sunny_event, rainy_event) = daycares
+    rainy_event_id, rainy_image_id = rainy_event
+
+    # Anonymous callers cannot pick a daycare with the query parameter
+    assert client.get(f"/api/v1/events/?daycare_id={rainy_id}").status_code == 401
+    assert client.get("/api/v1/events/").status_code == 401
+    response = client.put(
+        f"/api/v1/events/{rainy_event_id}?daycare_id={rainy_id}",
+        json={"title": "Mine"},
+    )
+    assert response.status_code == 401
+    response = client.delete(
+        f"/api/v1/events/images/{rainy_image_id}?daycare_id={rainy_id}"
+    )
+    assert response.status_code == 401
+
+    # Dev placeholder tokens may, but only while the setting allows it
+    headers = {"Authorization": f"Bearer {make_token('1', 'educator')}"}
+    response = client.get(f"/api/v1/events/?daycare_id={rainy_id}", headers=headers)
+    assert [event["title"] for event in response.json()] == ["Rainy Picnic"]
+
+    monkeypatch.setattr(settings, "allow_dev_daycare_scope", False)
+    response = client.get(f"/api/v1/events/?daycare_id={rainy_id}", headers=headers)
+    assert response.status_code == 403
@@ -2,10 +2,20 @@ import pytest
 from fastapi.testclient import TestClient
 from httpx import ASGITransport, AsyncClient
 
+from app.core.security import create_access_token
 from app.main import app
 
 client = TestClient(app)
 
+# The dev placeholder daycare claim resolves to the only daycare, created on
+# first use in tests
+AUTH = {
+    "Authorization": "Bearer "
+    + create_access_token(
+        {"sub": "1", "role": "educator", "daycare_id": "default-daycare-id"}
+    )
+}
+
 
 def test_create_event():
     """Test creating a new event"""
@@ -17,7 +27,7 @@ def test_create_event():
         "location": "Test Location",
     }
 
-    response = client.post("/api/v1/events/", json=event_data)
+    response = client.post("/api/v1/events/", json=event_data, headers=AUTH)
 
     # Print debug information if assertion fails
     if response.status_code != 201:
@@ -35,7 +45,7 @@ def test_create_event():
 
 def test_get_events():
     """Test retrieving all events"""
-    response = client.get("/api/v1/events/")
+    response = client.get("/api/v1/events/", headers=AUTH)
     assert response.status_code == 200
 
     data = response.json()
@@ -53,11 +63,11 @@ def test_get_event_by_id():
         "location": "Test Location",
     }
 
-    create_response = client.post("/api/v1/events/", json=event_data)
+    create_response = client.post("/api/v1/events/", json=event_data, headers=AUTH)
     event_id = create_response.json()["id"]
 
     # Then retrieve it
-    response = client.get(f"/api/v1/events/{event_id}")
+    response = client.get(f"/api/v1/events/{event_id}", headers=AUTH)
     assert response.status_code == 200
 
     data = response.json()
@@ -76,7 +86,7 @@ def test_update_event():
         "location": "Original Location",
     }
 
-    create_response = client.post("/api/v1/events/", json=event_data)
+    create_response = client.post("/api/v1/events/", json=event_data, headers=AUTH)
     event_id = create_response.json()["id"]
 
     # Update the event
@@ -86,7 +96,7 @@ def test_update_event():
         "location": "Updated Location",
     }
 
-    response = client.put(f"/api/v1/events/{event_id}", json=update_data)
+    response = client.put(f"/api/v1/events/{event_id}", json=update_data, headers=AUTH)
     assert response.status_code == 200
 
     data = response.json()
@@ -106,15 +116,15 @@ def test_delete_event():
         "location": "Test Location",
     }
 
-    create_response = client.post("/api/v1/events/", json=event_data)
+    create_response = client.post("/api/v1/events/", json=event_data, headers=AUTH)
     event_id = create_response.json()["id"]
 
     # Delete the event
-    response = client.delete(f"/api/v1/events/{event_id}")
+    response = client.delete(f"/api/v1/events/{event_id}", headers=AUTH)
     assert response.status_code == 204
 
     # Verify it's deleted
-    get_response = client.get(f"/api/v1/events/{event_id}")
+    get_response = client.get(f"/api/v1/events/{event_id}", headers=AUTH)
     assert get_response.status_code == 404
 
 
@@ -129,11 +139,15 @@ def test_get_upload_url():
         "location": "Test Location",
     }
 
-    create_response = client.post("/api/v1/events/", json=event_data)
+    create_response = client.post("/api/v1/events/", json=event_data, headers=AUTH)
     event_id = create_response.json()["id"]
 
     # Get upload URL
-    response = client.post(f"/api/v1/events/{event_id}/images?filename=test_image.jpg")
+    response = client.post(
+        f"/api/v1/events/{event_id}/images",
+        params={"filename": "test_image.jpg"},
+        headers=AUTH,
+    )
     assert response.status_code == 200
 
     data = response.json()
@@ -144,7 +158,11 @@ def test_get_upload_url():
 
 def test_get_upload_url_nonexistent_event():
     """Test getting upload URL for non-existent event"""
-    response = client.post("/api/v1/events/999/images?filename=test_image.jpg")
+    response = client.post(
+        "/api/v1/events/999/images",
+        params={"filename": "test_image.jpg"},
+        headers=AUTH,
+    )
     assert response.status_code == 200
     assert "error" in response.json()
     assert response.json()["error"] == "Event not found"
@@ -173,7 +191,7 @@ async def test_create_event_async():
             "start_time": "10:00",
             "description": "This is a test event",
         }
-        response = await ac.post("/api/v1/events/", json=payload)
+        response = await ac.post("/api/v1/events/", json=payload, headers=AUTH)
     assert response.status_code == 200 or response.status_code == 201
     data = response.json()
     assert data["title"] == "Test Event"
@@ -0,0 +1,125 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select, text
+
+from app.main import app
+from app.models.event import Event, utcnow
+from app.services.read_model import event_filters
+from tests.conftest import TestingSessionLocal
+
+
+@pytest.fixture
+def make_events(make_daycare):
+    """Events of a new daycare, returning its ID."""
+
+    def _make_events(dates):
+        daycare_id = make_daycare()
+        db = TestingSessionLocal()
+        try:
+            db.add_all(
+                Event(title=f"Event {i}", date=event_date, daycare_id=daycare_id)
+                for i, event_date in enumerate(dates)
+            )
+            db.commit()
+            return daycare_id
+        finally:
+            db.close()
+
+    return _make_events
+
+
+def _titles(response):
+    assert response.status_code == 200
+    return [event["title"] for event in response.json()]
+
+
+def test_month_and_week_ranges(clean_db, make_events, auth_headers):
+    daycare_id = make_events(
+        [
+            datetime(2026, 4, 30, 23, 59),
+            datetime(2026, 5, 1),
+            datetime(2026, 5, 15, 10),
+            datetime(2026, 5, 15, 10),
+            datetime(2026, 5, 31, 18),
+            datetime(2026, 6, 1),
+        ]
+    )
+
+    client = TestClient(app, headers=auth_headers(daycare_id))
+    url = "/api/v1/events/"
+
+    # Half-open: the first of the next month belongs to the next month only
+    response = client.get(f"{url}?from=2026-05-01&to=2026-06-01")
+    assert _titles(response) == ["Event 1", "Event 2", "Event 3", "Event 4"]
+
+    response = client.get(f"{url}?from=2026-05-11&to=2026-05-18")
+    assert _titles(response) == ["Event 2", "Event 3"]
+
+    # Keyset pages stay inside the window, ties on date ordered by id
+    response = client.get(f"{url}?from=2026-05-01&to=2026-06-01&limit=3")
+    assert _titles(response) == ["Event 1", "Event 2", "Event 3"]
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(
+        f"{url}?from=2026-05-01&to=2026-06-01&limit=3&cursor={cursor}"
+    )
+    assert _titles(response) == ["Event 4"]
+
+    response = client.get(f"{url}?from=2026-05-31&skip=1")
+    assert _titles(response) == ["Event 5"]
+
+    # Aware bounds are compared in UTC: 02:00+02:00 is midnight UTC
+    response = client.get(f"{url}?from=2026-06-01T02:00:00%2B02:00")
+    assert _titles(response) == ["Event 5"]
+
+    response = client.get(f"{url}?from=2026-06-01&to=2026-05-01")
+    assert response.status_code == 400
+
+
+def test_past_and_upcoming_follow_the_clock(clean_db, make_events, auth_headers):
+    now = utcnow()
+    daycare_id = make_events(
+        [
+            now - timedelta(days=7),
+            now - timedelta(minutes=1),
+            now + timedelta(hours=1),
+            now + timedelta(days=40),
+        ]
+    )
+    client = TestClient(app, headers=auth_headers(daycare_id))
+
+    response = client.get("/api/v1/events/upcoming")
+    assert _titles(response) == ["Event 2", "Event 3"]
+    assert [event["is_past"] for event in response.json()] == [False, False]
+
+    response = client.get("/api/v1/events/past")
+    assert _titles(response) == ["Event 0", "Event 1"]
+    assert [event["is_past"] for event in response.json()] == [True, True]
+
+    window = f"from={(now + timedelta(days=1)).isoformat()}"
+    response = client.get(f"/api/v1/events/upcoming?{window}")
+    assert _titles(response) == ["Event 3"]
+
+    event_id = client.get("/api/v1/events/past").json()[0]["id"]
+    assert client.get(f"/api/v1/events/{event_id}").json()["is_past"] is True
+
+
+def test_upcoming_is_an_index_range_scan(clean_db):
+    db = TestingSessionLocal()
+    try:
+        daycare_id = "00000000-0000-0000-0000-000000000000"
+        statement = select(Event.id).where(
+            *event_filters(daycare_id, upcoming_only=True)
+        )
+        statement = statement.order_by(Event.date, Event.id)
+        compiled = statement.compile(
+            db.get_bind(), compile_kwargs={"literal_binds": True}
+        )
+        plan = db.execute(text(f"EXPLAIN QUERY PLAN {compiled}")).all()
+    finally:
+        db.close()
+
+    details = " ".join(row[-1] for row in plan)
+    assert "ix_events_daycare_id_date_id (daycare_id=? AND date>?)" in details
+    assert "TEMP B-TREE" not in details
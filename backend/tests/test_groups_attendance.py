@@ -0,0 +1,184 @@
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.kid import (
+    AbsenceReason,
+    AttendanceStatus,
+    Kid,
+    KidAbsence,
+    KidAttendanceEntry,
+)
+from app.services.auth_service import revocation_store
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+def test_group_attendance_updates_kids_and_clears_todays_absences(
+    clean_db, make_roster, auth_headers
+):
+    """Overrides apply to every kid and drop only today's absences."""
+    daycare_id, group_id, kid_ids = make_roster(3)
+    db = TestingSessionLocal()
+    try:
+        today = date.today()
+        tomorrow = today + timedelta(days=1)
+        db.add_all(
+            [
+                KidAbsence(kid_id=kid_ids[0], date=today, reason=AbsenceReason.SICK),
+                KidAbsence(
+                    kid_id=kid_ids[1], date=tomorrow, reason=AbsenceReason.HOLIDAY
+                ),
+            ]
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.patch(
+        f"/api/v1/groups/{group_id}/attendance",
+        json={
+            "updates": [
+                {"kid_id": kid_ids[0], "attendance": "in-care"},
+                {"kid_id": kid_ids[1], "attendance": "in-care"},
+                {"kid_id": kid_ids[2], "attendance": "sick"},
+            ]
+        },
+        headers=auth_headers(daycare_id),
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["group_id"] == group_id
+    assert all(result["updated"] for result in data["results"])
+
+    db = TestingSessionLocal()
+    try:
+        kids = {k.id: k.attendance for k in db.query(Kid).all()}
+        assert kids == {
+            kid_ids[0]: AttendanceStatus.IN_CARE,
+            kid_ids[1]: AttendanceStatus.IN_CARE,
+            kid_ids[2]: AttendanceStatus.SICK,
+        }
+        absences = db.query(KidAbsence).all()
+        assert [(a.kid_id, a.date) for a in absences] == [(kid_ids[1], tomorrow)]
+        assert db.query(KidAttendanceEntry).count() == 3
+    finally:
+        db.close()
+
+
+def test_group_attendance_reports_kids_outside_group(
+    clean_db, make_roster, auth_headers
+):
+    """Kids that are not in the group are reported and left untouched."""
+    daycare_id, group_id, kid_ids = make_roster(1)
+    _, _, other_kid_ids = make_roster(1)
+
+    response = client.patch(
+        f"/api/v1/groups/{group_id}/attendance",
+        json={
+            "updates": [
+                {"kid_id": kid_ids[0], "attendance": "in-care"},
+                {"kid_id": other_kid_ids[0], "attendance": "in-care"},
+                {"kid_id": 99999, "attendance": "in-care"},
+            ]
+        },
+        headers=auth_headers(daycare_id),
+    )
+    assert response.status_code == 200
+    updated = {r["kid_id"]: r["updated"] for r in response.json()["results"]}
+    assert updated == {kid_ids[0]: True, other_kid_ids[0]: False, 99999: False}
+
+    db = TestingSessionLocal()
+    try:
+        other_kid = db.get(Kid, other_kid_ids[0])
+        assert other_kid.attendance == AttendanceStatus.OUT
+    finally:
+        db.close()
+
+
+def test_group_attendance_invalid_status_applies_nothing(
+    clean_db, make_roster, auth_headers
+):
+    """One invalid status rejects the whole batch."""
+    daycare_id, group_id, kid_ids = make_roster(2)
+
+    response = client.patch(
+        f"/api/v1/groups/{group_id}/attendance",
+        json={
+            "updates": [
+                {"kid_id": kid_ids[0], "attendance": "in-care"},
+                {"kid_id": kid_ids[1], "attendance": "invalid-status"},
+            ]
+        },
+        headers=auth_headers(daycare_id),
+    )
+    assert response.status_code == 400
+    assert "Invalid attendance status" in response.json()["detail"]
+
+    db = TestingSessionLocal()
+    try:
+        assert all(k.attendance == AttendanceStatus.OUT for k in db.query(Kid).all())
+    finally:
+        db.close()
+
+
+def test_group_attendance_group_not_found(clean_db, make_roster, auth_headers):
+    """Unknown groups and groups of another daycare return 404."""
+    daycare_id, _, _ = make_roster(1)
+    _, other_group_id, other_kid_ids = make_roster(1)
+
+    for group_id in (999, other_group_id):
+        response = client.patch(
+            f"/api/v1/groups/{group_id}/attendance",
+            json={"updates": [{"kid_id": other_kid_ids[0], "attendance": "in-care"}]},
+            headers=auth_headers(daycare_id),
+        )
+        assert response.status_code == 404
+        assert response.json()["detail"] == "Group not found"
+
+
+def test_group_attendance_requires_an_educator(clean_db, make_roster, auth_headers):
+    """Anonymous callers and parents cannot take attendance."""
+    daycare_id, group_id, kid_ids = make_roster(1)
+
+    url = f"/api/v1/groups/{group_id}/attendance"
+    body = {"updates": [{"kid_id": kid_ids[0], "attendance": "in-care"}]}
+    assert client.patch(url, json=body).status_code == 401
+    response = client.patch(
+        url, json=body, headers=auth_headers(daycare_id, role="parent")
+    )
+    assert response.status_code == 403
+
+    db = TestingSessionLocal()
+    try:
+        assert db.get(Kid, kid_ids[0]).attendance == AttendanceStatus.OUT
+    finally:
+        db.close()
+
+
+def test_group_attendance_query_count_is_constant(
+    clean_db, make_roster, count_queries, auth_headers
+):
+    """Updating 2 or 20 kids costs the same number of statements."""
+    counts = []
+    for size in (2, 20):
+        daycare_id, group_id, kid_ids = make_roster(size)
+
+        updates = [
+            {"kid_id": kid_id, "attendance": ("in-care", "sick")[i % 2]}
+            for i, kid_id in enumerate(kid_ids)
+        ]
+        # Both requests pull token revocations, so only the update differs
+        revocation_store.clear()
+        with count_queries() as statements:
+            response = client.patch(
+                f"/api/v1/groups/{group_id}/attendance",
+                json={"updates": updates},
+                headers=auth_headers(daycare_id),
+            )
+        assert response.status_code == 200
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
@@ -0,0 +1,123 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.kid import AbsenceReason, KidAbsence, KidAttendanceEntry
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+# Monday 2026-03-02 .. Friday 2026-03-13 is a two-week holiday
+START = date(2026, 3, 2)
+END = date(2026, 3, 13)
+
+
+@pytest.fixture
+def family(make_daycare, make_group, make_parent, make_kids):
+    """A parent with two linked kids, and one unrelated kid."""
+    daycare_id = make_daycare()
+    group_id = make_group(daycare_id)
+    parent_id = make_parent(daycare_id)
+    kid_ids = make_kids(daycare_id, group_id, count=2, parent_ids=[parent_id])
+    kid_ids += make_kids(daycare_id, group_id, full_name="Kid 2")
+    return parent_id, kid_ids
+
+
+def _post(token, **body):
+    payload = {"reason": "holiday", "start_date": START.isoformat(), **body}
+    return client.post(
+        "/api/v1/kids/absences",
+        json=payload,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+
+def test_two_week_holiday_for_two_kids_in_one_request(
+    clean_db, family, make_token, count_queries
+):
+    """Weekdays in the range are created for every kid with constant queries."""
+    parent_id, kid_ids = family
+    token = make_token(str(parent_id), "parent")
+
+    with count_queries() as statements:
+        response = _post(token, kid_ids=kid_ids[:2], end_date=END.isoformat())
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["created"]) == 20
+    assert data["conflicts"] == []
+    assert {a["reason"] for a in data["created"]} == {"holiday"}
+    assert all(date.fromisoformat(a["date"]).weekday() < 5 for a in data["created"])
+    # Link check, multi-row insert and ledger insert; no per-day statements
+    assert len(statements) <= 4
+
+    db = TestingSessionLocal()
+    try:
+        assert db.query(KidAbsence).count() == 20
+        assert db.query(KidAttendanceEntry).count() == 20
+    finally:
+        db.close()
+
+
+def test_existing_days_are_reported_as_conflicts(clean_db, family, make_token):
+    """Already reported days are skipped and returned per kid and day."""
+    parent_id, kid_ids = family
+    db = TestingSessionLocal()
+    try:
+        db.add(
+            KidAbsence(
+                kid_id=kid_ids[0], date=date(2026, 3, 3), reason=AbsenceReason.SICK
+            )
+        )
+        db.commit()
+    finally:
+        db.close()
+    token = make_token(str(parent_id), "parent")
+
+    response = _post(
+        token,
+        kid_ids=[kid_ids[0]],
+        end_date="2026-03-04",
+        include_weekends=True,
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert [a["date"] for a in data["created"]] == ["2026-03-02", "2026-03-04"]
+    assert data["conflicts"] == [{"kid_id": kid_ids[0], "date": "2026-03-03"}]
+
+
+def test_unlinked_kid_rejects_whole_request(clean_db, family, make_token):
+    """A kid not linked to the parent fails validation and nothing is written."""
+    parent_id, kid_ids = family
+    token = make_token(str(parent_id), "parent")
+
+    response = _post(token, kid_ids=[kid_ids[0], kid_ids[2]])
+    assert response.status_code == 403
+
+    response = _post(token, kid_ids=[kid_ids[0], 99999])
+    assert response.status_code == 404
+
+    db = TestingSessionLocal()
+    try:
+        assert db.query(KidAbsence).count() == 0
+    finally:
+        db.close()
+
+
+def test_range_validation(clean_db, family, make_token):
+    """Inverted, oversized and weekend-only ranges are rejected."""
+    parent_id, kid_ids = family
+    token = make_token(str(parent_id), "parent")
+
+    assert _post(token, kid_ids=kid_ids[:1], end_date="2026-03-01").status_code == 400
+    assert _post(token, kid_ids=kid_ids[:1], end_date="2026-06-30").status_code == 400
+    weekend = {"start_date": "2026-03-07", "end_date": "2026-03-08"}
+    assert _post(token, kid_ids=kid_ids[:1], **weekend).status_code == 400
+
+
+def test_only_parents_can_report_ranges(clean_db, make_token):
+    """Educators cannot create absences."""
+    token = make_token("1", "educator")
+    response = _post(token, kid_ids=[1])
+    assert response.status_code == 403
@@ -0,0 +1,98 @@
+from datetime import date
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.kid import AbsenceReason, KidAbsence
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def absences(make_daycare, make_group, make_kids):
+    """Two groups in one daycare plus another daycare, with absences in March."""
+    daycare_ids = [make_daycare(), make_daycare("Other Daycare")]
+    groups = [
+        (daycare_ids[0], make_group(daycare_ids[0], "Group A")),
+        (daycare_ids[0], make_group(daycare_ids[0], "Group B")),
+        (daycare_ids[1], make_group(daycare_ids[1], "Group C")),
+    ]
+    kid_ids = [
+        kid_id
+        for i, (daycare_id, group_id) in enumerate(groups)
+        for kid_id in make_kids(daycare_id, group_id, full_name=f"Kid {i}")
+    ]
+
+    db = TestingSessionLocal()
+    try:
+        db.add_all(
+            KidAbsence(
+                kid_id=kid_id, date=date(2026, 3, day), reason=AbsenceReason.SICK
+            )
+            for kid_id in kid_ids
+            for day in (2, 3, 20)
+        )
+        db.commit()
+    finally:
+        db.close()
+    return daycare_ids[0], groups[0][1], kid_ids
+
+
+def _get(token, **params):
+    return client.get(
+        "/api/v1/kids/absences",
+        params=params,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+
+def test_educator_lists_daycare_absences_in_range(clean_db, absences, make_token):
+    """Absences are scoped to the daycare and range, ordered by date then kid."""
+    daycare_id, group_id, kid_ids = absences
+    token = make_token("1", "educator")
+
+    response = _get(
+        token, daycare_id=daycare_id, **{"from": "2026-03-01", "to": "2026-03-10"}
+    )
+    assert response.status_code == 200
+    assert [(a["date"], a["kid_id"]) for a in response.json()] == [
+        ("2026-03-02", kid_ids[0]),
+        ("2026-03-02", kid_ids[1]),
+        ("2026-03-03", kid_ids[0]),
+        ("2026-03-03", kid_ids[1]),
+    ]
+
+    response = _get(
+        token,
+        daycare_id=daycare_id,
+        group_id=group_id,
+        **{"from": "2026-03-01", "to": "2026-03-31"},
+    )
+    assert [a["kid_id"] for a in response.json()] == [kid_ids[0]] * 3
+
+
+def test_absence_range_is_paginated(clean_db, absences, make_token):
+    """Large ranges are walked page by page with the cursor header."""
+    daycare_id, _, _ = absences
+    token = make_token("1", "super_educator")
+
+    params = {"daycare_id": daycare_id, "from": "2026-03-01", "to": "2026-03-31"}
+    first = _get(token, limit=4, **params)
+    assert len(first.json()) == 4
+    cursor = first.headers[NEXT_CURSOR_HEADER]
+
+    second = _get(token, limit=4, cursor=cursor, **params)
+    assert len(second.json()) == 2
+    assert NEXT_CURSOR_HEADER not in second.headers
+    ids = [a["id"] for a in first.json() + second.json()]
+    assert len(set(ids)) == 6
+
+
+def test_parents_cannot_list_daycare_absences(clean_db, make_token):
+    """The daycare-wide view is for educators only."""
+    token = make_token("1", "parent")
+    response = _get(token, daycare_id="x", **{"from": "2026-03-01", "to": "2026-03-31"})
+    assert response.status_code == 403
@@ -0,0 +1,118 @@
+from datetime import date
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.kid import AbsenceReason, AttendanceStatus, Kid, KidAbsence
+from app.services.kid_service import get_effective_attendance_bulk
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+def test_bulk_resolver_prefers_absence_over_attendance(clean_db, make_roster):
+    """Kids with an absence on the date report the absence reason."""
+    _, _, kid_ids = make_roster(3, attendance=AttendanceStatus.IN_CARE)
+    db = TestingSessionLocal()
+    try:
+        today = date.today()
+        db.add(KidAbsence(kid_id=kid_ids[0], date=today, reason=AbsenceReason.SICK))
+        db.add(
+            KidAbsence(
+                kid_id=kid_ids[1],
+                date=date(2020, 1, 1),
+                reason=AbsenceReason.HOLIDAY,
+            )
+        )
+        db.commit()
+
+        statuses = get_effective_attendance_bulk(db, kid_ids, today)
+
+        assert statuses == {
+            kid_ids[0]: "sick",
+            kid_ids[1]: "in-care",
+            kid_ids[2]: "in-care",
+        }
+    finally:
+        db.close()
+
+
+def test_bulk_resolver_empty_input_runs_no_query(clean_db, count_queries):
+    """An empty roster resolves without touching the database."""
+    db = TestingSessionLocal()
+    try:
+        with count_queries() as statements:
+            assert get_effective_attendance_bulk(db, []) == {}
+        assert statements == []
+    finally:
+        db.close()
+
+
+def test_bulk_resolver_query_count_is_constant(clean_db, make_roster, count_queries):
+    """Resolving 2 or 40 kids costs the same single query."""
+    _, _, kid_ids = make_roster(40, attendance=AttendanceStatus.IN_CARE)
+    db = TestingSessionLocal()
+    try:
+        for kid_id in kid_ids[::3]:
+            db.add(
+                KidAbsence(kid_id=kid_id, date=date.today(), reason=AbsenceReason.SICK)
+            )
+        db.commit()
+
+        with count_queries() as small:
+            get_effective_attendance_bulk(db, kid_ids[:2])
+        with count_queries() as large:
+            statuses = get_effective_attendance_bulk(db, kid_ids)
+
+        assert len(small) == 1
+        assert len(large) == 1
+        assert len(statuses) == 40
+    finally:
+        db.close()
+
+
+def test_list_kids_does_not_persist_effective_attendance(clean_db, make_roster):
+    """Overlaying an absence on the roster never rewrites Kid.attendance."""
+    daycare_id, _, (kid_id,) = make_roster(attendance=AttendanceStatus.IN_CARE)
+    db = TestingSessionLocal()
+    try:
+        db.add(KidAbsence(kid_id=kid_id, date=date.today(), reason=AbsenceReason.SICK))
+        db.commit()
+
+        response = client.get(f"/api/v1/kids?daycare_id={daycare_id}")
+        assert response.status_code == 200
+        assert response.json()[0]["attendance"] == "sick"
+
+        assert db.get(Kid, kid_id).attendance == AttendanceStatus.IN_CARE
+    finally:
+        db.close()
+
+
+def test_parent_kids_list_uses_effective_attendance(
+    clean_db, make_daycare, make_group, make_parent, make_kids
+):
+    """The parent's kid list reports today's absence like the roster does."""
+    daycare_id = make_daycare()
+    parent_id = make_parent(daycare_id)
+    kid_ids = make_kids(
+        daycare_id,
+        make_group(daycare_id),
+        count=2,
+        parent_ids=[parent_id],
+        attendance=AttendanceStatus.IN_CARE,
+    )
+    db = TestingSessionLocal()
+    try:
+        db.add(
+            KidAbsence(
+                kid_id=kid_ids[1], date=date.today(), reason=AbsenceReason.HOLIDAY
+            )
+        )
+        db.commit()
+
+        response = client.get(f"/api/v1/parents/{parent_id}/kids")
+        assert response.status_code == 200
+        statuses = {kid["id"]: kid["attendance"] for kid in response.json()}
+        assert statuses == {kid_ids[0]: "in-care", kid_ids[1]: "holiday"}
+    finally:
+        db.close()
@@ -0,0 +1,172 @@
+from datetime import date, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.kid import (
+    AbsenceReason,
+    AttendanceSource,
+    AttendanceStatus,
+    KidAbsence,
+    KidAttendanceEntry,
+)
+from app.services.kid_service import close_out_attendance_day
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def kids(make_daycare, make_group, make_parent, make_kids):
+    """A daycare with two groups, one kid in each and a linked parent."""
+    daycare_id = make_daycare()
+    group_a_id = make_group(daycare_id, "Group A")
+    group_b_id = make_group(daycare_id, "Group B")
+    parent_id = make_parent(daycare_id)
+    (kid_a_id,) = make_kids(
+        daycare_id,
+        group_a_id,
+        full_name="Kid A",
+        parent_ids=[parent_id],
+        attendance=AttendanceStatus.IN_CARE,
+    )
+    (kid_b_id,) = make_kids(
+        daycare_id,
+        group_b_id,
+        full_name="Kid B",
+        parent_ids=[parent_id],
+        attendance=AttendanceStatus.OUT,
+    )
+    return daycare_id, group_a_id, parent_id, kid_a_id, kid_b_id
+
+
+def test_attendance_toggles_append_to_ledger(clean_db, kids):
+    """Every educator toggle is kept, and history reports the last one."""
+    daycare_id, _, _, kid_a_id, _ = kids
+
+    for status in ("in-care", "out", "sick"):
+        response = client.patch(
+            f"/api/v1/kids/{kid_a_id}/attendance", json={"attendance": status}
+        )
+        assert response.status_code == 200
+
+    db = TestingSessionLocal()
+    try:
+        entries = db.query(KidAttendanceEntry).filter_by(kid_id=kid_a_id).all()
+        assert [e.status for e in entries] == [
+            AttendanceStatus.IN_CARE,
+            AttendanceStatus.OUT,
+            AttendanceStatus.SICK,
+        ]
+        assert all(e.source == AttendanceSource.EDUCATOR for e in entries)
+    finally:
+        db.close()
+
+    today = date.today().isoformat()
+    response = client.get(
+        f"/api/v1/kids/attendance/history?daycare_id={daycare_id}&from={today}"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["kid_id"] == kid_a_id
+    assert data[0]["status"] == "sick"
+    assert data[0]["source"] == "educator"
+
+
+def test_kid_update_records_attendance_like_the_endpoint(clean_db, kids, make_token):
+    """Attendance set through PATCH /kids/{id} overrides absences and is logged."""
+    _, _, _, _, kid_b_id = kids
+    db = TestingSessionLocal()
+    try:
+        db.add(
+            KidAbsence(kid_id=kid_b_id, date=date.today(), reason=AbsenceReason.SICK)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    token = make_token("1", "educator")
+    response = client.patch(
+        f"/api/v1/kids/{kid_b_id}",
+        json={"attendance": "in-care"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+    assert response.json()["attendance"] == "in-care"
+
+    db = TestingSessionLocal()
+    try:
+        entries = db.query(KidAttendanceEntry).filter_by(kid_id=kid_b_id).all()
+        assert [(e.status, e.source) for e in entries] == [
+            (AttendanceStatus.IN_CARE, AttendanceSource.EDUCATOR)
+        ]
+        assert db.query(KidAbsence).filter_by(kid_id=kid_b_id).count() == 0
+    finally:
+        db.close()
+
+
+def test_absence_is_recorded_on_its_date(clean_db, kids, make_token):
+    """A parent-reported absence lands in the ledger for the absence date."""
+    daycare_id, _, parent_id, kid_a_id, _ = kids
+
+    absence_date = date.today() + timedelta(days=3)
+    token = make_token(str(parent_id), "parent")
+    response = client.post(
+        f"/api/v1/kids/{kid_a_id}/absences",
+        json={"date": absence_date.isoformat(), "reason": "holiday"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 200
+
+    response = client.get(
+        f"/api/v1/kids/attendance/history?daycare_id={daycare_id}"
+        f"&from={date.today().isoformat()}&to={absence_date.isoformat()}"
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data) == 1
+    assert data[0]["date"] == absence_date.isoformat()
+    assert data[0]["status"] == "holiday"
+    assert data[0]["source"] == "absence"
+
+
+def test_close_out_snapshots_every_kid(clean_db, kids):
+    """Close-out writes a final entry per kid and filters by group on read."""
+    daycare_id, group_a_id, _, kid_a_id, kid_b_id = kids
+    db = TestingSessionLocal()
+    try:
+        day = date(2026, 3, 4)
+        assert close_out_attendance_day(db, day, daycare_id) == 2
+    finally:
+        db.close()
+
+    response = client.get(
+        f"/api/v1/kids/attendance/history?daycare_id={daycare_id}&from=2026-03-04"
+    )
+    assert response.status_code == 200
+    statuses = {e["kid_id"]: (e["status"], e["source"]) for e in response.json()}
+    assert statuses == {
+        kid_a_id: ("in-care", "close_out"),
+        kid_b_id: ("out", "close_out"),
+    }
+
+    response = client.get(
+        f"/api/v1/kids/attendance/history?daycare_id={daycare_id}"
+        f"&from=2026-03-04&group_id={group_a_id}"
+    )
+    assert [e["kid_id"] for e in response.json()] == [kid_a_id]
+
+
+def test_history_rejects_inverted_and_oversized_ranges(clean_db):
+    """The range must be ordered and bounded."""
+    response = client.get(
+        "/api/v1/kids/attendance/history?daycare_id=default-daycare-id&from=2026-03-04&to=2026-03-01"
+    )
+    assert response.status_code == 400
+
+    response = client.get(
+        "/api/v1/kids/attendance/history?daycare_id=default-daycare-id&from=2024-01-01&to=2026-01-01"
+    )
+    assert response.status_code == 400
@@ -0,0 +1,93 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def make_full_roster(make_daycare, make_group, make_parent, make_kids):
+    """Kids with a parent, a trusted adult and every detail column filled."""
+
+    def _make_full_roster(count=3):
+        daycare_id = make_daycare()
+        group_id = make_group(daycare_id)
+        parent_id = make_parent(daycare_id, full_name="Parent")
+        kid_ids = make_kids(
+            daycare_id,
+            group_id,
+            count=count,
+            parent_ids=[parent_id],
+            trusted_adults=[{"name": "Grandma"}],
+            allergies="Peanuts",
+            need_to_know="Naps at noon",
+        )
+        return daycare_id, group_id, kid_ids
+
+    return _make_full_roster
+
+
+def test_summary_view_skips_detail_columns(clean_db, make_full_roster, count_queries):
+    daycare_id, group_id, kid_ids = make_full_roster()
+
+    with count_queries() as statements:
+        response = client.get(f"/api/v1/kids?daycare_id={daycare_id}&view=summary")
+    assert response.status_code == 200
+    assert response.json()[0] == {
+        "id": kid_ids[0],
+        "full_name": "Kid 0",
+        "group_id": group_id,
+        "daycare_id": daycare_id,
+        "attendance": "out",
+    }
+    assert len(response.json()) == 3
+
+    kid_selects = [s for s in statements if "FROM kids" in s and "kids.full_name" in s]
+    assert kid_selects
+    assert not any("allergies" in s or "need_to_know" in s for s in kid_selects)
+    # No relationship loads (the ETag fingerprint only counts parent links)
+    assert not any("trusted_adults" in s or "parents.email" in s for s in statements)
+
+
+def test_full_view_is_the_default(clean_db, make_full_roster):
+    daycare_id, _, _ = make_full_roster(count=1)
+
+    default = client.get(f"/api/v1/kids?daycare_id={daycare_id}").json()
+    full = client.get(f"/api/v1/kids?daycare_id={daycare_id}&view=full").json()
+    assert default == full
+    assert full[0]["allergies"] == "Peanuts"
+    assert full[0]["trusted_adults"][0]["name"] == "Grandma"
+    assert len(full[0]["parents"]) == 1
+
+    response = client.get(f"/api/v1/kids?daycare_id={daycare_id}&view=wide")
+    assert response.status_code == 422
+
+
+def test_summary_view_paginates(clean_db, make_full_roster):
+    daycare_id, _, kid_ids = make_full_roster(count=3)
+
+    url = f"/api/v1/kids?daycare_id={daycare_id}&view=summary&limit=2"
+    first = client.get(url)
+    second = client.get(f"{url}&cursor={first.headers['X-Next-Cursor']}")
+    ids = [kid["id"] for kid in first.json() + second.json()]
+    assert ids == kid_ids
+
+
+def test_get_kid_returns_full_record(clean_db, make_full_roster, make_daycare):
+    daycare_id, _, kid_ids = make_full_roster(count=1)
+
+    response = client.get(f"/api/v1/kids/{kid_ids[0]}?daycare_id={daycare_id}")
+    assert response.status_code == 200
+    kid = response.json()
+    assert kid["need_to_know"] == "Naps at noon"
+    assert kid["trusted_adults"][0]["name"] == "Grandma"
+    assert kid["parents"][0]["full_name"] == "Parent"
+
+    response = client.get(f"/api/v1/kids/{kid_ids[0] + 1}?daycare_id={daycare_id}")
+    assert response.status_code == 404
+
+    # Kids of another daycare are not visible in this scope
+    other_id = make_daycare("Other Daycare")
+    response = client.get(f"/api/v1/kids/{kid_ids[0]}?daycare_id={other_id}")
+    assert response.status_code == 404
@@ -0,0 +1,83 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.exc import InvalidRequestError
+
+from app.core.database import loader_policy
+from app.main import app
+from app.models.educator import Educator
+from app.models.group import Group
+from app.models.kid import Kid
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def make_staffed_daycare(make_daycare, make_group, make_parent, make_kids):
+    """Create a daycare where one parent has `size` kids and `size` educators."""
+
+    def _make_staffed_daycare(size: int) -> tuple[str, int]:
+        daycare_id = make_daycare()
+        group_id = make_group(daycare_id)
+        parent_id = make_parent(daycare_id)
+        make_kids(daycare_id, group_id, count=size, parent_ids=[parent_id])
+
+        db = TestingSessionLocal()
+        try:
+            group = db.get(Group, group_id)
+            db.add_all(
+                Educator(
+                    full_name=f"Educator {i}",
+                    role="educator",
+                    email=f"educator{size}-{i}@example.com",
+                    daycare_id=daycare_id,
+                    groups=[group],
+                )
+                for i in range(size)
+            )
+            db.commit()
+        finally:
+            db.close()
+        return daycare_id, parent_id
+
+    return _make_staffed_daycare
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        "/api/v1/kids?daycare_id={daycare_id}",
+        "/api/v1/educators?daycare_id={daycare_id}",
+        "/api/v1/educators?daycare_id={daycare_id}&group=Group A",
+        "/api/v1/parents/{parent_id}/kids",
+    ],
+)
+def test_list_endpoints_query_count_is_constant(
+    clean_db, make_staffed_daycare, count_queries, path
+):
+    """Serializing relationships costs the same number of queries for 2 or 20 rows."""
+    counts = []
+    for size in (2, 20):
+        daycare_id, parent_id = make_staffed_daycare(size)
+
+        url = path.format(daycare_id=daycare_id, parent_id=parent_id)
+        with count_queries() as statements:
+            response = client.get(url)
+        assert response.status_code == 200
+        assert len(response.json()) == size
+        counts.append(len(statements))
+
+    assert counts[0] == counts[1]
+
+
+def test_loader_policy_raises_on_undeclared_lazy_load(clean_db, make_roster):
+    """In strict mode, touching a relationship the policy did not declare raises."""
+    make_roster()
+    db = TestingSessionLocal()
+    try:
+
+        kid = db.query(Kid).options(*loader_policy()).first()
+        with pytest.raises(InvalidRequestError):
+            kid.parents
+    finally:
+        db.close()
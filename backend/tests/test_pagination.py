@@ -0,0 +1,157 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.educator import Educator
+from app.models.event import Event
+from app.utils.pagination import NEXT_CURSOR_HEADER, decode_cursor, encode_cursor
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+def _walk(url: str, limit: int, headers=None, **params):
+    """Follow X-Next-Cursor until the last page, returning ids per page."""
+    pages = []
+    cursor = None
+    while True:
+        params["limit"] = limit
+        if cursor:
+            params["cursor"] = cursor
+        response = client.get(url, params=params, headers=headers)
+        assert response.status_code == 200
+        pages.append([item["id"] for item in response.json()])
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if not cursor:
+            return pages
+
+
+@pytest.fixture
+def daycare_id(clean_db, make_daycare, make_group, make_parent, make_kids):
+    """A daycare with 7 groups, kids, parents and educators sharing some names."""
+    daycare_id = make_daycare()
+    group_ids = [make_group(daycare_id, f"Group {i % 3}") for i in range(7)]
+
+    db = TestingSessionLocal()
+    try:
+        for i in range(7):
+            # Duplicate names make the id tiebreaker matter
+            name = f"Name {i % 3}"
+            make_kids(daycare_id, group_ids[0], full_name=name)
+            make_parent(daycare_id, name, f"parent{i}@example.com")
+            db.add(
+                Educator(
+                    full_name=name,
+                    role="educator",
+                    email=f"educator{i}@example.com",
+                    daycare_id=daycare_id,
+                )
+            )
+        db.commit()
+    finally:
+        db.close()
+    return daycare_id
+
+
+@pytest.mark.parametrize("resource", ["kids", "parents", "educators", "groups"])
+def test_cursor_walk_returns_every_row_once(daycare_id, resource):
+    """Pages are disjoint, bounded and together cover the whole list."""
+    url = f"/api/v1/{resource}"
+    full = client.get(url, params={"daycare_id": daycare_id}).json()
+    pages = _walk(url, limit=3, daycare_id=daycare_id)
+
+    assert [len(page) for page in pages] == [3, 3, 1]
+    walked = [row_id for page in pages for row_id in page]
+    assert walked == [item["id"] for item in full]
+    assert len(set(walked)) == 7
+
+
+def test_last_page_has_no_cursor(daycare_id):
+    """A page that holds the rest of the list carries no next cursor."""
+    response = client.get(f"/api/v1/kids?daycare_id={daycare_id}&limit=7")
+    assert response.status_code == 200
+    assert len(response.json()) == 7
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+@pytest.mark.parametrize("resource", ["kids", "parents", "educators", "groups"])
+def test_requests_without_limit_are_not_paged(daycare_id, resource, monkeypatch):
+    """Clients that never send limit or cursor still get the whole list."""
+    monkeypatch.setattr("app.utils.pagination.DEFAULT_PAGE_SIZE", 2)
+    url = f"/api/v1/{resource}"
+    response = client.get(url, params={"daycare_id": daycare_id})
+    assert len(response.json()) == 7
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+    # A cursor alone pages at the default size
+    cursor = encode_cursor("", 0)
+    response = client.get(url, params={"daycare_id": daycare_id, "cursor": cursor})
+    assert len(response.json()) == 2
+    assert NEXT_CURSOR_HEADER in response.headers
+
+
+def test_invalid_cursor_returns_400(daycare_id):
+    """Garbage cursors are rejected rather than ignored."""
+    response = client.get(f"/api/v1/kids?daycare_id={daycare_id}&cursor=not-a-cursor")
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Invalid pagination cursor"
+
+
+def test_limit_is_bounded(daycare_id):
+    """Page size is capped."""
+    response = client.get(f"/api/v1/kids?daycare_id={daycare_id}&limit=100000")
+    assert response.status_code == 422
+
+
+def test_events_cursor_orders_by_date(daycare_id, auth_headers):
+    """Events page by (date, id) and the cursor round-trips datetimes."""
+    db = TestingSessionLocal()
+    try:
+        start = datetime(2026, 3, 1, 9, 0)
+        events = [
+            Event(
+                title=f"Event {i}",
+                date=start + timedelta(days=(5 - i) % 3),
+                daycare_id=daycare_id,
+            )
+            for i in range(5)
+        ]
+        db.add_all(events)
+        db.commit()
+        expected = [e.id for e in sorted(events, key=lambda e: (e.date, e.id))]
+    finally:
+        db.close()
+
+    pages = _walk("/api/v1/events/", limit=2, headers=auth_headers(daycare_id))
+    assert [len(page) for page in pages] == [2, 2, 1]
+    assert [row_id for page in pages for row_id in page] == expected
+
+
+def test_events_legacy_skip_still_works(daycare_id, auth_headers):
+    """OFFSET paging stays available for older clients."""
+    db = TestingSessionLocal()
+    try:
+        db.add_all(
+            Event(
+                title=f"Event {i}", date=datetime(2026, 3, 1 + i), daycare_id=daycare_id
+            )
+            for i in range(3)
+        )
+        db.commit()
+    finally:
+        db.close()
+
+    response = client.get(
+        "/api/v1/events/?skip=1&limit=1", headers=auth_headers(daycare_id)
+    )
+    assert response.status_code == 200
+    assert [e["title"] for e in response.json()] == ["Event 1"]
+
+
+def test_cursor_round_trip():
+    """Cursors are opaque strings that decode to the encoded key."""
+    cursor = encode_cursor(datetime(2026, 3, 4, 8, 30), 42)
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == ("2026-03-04T08:30:00", 42)
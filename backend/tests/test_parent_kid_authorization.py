@@ -0,0 +1,130 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import insert
+
+from app.main import app
+from app.models.associations import parent_kids
+from app.models.kid import Kid
+from app.models.parent import Parent
+from app.services.authorization_service import (
+    ParentLinkCache,
+    is_parent_of,
+    parent_link_cache,
+)
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def family(make_daycare, make_group, make_parent, make_kids):
+    """A kid linked to one parent, and a parent of the same daycare who is not."""
+    daycare_id = make_daycare()
+    parent_id, other_id = (make_parent(daycare_id, f"Parent {i}") for i in range(2))
+    (kid_id,) = make_kids(
+        daycare_id, make_group(daycare_id), full_name="Test Kid", parent_ids=[parent_id]
+    )
+    return parent_id, other_id, kid_id
+
+
+def test_is_parent_of_caches_links(clean_db, family, count_queries):
+    """Links are checked with one EXISTS, then served from the cache."""
+    parent_id, other_id, kid_id = family
+    db = TestingSessionLocal()
+    try:
+
+        with count_queries() as statements:
+            assert is_parent_of(db, parent_id, kid_id) is True
+            assert is_parent_of(db, other_id, kid_id) is False
+        assert len(statements) == 2
+        assert all("parent_kids" in statement for statement in statements)
+
+        # Missing links are not cached
+        with count_queries() as statements:
+            assert is_parent_of(db, parent_id, kid_id) is True
+            assert is_parent_of(db, other_id, kid_id) is False
+        assert len(statements) == 1
+    finally:
+        db.close()
+
+
+def test_links_made_elsewhere_are_seen_at_once(clean_db, family):
+    """A link written outside the ORM, e.g. by another worker, is not hidden."""
+    _, other_id, kid_id = family
+    db = TestingSessionLocal()
+    try:
+        assert is_parent_of(db, other_id, kid_id) is False
+
+        db.execute(insert(parent_kids).values(parent_id=other_id, kid_id=kid_id))
+        db.commit()
+        assert is_parent_of(db, other_id, kid_id) is True
+    finally:
+        db.close()
+
+
+def test_link_changes_invalidate_cache(clean_db, family):
+    """Adding or removing a link through the ORM drops cached answers."""
+    parent_id, other_id, kid_id = family
+    db = TestingSessionLocal()
+    try:
+        assert is_parent_of(db, other_id, kid_id) is False
+
+        other = db.get(Parent, other_id)
+        other.kids.append(db.get(Kid, kid_id))
+        db.commit()
+        assert is_parent_of(db, other_id, kid_id) is True
+
+        kid = db.get(Kid, kid_id)
+        kid.parents.remove(db.get(Parent, other_id))
+        db.commit()
+        assert is_parent_of(db, other_id, kid_id) is False
+        assert is_parent_of(db, parent_id, kid_id) is True
+    finally:
+        db.close()
+
+
+def test_cache_is_bounded_and_expires():
+    """Least recently used entries are evicted and expired entries are misses."""
+    cache = ParentLinkCache(maxsize=2, ttl=60)
+    cache.set(1, 1, True)
+    cache.set(1, 2, False)
+    assert cache.get(1, 1) is True
+    cache.set(1, 3, True)
+    assert cache.get(1, 2) is None
+    assert cache.get(1, 1) is True
+
+    cache.invalidate(kid_ids={3})
+    assert cache.get(1, 3) is None
+
+    expired = ParentLinkCache(ttl=0)
+    expired.set(1, 1, True)
+    assert expired.get(1, 1) is None
+
+
+def test_update_kid_skips_parent_load(clean_db, family, make_token, count_queries):
+    """A linked parent can update sensitive fields without loading parent.kids."""
+    parent_id, other_id, kid_id = family
+    parent_link_cache.clear()
+
+    token = make_token(str(parent_id), "parent")
+    with count_queries() as statements:
+        response = client.patch(
+            f"/api/v1/kids/{kid_id}",
+            json={"allergies": "Peanuts"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+    assert response.status_code == 200
+    assert response.json()["allergies"] == "Peanuts"
+    # Only the response serialization reads parents, after the UPDATE
+    update_index = next(
+        i for i, statement in enumerate(statements) if statement.startswith("UPDATE")
+    )
+    assert not any("parents" in statement for statement in statements[:update_index])
+
+    token = make_token(str(other_id), "parent")
+    response = client.patch(
+        f"/api/v1/kids/{kid_id}",
+        json={"allergies": "None"},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 403
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+
+import pytest
+from fastapi import HTTPException
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.core.passwords import PasswordHasher, hash_password, needs_rehash
+from app.main import app
+from app.models.educator import Educator
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def cheap_hashing(monkeypatch):
+    """Keep scrypt fast in tests; the cost is a setting."""
+    monkeypatch.setattr(settings, "password_scrypt_n", 2**10)
+    monkeypatch.setattr(settings, "password_scrypt_r", 8)
+    monkeypatch.setattr(settings, "password_scrypt_p", 1)
+
+
+@pytest.fixture
+def educator_id(cheap_hashing, make_daycare):
+    """An educator whose password is "s3cret-pass"."""
+    db = TestingSessionLocal()
+    try:
+        educator = Educator(
+            full_name="Test Educator",
+            role="educator",
+            email="educator@example.com",
+            daycare_id=make_daycare(),
+            password_hash=hash_password("s3cret-pass"),
+        )
+        db.add(educator)
+        db.commit()
+        return educator.id
+    finally:
+        db.close()
+
+
+def _login(password, email="educator@example.com"):
+    return client.post(
+        "/api/v1/auth/login", json={"email": email, "password": password}
+    )
+
+
+def test_login_issues_tokens(clean_db, educator_id):
+    response = _login("s3cret-pass")
+    assert response.status_code == 200
+    tokens = response.json()
+    assert tokens["refresh_token"]
+    response = client.get(
+        "/api/v1/auth/me",
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+    )
+    assert response.json()["role"] == "educator"
+
+
+def test_login_rejects_bad_credentials(clean_db, educator_id):
+    assert _login("wrong-pass").status_code == 401
+    assert _login("s3cret-pass", email="nobody@example.com").status_code == 401
+
+
+def test_login_rehashes_when_cost_changes(clean_db, educator_id, monkeypatch):
+    db = TestingSessionLocal()
+    try:
+        monkeypatch.setattr(settings, "password_scrypt_n", 2**11)
+        old_hash = db.get(Educator, educator_id).password_hash
+        assert needs_rehash(old_hash)
+
+        assert _login("s3cret-pass").status_code == 200
+
+        db.expire_all()
+        new_hash = db.get(Educator, educator_id).password_hash
+        assert new_hash != old_hash
+        assert new_hash.startswith("scrypt$2048$")
+        assert not needs_rehash(new_hash)
+    finally:
+        db.close()
+    assert _login("s3cret-pass").status_code == 200
+
+
+def test_hashing_runs_on_dedicated_pool():
+    hasher = PasswordHasher(workers=1, max_pending=4)
+    try:
+        name = asyncio.run(hasher.run(lambda: threading.current_thread().name))
+    finally:
+        hasher.shutdown()
+    assert name.startswith("password-hash")
+
+
+def test_backlog_beyond_limit_is_shed():
+    """Callers past max_pending get a 503 instead of queueing."""
+    hasher = PasswordHasher(workers=1, max_pending=1)
+    release = threading.Event()
+
+    async def storm():
+        first = asyncio.create_task(hasher.run(release.wait, 5))
+        await asyncio.sleep(0.05)
+        with pytest.raises(HTTPException) as excinfo:
+            await hasher.run(lambda: None)
+        release.set()
+        await first
+        return excinfo.value
+
+    try:
+        error = asyncio.run(storm())
+    finally:
+        hasher.shutdown()
+    assert error.status_code == 503
@@ -0,0 +1,250 @@
+import time
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric.ed25519 import Ed25519PublicKey
+from fastapi.testclient import TestClient
+
+from app.core.config import settings
+from app.main import app
+from app.services.pickup_pass_service import (
+    PickupPass,
+    _unb64,
+    pickup_version_cache,
+    revoke_pickup_passes,
+    sign_pickup_pass,
+    verify_pickup_pass,
+)
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def family(make_daycare, make_group, make_parent, make_kids):
+    """A kid with one parent and two trusted adults."""
+    daycare_id = make_daycare()
+    parent_id = make_parent(daycare_id, full_name="Parent")
+    (kid_id,) = make_kids(
+        daycare_id,
+        make_group(daycare_id),
+        full_name="Test Kid",
+        parent_ids=[parent_id],
+        trusted_adults=[{"name": "Grandma"}, {"name": "Uncle Bob"}],
+    )
+    return daycare_id, parent_id, kid_id
+
+
+def _auth(token):
+    return {"Authorization": f"Bearer {token}"}
+
+
+def _issue(make_token, parent_id, kid_id, adult_name="Grandma"):
+    return client.post(
+        f"/api/v1/kids/{kid_id}/pickup-passes",
+        json={"adult_name": adult_name},
+        headers=_auth(make_token(str(parent_id), "parent")),
+    )
+
+
+def _verify(make_token, pickup_token, daycare_id="default-daycare-id"):
+    return client.post(
+        "/api/v1/kids/pickup-passes/verify",
+        json={"token": pickup_token},
+        headers=_auth(make_token("1", "educator", daycare_id=daycare_id)),
+    )
+
+
+def test_issue_and_verify_without_database(clean_db, family, make_token, count_queries):
+    """A cached version means verification is a signature check and nothing else."""
+    daycare_id, parent_id, kid_id = family
+
+    response = _issue(make_token, parent_id, kid_id)
+    assert response.status_code == 201
+    data = response.json()
+    assert data["kid_id"] == kid_id
+    assert data["adult_name"] == "Grandma"
+    assert data["token"].startswith("pp1.")
+
+    # First verification loads the kid's version, later ones reuse it
+    assert _verify(make_token, data["token"]).json()["valid"] is True
+    with count_queries() as statements:
+        response = _verify(make_token, data["token"], daycare_id=daycare_id)
+    assert response.json() == {
+        "valid": True,
+        "reason": None,
+        "kid_id": kid_id,
+        "adult_name": "Grandma",
+        "expires_at": data["expires_at"],
+    }
+    assert not any("kids" in statement for statement in statements)
+
+
+def test_public_key_verifies_offline(clean_db):
+    """The published key is enough to check a pass signature."""
+    response = client.get("/api/v1/kids/pickup-passes/key")
+    assert response.status_code == 200
+    key = Ed25519PublicKey.from_public_bytes(_unb64(response.json()["public_key"]))
+
+    token = sign_pickup_pass(PickupPass(1, "d", "Grandma", 0, int(time.time()) + 60))
+    prefix, payload, signature = token.split(".")
+    key.verify(_unb64(signature), f"{prefix}.{payload}".encode())
+
+
+def test_forged_and_expired_passes_rejected(clean_db, family, make_token):
+    daycare_id, parent_id, kid_id = family
+    token = _issue(make_token, parent_id, kid_id).json()["token"]
+
+    prefix, payload, signature = token.split(".")
+    forged = sign_pickup_pass(
+        PickupPass(kid_id, str(daycare_id), "Stranger", 0, int(time.time()) + 60)
+    ).split(".")[1]
+    response = _verify(make_token, f"{prefix}.{forged}.{signature}")
+    assert response.json() == {
+        "valid": False,
+        "reason": "Invalid signature",
+        "kid_id": None,
+        "adult_name": None,
+        "expires_at": None,
+    }
+    assert _verify(make_token, "garbage").json()["reason"] == "Malformed pickup pass"
+
+    expired = sign_pickup_pass(
+        PickupPass(kid_id, str(daycare_id), "Grandma", 0, int(time.time()) - 1)
+    )
+    assert _verify(make_token, expired).json()["reason"] == "Pickup pass has expired"
+    assert verify_pickup_pass(token).kid_id == kid_id
+
+
+def test_revoke_invalidates_issued_passes(clean_db, family, make_token):
+    daycare_id, parent_id, kid_id = family
+    old_token = _issue(make_token, parent_id, kid_id).json()["token"]
+    assert _verify(make_token, old_token).json()["valid"] is True
+
+    response = client.post(
+        f"/api/v1/kids/{kid_id}/pickup-passes/revoke",
+        headers=_auth(make_token(str(parent_id), "parent")),
+    )
+    assert response.status_code == 204
+
+    response = _verify(make_token, old_token)
+    assert response.json()["reason"] == "Pickup pass has been revoked"
+    # Passes issued after the revocation carry the new version
+    new_token = _issue(make_token, parent_id, kid_id).json()["token"]
+    assert _verify(make_token, new_token).json()["valid"] is True
+
+    # Another worker's cache picks up the bump once its entry expires
+    pickup_version_cache.clear()
+    assert _verify(make_token, old_token).json()["valid"] is False
+
+    response = client.get(
+        "/api/v1/kids/pickup-passes/versions",
+        params={"daycare_id": daycare_id},
+        headers=_auth(make_token("1", "educator", daycare_id=daycare_id)),
+    )
+    assert response.status_code == 200
+    assert response.json() == {str(kid_id): 1}
+
+
+def test_rolled_back_revocation_leaves_passes_valid(clean_db, family, make_token):
+    daycare_id, parent_id, kid_id = family
+    token = _issue(make_token, parent_id, kid_id).json()["token"]
+    assert _verify(make_token, token).json()["valid"] is True
+
+    db = TestingSessionLocal()
+    try:
+        revoke_pickup_passes(db, kid_id)
+        db.rollback()
+    finally:
+        db.close()
+    assert pickup_version_cache.get(kid_id) == 0
+    assert _verify(make_token, token).json()["valid"] is True
+
+
+def test_removing_trusted_adult_revokes_passes(clean_db, family, make_token):
+    daycare_id, parent_id, kid_id = family
+    headers = _auth(make_token(str(parent_id), "parent"))
+    token = _issue(make_token, parent_id, kid_id).json()["token"]
+
+    # A parent of another kid is rejected before anything is revoked
+    response = client.patch(
+        f"/api/v1/kids/{kid_id}",
+        json={"trusted_adults": []},
+        headers=_auth(make_token(str(parent_id + 1), "parent")),
+    )
+    assert response.status_code == 403
+    assert _verify(make_token, token).json()["valid"] is True
+
+    # Adding an adult leaves existing passes valid
+    response = client.patch(
+        f"/api/v1/kids/{kid_id}",
+        json={
+            "trusted_adults": [
+                {"name": "Grandma"},
+                {"name": "Uncle Bob"},
+                {"name": "Aunt Sue"},
+            ]
+        },
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert _verify(make_token, token).json()["valid"] is True
+
+    response = client.patch(
+        f"/api/v1/kids/{kid_id}",
+        json={"trusted_adults": [{"name": "Grandma"}]},
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert _verify(make_token, token).json()["reason"] == "Pickup pass has been revoked"
+
+    response = _issue(make_token, parent_id, kid_id, adult_name="Uncle Bob")
+    assert response.status_code == 404
+
+
+def test_pickup_pass_permissions(clean_db, family, make_token):
+    daycare_id, parent_id, kid_id = family
+    token = _issue(make_token, parent_id, kid_id).json()["token"]
+
+    response = client.post(
+        "/api/v1/kids/pickup-passes/verify",
+        json={"token": token},
+        headers=_auth(make_token(str(parent_id), "parent")),
+    )
+    assert response.status_code == 403
+
+    response = client.post(
+        f"/api/v1/kids/{kid_id}/pickup-passes",
+        json={"adult_name": "Grandma"},
+        headers=_auth(make_token("1", "educator")),
+    )
+    assert response.status_code == 403
+
+    assert _issue(make_token, parent_id + 1, kid_id).status_code == 403
+    assert _issue(make_token, parent_id, kid_id + 1).status_code == 404
+
+    # An educator from another daycare cannot accept the pass
+    response = _verify(
+        make_token, token, daycare_id="00000000-0000-0000-0000-000000000000"
+    )
+    assert response.json()["reason"] == "Pickup pass is for another daycare"
+
+
+def test_verifier_without_a_daycare_is_not_trusted(
+    clean_db, family, make_token, make_daycare, monkeypatch
+):
+    daycare_id, parent_id, kid_id = family
+    token = _issue(make_token, parent_id, kid_id).json()["token"]
+    other_daycare_id = make_daycare("Other Daycare")
+
+    # A dev placeholder token is scoped like any other tenant-owned request
+    response = client.post(
+        f"/api/v1/kids/pickup-passes/verify?daycare_id={other_daycare_id}",
+        json={"token": token},
+        headers=_auth(make_token("1", "educator")),
+    )
+    assert response.json()["reason"] == "Pickup pass is for another daycare"
+
+    monkeypatch.setattr(settings, "allow_dev_daycare_scope", False)
+    for claim in ("default-daycare-id", None):
+        response = _verify(make_token, token, daycare_id=claim)
+        assert response.status_code == 403
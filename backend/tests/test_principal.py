@@ -0,0 +1,62 @@
+import dataclasses
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.deps import require_any_role, require_permission
+from app.core.permissions import Permission, Principal
+from app.main import app
+
+client = TestClient(app)
+
+
+def test_principal_from_dev_login_claims():
+    """Claims are parsed once into typed fields and a permission mask."""
+    principal = Principal.from_claims(
+        {
+            "sub": "7",
+            "role": "educator",
+            "daycare_id": "daycare-1",
+            "groups": ["Sunflowers", "Tulips"],
+        }
+    )
+    assert principal.id == 7
+    assert principal.daycare_id == "daycare-1"
+    assert principal.groups == frozenset({"Sunflowers", "Tulips"})
+    assert principal.in_group("Tulips")
+    assert not principal.in_group("Roses")
+    assert principal.can(Permission.VIEW_DAYCARE_ABSENCES)
+    assert not principal.can(Permission.OWN_KID_ABSENCES)
+    assert not principal.can(Permission.VIEW_ROSTER | Permission.EDIT_KID_HEALTH)
+
+
+def test_principal_is_immutable_and_slotted():
+    principal = Principal.from_claims({"sub": "test-user", "role": "parent"})
+    assert principal.id is None
+    assert principal.is_parent
+    assert not hasattr(principal, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        principal.role = "educator"
+
+
+def test_unknown_role_has_no_permissions():
+    principal = Principal.from_claims({"sub": "1", "role": "janitor"})
+    assert principal.permissions == Permission.NONE
+
+
+def test_role_dependencies_are_built_once():
+    """Routes sharing a requirement share one dependency callable."""
+    assert require_any_role("educator", "super_educator") is require_any_role(
+        "educator", "super_educator"
+    )
+    assert require_permission(Permission.VIEW_ROSTER) is require_permission(
+        Permission.VIEW_ROSTER
+    )
+
+
+def test_educator_info_requires_educator_permission(make_token):
+    token = make_token("1", "parent")
+    response = client.get(
+        "/api/v1/auth/me/educator", headers={"Authorization": f"Bearer {token}"}
+    )
+    assert response.status_code == 403
@@ -0,0 +1,160 @@
+from datetime import date, datetime
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.educator import Educator
+from app.models.event import Event, EventImage
+from app.models.group import Group
+from app.models.kid import AbsenceReason, KidAbsence
+from app.services.read_model import (
+    EducatorRow,
+    KidRow,
+    get_educator_rows,
+    get_event_rows,
+    get_kid_rows,
+    get_parent_rows,
+)
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def populated_daycare(make_daycare, make_group, make_parent, make_kids):
+    """Two groups, two parents, an educator of both groups and two kids."""
+    daycare_id = make_daycare()
+    group_ids = [make_group(daycare_id, name) for name in ("A", "B")]
+    parent_ids = [
+        make_parent(daycare_id, f"Parent {i}", f"parent{i}@example.com")
+        for i in range(2)
+    ]
+    adults = [{"name": "Grandma"}, {"name": "Grandpa"}]
+    kid_ids = [
+        *make_kids(
+            daycare_id, group_ids[0], parent_ids=parent_ids[:1], trusted_adults=adults
+        ),
+        *make_kids(
+            daycare_id,
+            group_ids[0],
+            full_name="Kid 1",
+            parent_ids=parent_ids,
+            trusted_adults=adults,
+        ),
+    ]
+
+    db = TestingSessionLocal()
+    try:
+        groups = db.query(Group).filter(Group.id.in_(group_ids)).all()
+        db.add(
+            Educator(
+                full_name="Educator",
+                role="educator",
+                email="educator@example.com",
+                daycare_id=daycare_id,
+                groups=groups,
+            )
+        )
+        db.add(
+            KidAbsence(kid_id=kid_ids[1], date=date.today(), reason=AbsenceReason.SICK)
+        )
+        db.commit()
+    finally:
+        db.close()
+    return daycare_id, kid_ids
+
+
+def test_rows_are_not_tracked_by_the_session(clean_db, populated_daycare):
+    """Read-model queries build DTOs only, nothing enters the identity map."""
+    daycare_id, kid_ids = populated_daycare
+    db = TestingSessionLocal()
+    try:
+
+        kids, next_cursor = get_kid_rows(db, daycare_id, None, None, 10)
+        educators, _ = get_educator_rows(db, daycare_id, None, None, None, 10)
+        parents, _ = get_parent_rows(db, daycare_id, None, None, 10)
+
+        assert len(db.identity_map) == 0
+    finally:
+        db.close()
+
+    assert next_cursor is None
+    assert all(isinstance(kid, KidRow) for kid in kids)
+    assert [kid.attendance for kid in kids] == ["out", "sick"]
+    assert [len(kid.parents) for kid in kids] == [1, 2]
+    assert [adult.name for adult in kids[0].trusted_adults] == ["Grandma", "Grandpa"]
+    assert educators == [
+        EducatorRow(
+            id=educators[0].id,
+            full_name="Educator",
+            role="educator",
+            email="educator@example.com",
+            phone_num=None,
+            groups=educators[0].groups,
+        )
+    ]
+    assert [group.name for group in educators[0].groups] == ["A", "B"]
+    assert [parent.full_name for parent in parents] == ["Parent 0", "Parent 1"]
+
+
+def test_list_endpoints_serialize_rows(clean_db, populated_daycare, count_queries):
+    daycare_id, kid_ids = populated_daycare
+
+    with count_queries() as statements:
+        response = client.get(f"/api/v1/kids?daycare_id={daycare_id}")
+    assert response.status_code == 200
+    kids = response.json()
+    assert kids[1]["attendance"] == "sick"
+    assert kids[1]["parents"][1]["full_name"] == "Parent 1"
+    assert kids[0]["trusted_adults"][0]["name"] == "Grandma"
+    # Daycare check, fingerprint, kids with their absence, trusted adults, parents
+    assert len(statements) == 5
+
+    response = client.get(f"/api/v1/educators?daycare_id={daycare_id}")
+    assert [group["name"] for group in response.json()[0]["groups"]] == ["A", "B"]
+
+    response = client.get(f"/api/v1/groups?daycare_id={daycare_id}&limit=1")
+    assert [group["name"] for group in response.json()] == ["A"]
+    cursor = response.headers["X-Next-Cursor"]
+    response = client.get(f"/api/v1/groups?daycare_id={daycare_id}&cursor={cursor}")
+    assert [group["name"] for group in response.json()] == ["B"]
+
+    response = client.get(f"/api/v1/parents?daycare_id={daycare_id}&search=Parent 1")
+    assert [parent["email"] for parent in response.json()] == ["parent1@example.com"]
+
+
+def test_events_load_images_in_one_select(
+    clean_db, make_daycare, count_queries, auth_headers
+):
+    daycare_id = make_daycare()
+    db = TestingSessionLocal()
+    try:
+        for i in range(3):
+            event = Event(
+                title=f"Event {i}",
+                date=datetime(2026, 3, i + 1, 10),
+                daycare_id=daycare_id,
+            )
+            event.images = [
+                EventImage(file_name=f"{i}-{n}.jpg", s3_key=f"events/{i}/{n}")
+                for n in range(2)
+            ]
+            db.add(event)
+        db.commit()
+
+        with count_queries() as statements:
+            events, next_cursor = get_event_rows(db, daycare_id, limit=2)
+        assert len(statements) == 2
+        assert [event.title for event in events] == ["Event 0", "Event 1"]
+        assert [image.file_name for image in events[1].images] == ["1-0.jpg", "1-1.jpg"]
+        assert events[0].images[0].image_url.endswith("/events/0/0")
+
+        events, _ = get_event_rows(db, daycare_id, cursor=next_cursor, limit=2)
+        assert [event.title for event in events] == ["Event 2"]
+    finally:
+        db.close()
+
+    response = client.get("/api/v1/events/", headers=auth_headers(daycare_id))
+    assert response.status_code == 200
+    assert [len(event["images"]) for event in response.json()] == [2, 2, 2]
@@ -0,0 +1,216 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+
+from app.core.security import decode_access_token
+from app.main import app
+from app.models.educator import Educator
+from app.models.group import Group
+from app.models.parent import Parent
+from app.models.refresh_token import RefreshToken
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def educator_groups(make_daycare, make_group):
+    """An educator of Sunflowers, and the ID of the daycare's other group."""
+    daycare_id = make_daycare()
+    group_id, other_group_id = (
+        make_group(daycare_id, name) for name in ("Sunflowers", "Tulips")
+    )
+    db = TestingSessionLocal()
+    try:
+        educator = Educator(
+            full_name="Test Educator",
+            role="educator",
+            email="educator@example.com",
+            daycare_id=daycare_id,
+            groups=[db.get(Group, group_id)],
+        )
+        db.add(educator)
+        db.commit()
+        return educator.id, other_group_id
+    finally:
+        db.close()
+
+
+def _login(educator_id=None, parent_id=None):
+    account = (
+        {"parent_id": str(parent_id)}
+        if parent_id
+        else {"educator_id": str(educator_id)}
+    )
+    response = client.post("/api/v1/auth/dev-login", json=account)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _refresh(refresh_token):
+    return client.post("/api/v1/auth/refresh", json={"refresh_token": refresh_token})
+
+
+def test_refresh_rotates_with_one_lookup(clean_db, educator_groups, count_queries):
+    """Renewal reads only the refresh token row (joined to its subject)."""
+    educator_id, _ = educator_groups
+    tokens = _login(educator_id)
+
+    with count_queries() as statements:
+        response = _refresh(tokens["refresh_token"])
+    assert response.status_code == 200
+    renewed = response.json()
+    assert renewed["refresh_token"] != tokens["refresh_token"]
+    assert [s for s in statements if s.startswith("SELECT")] == [statements[0]]
+    assert "refresh_tokens" in statements[0]
+
+    claims = decode_access_token(renewed["access_token"])
+    assert claims["sub"] == str(educator_id)
+    assert claims["groups"] == ["Sunflowers"]
+    response = client.get(
+        "/api/v1/auth/me",
+        headers={"Authorization": f"Bearer {renewed['access_token']}"},
+    )
+    assert response.status_code == 200
+
+
+def test_reused_refresh_token_revokes_family(clean_db, educator_groups):
+    educator_id, _ = educator_groups
+    first = _login(educator_id)["refresh_token"]
+    second = _refresh(first).json()["refresh_token"]
+
+    assert _refresh(first).status_code == 401
+    # The legitimate successor is gone too
+    assert _refresh(second).status_code == 401
+
+
+def test_group_change_rebuilds_claims(clean_db, educator_groups):
+    educator_id, other_group_id = educator_groups
+    db = TestingSessionLocal()
+    try:
+        refresh_token = _login(educator_id)["refresh_token"]
+
+        educator = db.get(Educator, educator_id)
+        educator.groups.append(db.get(Group, other_group_id))
+        db.commit()
+        assert educator.claims_version == 1
+    finally:
+        db.close()
+
+    response = _refresh(refresh_token)
+    assert response.status_code == 200
+    claims = decode_access_token(response.json()["access_token"])
+    assert sorted(claims["groups"]) == ["Sunflowers", "Tulips"]
+
+
+def _refreshed_claims(refresh_token):
+    response = _refresh(refresh_token)
+    assert response.status_code == 200
+    return decode_access_token(response.json()["access_token"])
+
+
+def test_role_change_rebuilds_claims(clean_db, educator_groups):
+    educator_id, _ = educator_groups
+    refresh_token = _login(educator_id)["refresh_token"]
+    db = TestingSessionLocal()
+    try:
+        db.get(Educator, educator_id).role = "super_educator"
+        db.commit()
+    finally:
+        db.close()
+
+    assert _refreshed_claims(refresh_token)["role"] == "super_educator"
+
+
+def test_daycare_move_rebuilds_claims(clean_db, educator_groups, make_daycare):
+    educator_id, _ = educator_groups
+    other_daycare_id = make_daycare("Other Daycare")
+    refresh_token = _login(educator_id)["refresh_token"]
+    db = TestingSessionLocal()
+    try:
+        educator = db.get(Educator, educator_id)
+        educator.daycare_id = other_daycare_id
+        educator.groups = []
+        db.commit()
+    finally:
+        db.close()
+
+    claims = _refreshed_claims(refresh_token)
+    assert claims["daycare_id"] == other_daycare_id
+    assert claims["groups"] == []
+
+
+def test_group_rename_rebuilds_members_claims(clean_db, educator_groups):
+    educator_id, other_group_id = educator_groups
+    refresh_token = _login(educator_id)["refresh_token"]
+    db = TestingSessionLocal()
+    try:
+        # Renaming a group the educator is not in leaves their claims alone
+        db.get(Group, other_group_id).name = "Roses"
+        db.commit()
+        assert db.get(Educator, educator_id).claims_version == 0
+        group = db.scalar(select(Group).where(Group.name == "Sunflowers"))
+        group.name = "Daisies"
+        db.commit()
+    finally:
+        db.close()
+
+    assert _refreshed_claims(refresh_token)["groups"] == ["Daisies"]
+
+
+def test_parent_daycare_move_rebuilds_claims(clean_db, make_daycare, make_parent):
+    daycare_id, other_daycare_id = make_daycare(), make_daycare("Other Daycare")
+    parent_id = make_parent(daycare_id)
+    refresh_token = _login(parent_id=parent_id)["refresh_token"]
+    refresh_token = _refresh(refresh_token).json()["refresh_token"]
+    db = TestingSessionLocal()
+    try:
+        db.get(Parent, parent_id).daycare_id = other_daycare_id
+        db.commit()
+    finally:
+        db.close()
+
+    claims = _refreshed_claims(refresh_token)
+    assert claims["role"] == "parent"
+    assert claims["daycare_id"] == other_daycare_id
+
+
+def test_logout_revokes_refresh_family(clean_db, educator_groups):
+    educator_id, _ = educator_groups
+    tokens = _login(educator_id)
+
+    response = client.post(
+        "/api/v1/auth/logout",
+        json={"refresh_token": tokens["refresh_token"]},
+        headers={"Authorization": f"Bearer {tokens['access_token']}"},
+    )
+    assert response.status_code == 200
+    assert _refresh(tokens["refresh_token"]).status_code == 401
+
+
+def test_unknown_refresh_token_is_rejected(clean_db):
+    assert _refresh("not-a-token").status_code == 401
+
+
+def test_rotation_keeps_the_familys_expiry(clean_db, educator_groups):
+    educator_id, _ = educator_groups
+    refresh_token = _login(educator_id)["refresh_token"]
+    db = TestingSessionLocal()
+    try:
+        login_expiry = db.scalar(select(RefreshToken.expires_at))
+        for _ in range(3):
+            refresh_token = _refresh(refresh_token).json()["refresh_token"]
+        expiries = db.scalars(select(RefreshToken.expires_at)).all()
+        assert len(expiries) == 4
+        assert set(expiries) == {login_expiry}
+
+        # Once the family's expiry passes, rotation ends however recent the use
+        db.execute(
+            update(RefreshToken).values(expires_at=datetime.utcnow() - timedelta(1))
+        )
+        db.commit()
+    finally:
+        db.close()
+    assert _refresh(refresh_token).status_code == 401
@@ -0,0 +1,64 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+client = TestClient(app)
+
+
+@pytest.fixture
+def daycare_ids(make_roster):
+    """Two daycares with one kid each."""
+    return [make_roster(full_name=f"Kid {i}")[0] for i in range(2)]
+
+
+def _daycare_lookups(statements):
+    return [s for s in statements if "FROM daycares" in s]
+
+
+def test_token_daycare_claim_scopes_without_lookup(
+    clean_db, daycare_ids, make_token, count_queries
+):
+    """A signed daycare_id claim is used as-is; no daycare lookup per request."""
+    token = make_token("1", "educator", daycare_id=daycare_ids[1])
+
+    with count_queries() as statements:
+        response = client.get(
+            "/api/v1/kids", headers={"Authorization": f"Bearer {token}"}
+        )
+    assert response.status_code == 200
+    assert [kid["full_name"] for kid in response.json()] == ["Kid 1"]
+    assert _daycare_lookups(statements) == []
+
+
+def test_query_param_must_match_token_claim(clean_db, daycare_ids, make_token):
+    token = make_token("1", "educator", daycare_id=daycare_ids[1])
+
+    response = client.get(
+        "/api/v1/kids",
+        params={"daycare_id": daycare_ids[0]},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    assert response.status_code == 403
+
+
+def test_unknown_daycare_is_rejected(clean_db):
+    response = client.get("/api/v1/kids", params={"daycare_id": str(uuid.uuid4())})
+    assert response.status_code == 404
+
+    response = client.get("/api/v1/groups", params={"daycare_id": "not-a-uuid"})
+    assert response.status_code == 404
+
+
+def test_daycare_checks_are_cached(clean_db, daycare_ids, count_queries):
+    """The dev placeholder and known daycares are looked up once per process."""
+
+    for daycare_id in ("default-daycare-id", daycare_ids[1]):
+        client.get("/api/v1/groups", params={"daycare_id": daycare_id})
+        with count_queries() as statements:
+            response = client.get("/api/v1/groups", params={"daycare_id": daycare_id})
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert _daycare_lookups(statements) == []
@@ -0,0 +1,118 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.models.kid import TrustedAdult
+from tests.conftest import TestingSessionLocal
+
+client = TestClient(app)
+
+GRANDMA = {"name": "Grandma", "email": "grandma@example.com", "phone_num": "+1555"}
+
+
+@pytest.fixture
+def make_family(make_daycare, make_group, make_parent, make_kids):
+    """Kids of one parent; every kid lists Grandma, odd kids also Uncle Bob."""
+
+    def _make_family(count=3):
+        daycare_id = make_daycare()
+        group_id = make_group(daycare_id)
+        parent_id = make_parent(daycare_id, full_name="Parent")
+        kid_ids = []
+        for i in range(count):
+            adults = [GRANDMA]
+            if i % 2:
+                adults.append({"name": "Uncle Bob", "phone_num": "+1666"})
+            kid_ids += make_kids(
+                daycare_id,
+                group_id,
+                full_name=f"Kid {i}",
+                parent_ids=[parent_id],
+                trusted_adults=adults,
+            )
+        return daycare_id, parent_id, kid_ids
+
+    return _make_family
+
+
+def test_roster_loads_trusted_adults_in_one_select(
+    clean_db, make_family, count_queries
+):
+    daycare_id, parent_id, kid_ids = make_family(count=4)
+
+    with count_queries() as statements:
+        response = client.get(f"/api/v1/kids?daycare_id={daycare_id}")
+    assert response.status_code == 200
+    kids = {kid["id"]: kid for kid in response.json()}
+    assert [adult["name"] for adult in kids[kid_ids[1]]["trusted_adults"]] == [
+        "Grandma",
+        "Uncle Bob",
+    ]
+    assert kids[kid_ids[0]]["trusted_adults"] == [{**GRANDMA, "address": None}]
+    assert (
+        len([s for s in statements if "FROM trusted_adults" in s and "WHERE" in s]) == 1
+    )
+
+
+def test_update_replaces_trusted_adults(
+    clean_db, make_family, make_token, count_queries
+):
+    daycare_id, parent_id, kid_ids = make_family(count=2)
+    kid_id = kid_ids[1]
+    new_adults = [
+        {"name": "Aunt Sue", "phone_num": "+1777"},
+        {"name": "Grandma", "email": "grandma@example.com"},
+    ]
+    with count_queries() as statements:
+        response = client.patch(
+            f"/api/v1/kids/{kid_id}",
+            json={"trusted_adults": new_adults},
+            headers={"Authorization": f"Bearer {make_token(str(parent_id), 'parent')}"},
+        )
+    assert response.status_code == 200
+    assert [adult["name"] for adult in response.json()["trusted_adults"]] == [
+        "Aunt Sue",
+        "Grandma",
+    ]
+    # Old rows are deleted in one statement, new ones inserted in one
+    assert len([s for s in statements if s.startswith("DELETE FROM trusted")]) == 1
+    assert len([s for s in statements if s.startswith("INSERT INTO trusted")]) == 1
+
+    db = TestingSessionLocal()
+    try:
+        rows = (
+            db.query(TrustedAdult.name, TrustedAdult.position)
+            .filter(TrustedAdult.kid_id == kid_id)
+            .order_by(TrustedAdult.position)
+            .all()
+        )
+    finally:
+        db.close()
+    assert rows == [("Aunt Sue", 0), ("Grandma", 1)]
+
+
+def test_find_kids_by_trusted_adult(clean_db, make_family, make_token):
+    daycare_id, parent_id, kid_ids = make_family(count=3)
+    headers = {
+        "Authorization": f"Bearer {make_token('1', 'educator', daycare_id=daycare_id)}"
+    }
+    url = f"/api/v1/kids/by-trusted-adult?daycare_id={daycare_id}"
+
+    response = client.get(f"{url}&phone_num=%2B1666", headers=headers)
+    assert response.status_code == 200
+    assert [kid["id"] for kid in response.json()] == [kid_ids[1]]
+
+    response = client.get(f"{url}&email=grandma@example.com", headers=headers)
+    assert sorted(kid["id"] for kid in response.json()) == kid_ids
+
+    response = client.get(f"{url}&phone_num=%2B1999", headers=headers)
+    assert response.json() == []
+
+    assert client.get(url, headers=headers).status_code == 400
+
+    parent_token = make_token(str(parent_id), "parent", daycare_id=daycare_id)
+    response = client.get(
+        f"{url}&phone_num=%2B1666",
+        headers={"Authorization": f"Bearer {parent_token}"},
+    )
+    assert response.status_code == 403